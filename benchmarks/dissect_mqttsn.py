@@ -0,0 +1,101 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import argparse
+import contextlib
+import timeit
+from kamene.all import *
+from pynq_networking.lib.bindings import bind_mqttsn
+from pynq_networking.lib.mqttsn import *
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+""" Per-packet dissection cost of an MQTT-SN PUBLISH frame.
+
+    The frame is dissected with the type-to-class dict lookup, then with
+    the original dispatch: one `bind_layers` entry per message type,
+    scanned linearly by `Packet.guess_payload_class`.
+
+    Usage: python3 benchmarks/dissect_mqttsn.py [-n NUMBER]
+
+"""
+
+
+@contextlib.contextmanager
+def linear_dispatch():
+    """Temporarily restore the per-type bindings and the linear scan."""
+    MQTTSN.guess_payload_class = Packet.guess_payload_class
+    for cls in MQTTSN_PACKET_TYPES:
+        bind_layers(MQTTSN, cls, type=cls.type)
+    try:
+        yield
+    finally:
+        for cls in MQTTSN_PACKET_TYPES:
+            split_layers(MQTTSN, cls, type=cls.type)
+        del MQTTSN.guess_payload_class
+
+
+def frames():
+    """Build the frames to dissect, with the first and the last types."""
+    header = Ether() / IP(dst='192.168.1.1') / UDP(sport=1884, dport=1884)
+    return {
+        'PUBLISH': bytes(header / MQTTSN() / MQTTSN_PUBLISH(
+            qos=1, topicID=1, messageID=1, message=b'x' * 64)),
+        'WILLMSGRESP': bytes(header / MQTTSN() / MQTTSN_WILLMSGRESP()),
+    }
+
+
+def measure(frame, number):
+    """Return the dissection time of one frame in microseconds."""
+    seconds = min(timeit.repeat(lambda: Ether(frame), number=number,
+                                repeat=5))
+    return seconds / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Per-packet dissection cost of MQTT-SN frames.")
+    parser.add_argument('-n', '--number', type=int, default=2000,
+                        help="frames dissected per measurement")
+    args = parser.parse_args()
+    bind_mqttsn([1884])
+    print("{:<12} {:>12} {:>12}".format('type', 'dict (us)', 'linear (us)'))
+    for name, frame in frames().items():
+        after = measure(frame, args.number)
+        with linear_dispatch():
+            before = measure(frame, args.number)
+        print("{:<12} {:>12.1f} {:>12.1f}".format(name, after, before))
+
+
+if __name__ == '__main__':
+    main()
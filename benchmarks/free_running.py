@@ -0,0 +1,119 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import argparse
+import os
+import timeit
+from site import getsitepackages
+from pynq.lib.pmod import Pmod_TMP2
+from pynq_networking import MqttsnOverlay, LinkManager, Broker
+from pynq_networking.lib.network_iop import NetworkIOP
+from pynq_networking.lib.mqttsn_hw import MQTT_Client_PL
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+""" Publish rate of the accelerator, per event and free running.
+
+    Runs on the board with the mqttsn overlay, with the same network setup
+    as the networking acceleration notebook. The same number of events is
+    published with `publish_mmio()`, where Python starts every event, and
+    with `publish_free_running()`, where the accelerator restarts itself.
+    Both rates are printed next to the Ethernet line rate for the frame
+    size, counting the preamble, the FCS and the inter-frame gap.
+
+    Usage: python3 benchmarks/free_running.py [-n COUNT] [-s SIZE]
+
+"""
+
+SERVER_IP = "192.168.3.99"
+SERVER_PORT = 1884
+# preamble and start delimiter, FCS, inter-frame gap
+ETHERNET_OVERHEAD = 8 + 4 + 12
+
+
+def line_rate(size, link_mbps):
+    """Return the max number of frames per second on the link."""
+    return link_mbps * 1e6 / ((size + ETHERNET_OVERHEAD) * 8)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Publish rate of the accelerator against line rate.")
+    parser.add_argument('-n', '--count', type=int, default=100000,
+                        help="events published per run")
+    parser.add_argument('-s', '--size', type=int, default=100,
+                        help="size of the generated frames in bytes")
+    parser.add_argument('--link-mbps', type=float, default=1000,
+                        help="link speed in Mb/s")
+    args = parser.parse_args()
+
+    mqttsn_bit = os.path.join(getsitepackages()[0], 'pynq_networking',
+                              'overlays', 'mqttsn', 'mqttsn.bit')
+    overlay = MqttsnOverlay(mqttsn_bit)
+    overlay.download()
+    sensor = Pmod_TMP2(overlay.PMODB).microblaze
+    network = NetworkIOP()
+
+    links = LinkManager()
+    links.if_up("br0:1", SERVER_IP)
+    links.if_up("br0:0", "192.168.1.99")
+    links.kernel_up()
+    broker = Broker(ip_address=SERVER_IP, mqttsn_port=SERVER_PORT)
+    broker.open()
+    try:
+        with MQTT_Client_PL(SERVER_IP, SERVER_PORT, "client-hw") as client:
+            topic_id = client.register("temperature")
+            common = (args.size, args.count, client.local_mac_int,
+                      client.local_ip_int, client.server_ip_int,
+                      client.server_port, topic_id, 0, 0, network, sensor)
+            rates = {}
+            rates['line rate'] = line_rate(args.size, args.link_mbps)
+            result = client.accel.publish_free_running(*common)
+            rates['free running'] = result['events_per_second']
+            start = timeit.default_timer()
+            client.accel.publish_mmio(*common)
+            rates['per event'] = args.count / \
+                (timeit.default_timer() - start)
+    finally:
+        broker.close()
+        links.kernel_down()
+        links.if_down('br0:0')
+        links.if_down('br0:1')
+
+    for name, rate in rates.items():
+        print("{:<14} {:>12.0f} events/s {:>7.1%} of line rate".format(
+            name, rate, rate / rates['line rate']))
+
+
+if __name__ == '__main__':
+    main()
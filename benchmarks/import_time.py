@@ -0,0 +1,109 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import argparse
+import subprocess
+import sys
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+""" Import time of the package, with kamene imported lazily or eagerly.
+
+    Each measurement runs a fresh interpreter under `-X importtime` and 
+    adds up the cumulative time of the top-level imports. The lazy case 
+    imports the package alone; the eager case also imports the kamene-based
+    modules, as the package did before they were made lazy. The time spent
+    in kamene itself is reported separately.
+
+    Usage: python3 benchmarks/import_time.py [-n REPEAT] [-m MODULE]
+
+"""
+
+EAGER_MODULES = ['pynq_networking.lib.mqtt', 'pynq_networking.lib.mqttsn',
+                 'pynq_networking.lib.bindings']
+
+
+def import_times(modules):
+    """Return the total and kamene import times of a fresh interpreter.
+
+    Parameters
+    ----------
+    modules : list
+        Modules imported, in order.
+
+    Returns
+    -------
+    tuple
+        The cumulative import time of all the top-level imports and of the
+        top-level kamene imports, in milliseconds.
+
+    """
+    code = '; '.join('import ' + module for module in modules)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    total = kamene = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not cumulative.strip().isdigit() or name.startswith('  '):
+            continue
+        total += int(cumulative)
+        if name.strip().split('.')[0] == 'kamene':
+            kamene += int(cumulative)
+    return total / 1e3, kamene / 1e3
+
+
+def measure(modules, repeat):
+    """Return the fastest of `repeat` import time measurements."""
+    return min(import_times(modules) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import time of the package with lazy or eager kamene.")
+    parser.add_argument('-n', '--repeat', type=int, default=5,
+                        help="interpreters started per measurement")
+    parser.add_argument('-m', '--module', default='pynq_networking',
+                        help="package imported, e.g. pynq_networking.lib")
+    args = parser.parse_args()
+    if sys.version_info < (3, 7):
+        parser.error("-X importtime needs Python 3.7")
+    print("{:<8} {:>12} {:>12}".format('import', 'total (ms)', 'kamene (ms)'))
+    for name, modules in (('lazy', [args.module]),
+                          ('eager', [args.module] + EAGER_MODULES)):
+        total, kamene = measure(modules, args.repeat)
+        print("{:<8} {:>12.1f} {:>12.1f}".format(name, total, kamene))
+
+
+if __name__ == '__main__':
+    main()
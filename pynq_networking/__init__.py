@@ -28,11 +28,32 @@
 #   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from .lib import *
+import sys
+from . import lib
+from .lib import Broker
+from .lib import get_ip_string, get_mac_string
+from .lib import ip_str_to_int, mac_str_to_int, int_2_ip_str
+from .lib import MQTTSNGateway, TopicRouter, ShardedClient
+from .lib import BrokerConfig, BrokerLogMonitor
 from .overlays.mqttsn import MqttsnOverlay
 from .kernel_module import LinkManager
 
 
+__all__ = lib.__all__ + ['MqttsnOverlay', 'LinkManager']
+
+
+def __getattr__(name):
+    """Defer the kamene-based names to `lib`, which imports them lazily."""
+    if name in lib.__all__:
+        return getattr(lib, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
+if sys.version_info < (3, 7):
+    globals().update((name, getattr(lib, name)) for name in lib.__all__)
+
+
 __author__ = "Yun Rock Qu"
 __copyright__ = "Copyright 2017, Xilinx"
 __email__ = "yunq@xilinx.com"
@@ -28,11 +28,82 @@
 #   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+import importlib
+import sys
 from .broker import Broker
 from .broker import get_ip_string, get_mac_string
 from .broker import ip_str_to_int, mac_str_to_int, int_2_ip_str
-from .mqtt import *
-from .mqttsn import *
+from .gateway import MQTTSNGateway
+from .router import TopicRouter, ShardedClient
+from .broker_config import BrokerConfig
+from .broker_log import BrokerLogMonitor
+from .dissect_cache import DissectionCache
+from .segmentation import SegmentingPublisher, Reassembler, segment_message
+
+"""The kamene-based modules are imported lazily.
+
+Importing kamene takes seconds on the board, so the dissectors and the 
+binding registry are only imported the first time one of their names is 
+used. `from pynq_networking.lib import *` still imports them. Module 
+`__getattr__` needs Python 3.7, so they are imported eagerly on Python 3.6.
+
+"""
+
+_LAZY_NAMES = {
+    '.mqtt': (
+        'MQTTBasePacket', 'MQTT_CONNECT', 'MQTT_CONNACK', 'MQTT_PUBLISH',
+        'MQTT_PUBACK', 'MQTT_PUBREC', 'MQTT_PUBREL', 'MQTT_PUBCOMP',
+        'MQTT_SUBSCRIBE', 'MQTT_SUBSCRIBE_TOPIC', 'MQTT_SUBACK',
+        'MQTT_SUBACK_TOPIC', 'MQTT_UNSUBSCRIBE', 'MQTT_UNSUBSCRIBE_TOPIC',
+        'MQTT_UNSUBACK', 'MQTT_PINGREQ', 'MQTT_PINGRESP', 'MQTT_DISCONNECT',
+        'MQTT_PACKET_TYPES', 'MQTT_PAYLOAD_CLASSES', 'MQTTLenField',
+        'MQTTTypeField', 'MQTT', 'MQTT_Stream'),
+    '.mqttsn': (
+        'MQTTSN_FLAGS', 'MQTTSN_ADVERTISE', 'MQTTSN_SEARCHGW',
+        'MQTTSN_GWINFO', 'MQTTSN_CONNECT', 'MQTTSN_CONNACK',
+        'MQTTSN_WILLTOPICREQ', 'MQTTSN_WILLTOPIC', 'MQTTSN_WILLMSGREQ',
+        'MQTTSN_WILLMSG', 'MQTTSN_REGISTER', 'MQTTSN_REGACK',
+        'MQTTSN_PUBLISH', 'MQTTSN_PUBACK', 'MQTTSN_PUBCOMP', 'MQTTSN_PUBREC',
+        'MQTTSN_PUBREL', 'MQTTSN_SUBSCRIBE', 'MQTTSN_SUBACK',
+        'MQTTSN_UNSUBSCRIBE', 'MQTTSN_UNSUBACK', 'MQTTSN_PINGREQ',
+        'MQTTSN_PINGRESP', 'MQTTSN_DISCONNECT', 'MQTTSN_WILLTOPICUPD',
+        'MQTTSN_WILLTOPICRESP', 'MQTTSN_WILLMSGUPD', 'MQTTSN_WILLMSGRESP',
+        'MQTTSN_PACKET_TYPES', 'MQTTSN_PAYLOAD_CLASSES', 'MQTTSN_LenField',
+        'MQTTSN_TypeField', 'MQTTSN'),
+    '.bindings': (
+        'bind_mqtt', 'bind_mqttsn', 'unbind_ports', 'unbind_all'),
+    '.sampling': (
+        'SensorSampler', 'BatchPublisher', 'encode_block'),
+}
+_LAZY_MODULES = {name: module for module, names in _LAZY_NAMES.items()
+                 for name in names}
+
+__all__ = ['Broker', 'get_ip_string', 'get_mac_string', 'ip_str_to_int',
+           'mac_str_to_int', 'int_2_ip_str', 'MQTTSNGateway', 'TopicRouter',
+           'ShardedClient', 'BrokerConfig', 'BrokerLogMonitor',
+           'DissectionCache', 'SegmentingPublisher', 'Reassembler',
+           'segment_message'] + \
+    list(_LAZY_MODULES)
+
+
+def __getattr__(name):
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
+
+
+if sys.version_info < (3, 7):
+    for _name in _LAZY_MODULES:
+        __getattr__(_name)
+
 
 """The following imports are not included.
  
@@ -29,18 +29,21 @@
 
 
 import os
+import contextlib
+import functools
 import subprocess
 import struct
+import time
+from concurrent.futures import CancelledError
 from site import getsitepackages
-from cffi import FFI
 from uuid import getnode
 from socket import inet_aton
-import logging
-logging.getLogger("kamene.runtime").setLevel(logging.ERROR)
-from kamene.all import *
 from wurlitzer import sys_pipes
-from pynq import PL, MMIO
+from pynq import PL
 from .broker import ip_str_to_int, mac_str_to_int
+from .uio import UioInterrupt
+from .accelerator_registers import AcceleratorRegisters
+from .arbiter import ACCELERATOR, get_arbiter
 
 
 __author__ = "Yun Rock Qu"
@@ -48,29 +51,65 @@ __copyright__ = "Copyright 2017, Xilinx"
 __email__ = "yunq@xilinx.com"
 
 
-CFFI_INTERFACE = """
-void init_ethernet_raw(const char *interface, uint16_t myPort);
-float read_sensor(volatile char * sensor);
-void Top(int size, int count,
-         unsigned long long macAddress,
-         unsigned int ipAddress,
-         unsigned int destIP,
-         int destPort,
-         unsigned short topicID,
-         int qos,
-         bool verbose,         
-         volatile char * networkIOP,
-         volatile char * sensor);
-void sds_mmap(int phys, int length, void *virtual);
-void *sds_alloc(size_t size);
-"""
-
 PYNQ_NETWORKING_PATH = os.path.join(getsitepackages()[0], 'pynq_networking')
 MQTTSN_OVERLAY_PATH = os.path.join(PYNQ_NETWORKING_PATH, 'overlays','mqttsn')
 
 BITFILE = os.path.join(MQTTSN_OVERLAY_PATH, 'mqttsn.bit')
 SHARED_LIB = os.path.join(MQTTSN_OVERLAY_PATH, 'lib_mqttsn.so')
 
+_ffi_handle = None
+
+
+@contextlib.contextmanager
+def _no_capture():
+    # contextlib.nullcontext needs Python 3.7
+    yield
+
+
+def load_ffi():
+    """Return the FFI object and library handle of `lib_mqttsn.so`.
+
+    The API-mode module built at install time is preferred; if it is not
+    available, the prototypes are parsed and the library is opened in ABI
+    mode instead. Either way this is done only once per process.
+
+    Returns
+    -------
+    tuple
+        The `(ffi, lib)` pair shared by all the accelerator objects.
+
+    """
+    global _ffi_handle
+    if _ffi_handle is None:
+        try:
+            from ._mqttsn_ffi import ffi, lib
+        except ImportError:
+            from cffi import FFI
+            from .build_mqttsn_ffi import CFFI_INTERFACE
+            ffi = FFI()
+            ffi.cdef(CFFI_INTERFACE)
+            lib = ffi.dlopen(SHARED_LIB)
+        _ffi_handle = (ffi, lib)
+    return _ffi_handle
+
+
+def _owns_network_iop(method):
+    """Run the method with the accelerator owning the network IOP."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.arbiter.owned(ACCELERATOR):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+AP_START = 0x1
+AP_DONE = 0x2
+AP_IDLE = 0x4
+AP_READY = 0x8
+AUTO_RESTART = 0x80
+INTERRUPT_AP_DONE = 0x1
+INTERRUPT_AP_READY = 0x2
+
 
 class Accelerator:
     """Accelerator for constructing MQTTSN packets.
@@ -174,47 +213,160 @@ SC = Self Clear, COR = Clear on Read, TOW = Toggle on Write, COH = Clear on Hand
 
     Attributes
     ----------
-    interface_string : str
-        The FFI interface description of the overlay 
-        (containing c-like prototypes)
     ffi : FFI
         The FFI object used by the overlay.
     dll_name : str
         This overlay assumes the dll filename is derived from bitfile name.
+    dll : lib
+        The cached handle of the shared library.
+    verbose : bool
+        If True, the stdout of the shared library is captured into Python.
+    irq : UioInterrupt
+        The UIO device of the accelerator interrupt, `None` to poll.
+    registers : AcceleratorRegisters
+        The cached register map of the accelerator.
+    arbiter : IOPArbiter
+        The arbiter of the network IOP, owned by the accelerator during 
+        every publish run.
 
     """
-    def __init__(self):
+    def __init__(self, verbose=False):
         if PL.bitfile_name != BITFILE:
             raise ValueError("mqttsn_publish.bit must be loaded.")
 
-        self.interface_string = CFFI_INTERFACE
-        self.ffi = FFI()
         self.dll_name = SHARED_LIB
-        self.dll = None
-        self.sensor_ptr = None
+        self.verbose = verbose
+        self.irq = None
+        self.registers = AcceleratorRegisters()
+        self.arbiter = get_arbiter()
+        self._mapped = {}
+        with self._capture():
+            self.ffi, self.dll = load_ffi()
+
+    def _capture(self, verbose=None):
+        # the pipe reader threads of sys_pipes are only worth it when
+        # the C code is expected to print something
+        if verbose is None:
+            verbose = self.verbose
+        return sys_pipes() if verbose else _no_capture()
+
+    def enable_interrupts(self, uio, mmio=None):
+        """Arm the ap_done and ap_ready interrupts of the accelerator.
+
+        Once armed, the accelerator completion is waited on through the UIO 
+        file descriptor instead of spinning on the control register.
+
+        Parameters
+        ----------
+        uio : str/UioInterrupt
+            The UIO device path or name, or an object with the same 
+            interface, such as `SimulatedUio`.
+        mmio : MMIO
+            The MMIO of the accelerator registers.
+
+        """
+        if mmio is None:
+            mmio = self.registers.mmio
+        self.irq = UioInterrupt(uio) if isinstance(uio, str) else uio
+        mmio.write(0x08, INTERRUPT_AP_DONE | INTERRUPT_AP_READY)
+        mmio.write(0x04, 1)
+
+    def disable_interrupts(self, mmio=None):
+        """Disarm the interrupts and go back to polling."""
+        if mmio is None:
+            mmio = self.registers.mmio
+        mmio.write(0x04, 0)
+        mmio.write(0x08, 0)
+        if self.irq is not None:
+            self.irq.close()
+            self.irq = None
+
+    def _clear_interrupts(self, mmio):
+        # the status register is toggle-on-write
+        status = mmio.read(0x0c)
+        if status:
+            mmio.write(0x0c, status)
+
+    def wait_status(self, mmio, mask, timeout=None):
+        """Block until any of the given control register bits is set.
+
+        Parameters
+        ----------
+        mmio : MMIO
+            The MMIO of the accelerator registers.
+        mask : int
+            The control register bits to wait for, e.g. `AP_IDLE`.
+        timeout : float
+            Max number of seconds to wait for each interrupt.
+
+        Returns
+        -------
+        int
+            The value of the control register.
 
-        self.ffi.cdef(self.interface_string)
-        with sys_pipes():
-            self.dll = self.ffi.dlopen(self.dll_name)
+        """
+        status = mmio.read(0x0)
+        if self.irq is None:
+            while status & mask == 0:
+                status = mmio.read(0x0)
+            return status
+        while status & mask == 0:
+            self._clear_interrupts(mmio)
+            status = mmio.read(0x0)
+            if status & mask:
+                break
+            if not self.irq.wait(timeout):
+                raise TimeoutError("Accelerator did not complete.")
+            status = mmio.read(0x0)
+        return status
+
+    async def wait_status_async(self, mmio, mask):
+        """Awaitable version of `wait_status()`.
+
+        Interrupts must be enabled, so the event loop is never blocked.
+
+        """
+        if self.irq is None:
+            raise RuntimeError("Interrupts are not enabled.")
+        status = mmio.read(0x0)
+        while status & mask == 0:
+            self._clear_interrupts(mmio)
+            status = mmio.read(0x0)
+            if status & mask:
+                break
+            await self.irq.wait_async()
+            status = mmio.read(0x0)
+        return status
 
     def read_sensor(self, sensor_iop):
-        """Read the value of a temperature sensor. """
-        if self.sensor_ptr is None:
-            self.sensor_ptr = self.map(sensor_iop.mmio)
-        return self.dll.read_sensor(self.sensor_ptr)
+        """Read the value of a temperature sensor.
+
+        Several sensors can be read; each one is mapped on its first read.
+
+        """
+        return self.dll.read_sensor(self.map(sensor_iop.mmio))
 
     def init_ethernet_raw(self, interface, port=1884):
         """Initialize the Ethernet raw interface. """
-        with sys_pipes():
+        with self._capture():
             self.dll.init_ethernet_raw(interface.encode('utf-8'), port)
 
     def map(self, mmio):
-        """Map the given mmio interface in a way that SDSoC can use."""
-        virtaddr = self.ffi.from_buffer(mmio.mem)
-        self.dll.sds_mmap(mmio.base_addr + mmio.virt_offset, mmio.length,
-                          virtaddr)
+        """Map the given mmio interface in a way that SDSoC can use.
+
+        Each physical range is only mapped once per accelerator object.
+
+        """
+        phys = mmio.base_addr + mmio.virt_offset
+        key = (phys, mmio.length)
+        virtaddr = self._mapped.get(key)
+        if virtaddr is None:
+            virtaddr = self.ffi.from_buffer(mmio.mem)
+            self.dll.sds_mmap(phys, mmio.length, virtaddr)
+            self._mapped[key] = virtaddr
         return virtaddr
 
+    @_owns_network_iop
     def publish_cffi(self, size, count, pl_mac_address, pl_ip_address,
                      server_ip_address, server_port_number,
                      topic_id, qos, verbose, net_iop, sensor_iop):
@@ -247,6 +399,12 @@ SC = Self Clear, COR = Clear on Read, TOW = Toggle on Write, COH = Clear on Hand
         sensor_iop : Pmod_TMP2
             The temperature sensor object.
 
+        Returns
+        -------
+        dict
+            The elapsed time in seconds and the resulting events per second,
+            to compare with the `publish_mmio()` path.
+
         """
         pl_ip = pl_ip_address if type(pl_ip_address) is int \
             else ip_str_to_int(pl_ip_address)
@@ -258,20 +416,99 @@ SC = Self Clear, COR = Clear on Read, TOW = Toggle on Write, COH = Clear on Hand
         mac_address_arg = self.ffi.cast("unsigned long long", pl_mac)
         ip_address_arg = self.ffi.cast("unsigned int", pl_ip)
         server_ip_arg = self.ffi.cast("unsigned int", server_ip)
-        with sys_pipes():
-            net_iop_ptr = self.map(net_iop.mmio)
-            sensor_iop_ptr = self.map(sensor_iop.mmio)
-            ol.dll.Top(size, count, mac_address_arg, ip_address_arg,
-                       server_ip_arg, server_port_number,
-                       topic_id, qos, verbose,
-                       net_iop_ptr, sensor_iop_ptr)
+        net_iop_ptr = self.map(net_iop.mmio)
+        sensor_iop_ptr = self.map(sensor_iop.mmio)
+        with self._capture(bool(verbose)):
+            start = time.perf_counter()
+            self.dll.Top(size, count, mac_address_arg, ip_address_arg,
+                         server_ip_arg, server_port_number,
+                         topic_id, qos, bool(verbose),
+                         net_iop_ptr, sensor_iop_ptr)
+            elapsed = time.perf_counter() - start
+        return {'elapsed': elapsed,
+                'events_per_second': count / elapsed}
+
+    def _start_run(self, size, count, pl_mac_address, pl_ip_address,
+                   server_ip_address, server_port_number,
+                   topic_id, qos, verbose, net_iop, sensor_iop):
+        """Configure the accelerator and take it out of reset."""
+        pl_ip = pl_ip_address if type(pl_ip_address) is int \
+            else ip_str_to_int(pl_ip_address)
+        pl_mac = pl_mac_address if type(pl_mac_address) is int \
+            else mac_str_to_int(pl_mac_address)
+        server_ip = server_ip_address if type(server_ip_address) is int \
+            else ip_str_to_int(server_ip_address)
+
+        _ = self.map(net_iop.mmio)
+        net_iop_phys = net_iop.mmio.base_addr + net_iop.mmio.virt_offset
+        _ = self.map(sensor_iop.mmio)
+
+        # only the registers changed since the last run are written
+        registers = self.registers
+        acc_mmio = registers.mmio
+        registers.configure(b=1, mac_address=pl_mac, ip_address=pl_ip, i=1,
+                            dest_ip=server_ip, dest_port=server_port_number,
+                            topic_id=topic_id, qos=qos, message=0x0,
+                            valid_message=1, network_iop=net_iop_phys,
+                            count=count, size=size, reset=1,
+                            verbose=verbose)
+
+        # execute the accelerator once to reset things
+        acc_mmio.write(0x0, 1)
+        self.wait_status(acc_mmio, AP_DONE)
+
+        # deassert reset
+        registers.write(0x7c, 0)  # reset
+
+    def _run_events(self, target, i, events_completed, total,
+                    progress=None, cancel=None, verbose=False):
+        """Start events until `events_completed` reaches `target`.
+
+        With `verbose` set, the counters are printed every 1000 calls.
+
+        Returns
+        -------
+        tuple
+            The number of calls made so far and the events completed.
 
+        """
+        registers = self.registers
+        acc_mmio = registers.mmio
+        while events_completed < target:
+            if cancel is not None and cancel.is_set():
+                self.abort()
+                raise CancelledError("Accelerator run cancelled after "
+                                     "{} events.".format(events_completed))
+            status = self.wait_status(acc_mmio, AP_IDLE)
+            # let queued software frames through between two events
+            self.arbiter.drain(ACCELERATOR, 1)
+            # set our inputs and start
+            registers.write(0x2c, i)
+            # valid message
+            registers.write(0x5c, i % 2)
+            # start
+            acc_mmio.write(0x0, 1)
+            i = i + 1
+            completed = acc_mmio.read(0x8c)
+            if progress is not None and completed != events_completed:
+                progress(completed, total)
+            events_completed = completed
+            if verbose and i % 1000 == 0:
+                print("status", status)
+                print("events_completed:", events_completed)
+                print("PublishesSent:", acc_mmio.read(0x94))
+        return i, events_completed
+
+    @_owns_network_iop
     def publish_mmio(self, size, count, pl_mac_address, pl_ip_address,
                      server_ip_address, server_port_number,
-                     topic_id, qos, verbose, net_iop, sensor_iop):
+                     topic_id, qos, verbose, net_iop, sensor_iop,
+                     progress=None, cancel=None):
         """Publish data from the given temperature sensor to an MQTTSN server.
 
-        This method will use the MMIO to control the accelerator.
+        This method will use the MMIO to control the accelerator. The
+        network IOP is owned by the accelerator for the whole run; software
+        frames queued by the arbiter are sent between two events.
 
         Parameters
         ----------
@@ -297,68 +534,167 @@ SC = Self Clear, COR = Clear on Read, TOW = Toggle on Write, COH = Clear on Hand
             The network IOP object.
         sensor_iop : Pmod_TMP2
             The temperature sensor object.
+        progress : function
+            Called as `progress(events_completed, count)` whenever the 
+            number of completed events changes.
+        cancel : threading.Event
+            When set, the run is aborted through the reset register and 
+            `CancelledError` is raised.
+
+        Returns
+        -------
+        dict
+            The final values of the accelerator counters.
 
         """
-        pl_ip = pl_ip_address if type(pl_ip_address) is int \
-            else ip_str_to_int(pl_ip_address)
-        pl_mac = pl_mac_address if type(pl_mac_address) is int \
-            else mac_str_to_int(pl_mac_address)
-        server_ip = server_ip_address if type(server_ip_address) is int \
-            else ip_str_to_int(server_ip_address)
-
-        _ = self.map(net_iop.mmio)
-        net_iop_phys = net_iop.mmio.base_addr + net_iop.mmio.virt_offset
-        _ = self.map(sensor_iop.mmio)
+        self._start_run(size, count, pl_mac_address, pl_ip_address,
+                        server_ip_address, server_port_number,
+                        topic_id, qos, verbose, net_iop, sensor_iop)
+        registers = self.registers
+        acc_mmio = registers.mmio
 
-        acc_mmio = MMIO(0x83c00000, 0x10000)
-        acc_mmio.write(0x10, 1)
-        acc_mmio.write(0x18, pl_mac & 0xFFFFFFFF)
-        acc_mmio.write(0x1c, pl_mac >> 32)
-        acc_mmio.write(0x24, pl_ip)
-        acc_mmio.write(0x2c, 1)
-        acc_mmio.write(0x34, server_ip)
-        acc_mmio.write(0x3c, server_port_number)
-        acc_mmio.write(0x44, topic_id)
-        acc_mmio.write(0x4c, qos)
-        acc_mmio.write(0x54, 0x0)
-        acc_mmio.write(0x5c, 1)
-        acc_mmio.write(0x64, net_iop_phys)
-        acc_mmio.write(0x6c, count)
-        acc_mmio.write(0x74, size)
-        acc_mmio.write(0x7c, 1)
-        acc_mmio.write(0x84, verbose)  # verbose
-
-        # execute the accelerator once to reset things
-        acc_mmio.write(0x0, 1)
-        status = acc_mmio.read(0x0)
-        while status & 0x2 == 0:
-            status = acc_mmio.read(0x0)
+        # wait for the events to complete
+        i, events_completed = self._run_events(count, 0, 0, count,
+                                               progress, cancel, verbose)
+
+        counters = {'events_completed': events_completed,
+                    'publishes_sent': acc_mmio.read(0x94),
+                    'packets_received': acc_mmio.read(0x9c),
+                    'packets_sent': acc_mmio.read(0xa4)}
+        if verbose:
+            print("calls", i)
+            for name, value in counters.items():
+                print(name + ":", value)
+        return counters
+
+    @_owns_network_iop
+    def publish_batch(self, jobs, size, pl_mac_address, pl_ip_address,
+                      server_ip_address, server_port_number, verbose,
+                      net_iop, sensor_iop, progress=None, cancel=None):
+        """Publish several topics in a single accelerator run.
+
+        The accelerator is configured and taken out of reset once, for the
+        total number of events. Between two jobs, it is left idle while only
+        the topic ID and qos registers are reprogrammed, and only if their
+        values change.
+
+        The other parameters are the same as for `publish_mmio()`.
 
-        # deassert reset
-        acc_mmio.write(0x7c, 0)  # reset
+        Parameters
+        ----------
+        jobs : list
+            The `(topic_id, qos, count)` tuple of each job, in order.
+        progress : function
+            Called as `progress(events_completed, total)` whenever the 
+            number of completed events of the whole batch changes.
+
+        Returns
+        -------
+        list
+            For each job, a dict with its `topic_id`, `qos` and the number
+            of `events_completed` while it was programmed.
 
-        # wait for the events to complete
-        events_completed = 0
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        total = sum(count for _, _, count in jobs)
+        topic_id, qos, _ = jobs[0]
+        self._start_run(size, total, pl_mac_address, pl_ip_address,
+                        server_ip_address, server_port_number,
+                        topic_id, qos, verbose, net_iop, sensor_iop)
+        registers = self.registers
+        acc_mmio = registers.mmio
+
+        results = []
         i = 0
-        while events_completed < count:
-            status = acc_mmio.read(0x0)
-            while status & 0x4 == 0:
-                status = acc_mmio.read(0x0)
-            # set our inputs and start
-            acc_mmio.write(0x2c, i)
-            # valid message
-            acc_mmio.write(0x5c, i % 2)
-            # start
-            acc_mmio.write(0x0, 1)
-            i = i + 1
+        target = 0
+        events_completed = 0
+        for topic_id, qos, count in jobs:
+            # reprogram between two events only
+            self.wait_status(acc_mmio, AP_IDLE)
             events_completed = acc_mmio.read(0x8c)
-            if i % 1000 == 0:
-                print("status", status)
-                print("events_completed:", events_completed)
-                print("PublishesSent:", acc_mmio.read(0x94))
+            if results:
+                results[-1]['events_completed'] = \
+                    events_completed - results[-1]['events_completed']
+            registers.configure(topic_id=topic_id, qos=qos)
+            results.append({'topic_id': topic_id, 'qos': qos,
+                            'events_completed': events_completed})
+            target += count
+            i, events_completed = self._run_events(
+                target, i, events_completed, total, progress, cancel,
+                verbose)
+
+        self.wait_status(acc_mmio, AP_IDLE)
+        results[-1]['events_completed'] = \
+            acc_mmio.read(0x8c) - results[-1]['events_completed']
+        return results
+
+    @_owns_network_iop
+    def publish_free_running(self, size, count, pl_mac_address,
+                             pl_ip_address, server_ip_address,
+                             server_port_number, topic_id, qos, verbose,
+                             net_iop, sensor_iop, poll_interval=0.001):
+        """Publish data with the accelerator restarting itself.
+
+        Unlike `publish_mmio()`, Python does not start every event: the 
+        accelerator is configured once, `auto_restart` is set, and the 
+        counters are only sampled until `count` events have completed. The
+        `i` and `validMessage` inputs therefore stay fixed for the whole run,
+        and software frames are only sent once the run is over.
+
+        The parameters are the same as for `publish_mmio()`.
 
-        print("calls", i)
-        print("events_completed:", events_completed)
-        print("PublishesSent:", acc_mmio.read(0x94))
-        print("PacketsReceived:", acc_mmio.read(0x9c))
-        print("PacketsSent:", acc_mmio.read(0xa4))
+        Parameters
+        ----------
+        poll_interval : float
+            Number of seconds between two reads of `events_completed`.
+
+        Returns
+        -------
+        dict
+            The final values of the accelerator counters, plus the elapsed
+            time in seconds and the resulting events per second.
+
+        """
+        self._start_run(size, count, pl_mac_address, pl_ip_address,
+                        server_ip_address, server_port_number,
+                        topic_id, qos, verbose, net_iop, sensor_iop)
+        registers = self.registers
+        acc_mmio = registers.mmio
+        registers.write(0x2c, 0)
+        registers.write(0x5c, 1)
+
+        self.wait_status(acc_mmio, AP_IDLE)
+        start = time.perf_counter()
+        acc_mmio.write(0x0, AUTO_RESTART | AP_START)
+        events_completed = acc_mmio.read(0x8c)
+        try:
+            while events_completed < count:
+                time.sleep(poll_interval)
+                events_completed = acc_mmio.read(0x8c)
+        finally:
+            # let the current event finish, then stop restarting
+            acc_mmio.write(0x0, 0)
+            self.wait_status(acc_mmio, AP_IDLE)
+        elapsed = time.perf_counter() - start
+        events_completed = acc_mmio.read(0x8c)
+        return {'events_completed': events_completed,
+                'publishes_sent': acc_mmio.read(0x94),
+                'packets_received': acc_mmio.read(0x9c),
+                'packets_sent': acc_mmio.read(0xa4),
+                'elapsed': elapsed,
+                'events_per_second': events_completed / elapsed}
+
+    def abort(self):
+        """Put the accelerator back in reset, stopping any publish run.
+
+        The reset register is asserted and the accelerator is run once so it
+        takes effect; it stays in reset until the next run deasserts it.
+
+        """
+        registers = self.registers
+        self.wait_status(registers.mmio, AP_IDLE)
+        registers.write(0x7c, 1)
+        registers.write(0x0, 1)
+        self.wait_status(registers.mmio, AP_DONE)
@@ -0,0 +1,191 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import queue
+import threading
+from concurrent.futures import Future, CancelledError
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def job_cancelled(future):
+    """Return True if the job of a done future has been cancelled.
+
+    `Future.cancel()` cannot cancel a running job, so a job stopped by 
+    `AcceleratorJobQueue.cancel()` while running ends with a 
+    `CancelledError` exception instead, and `future.cancelled()` is False.
+    In both cases `future.result()` raises `CancelledError`.
+
+    """
+    return future.cancelled() or \
+        isinstance(future.exception(), CancelledError)
+
+
+class _Job:
+    __slots__ = ('future', 'args', 'progress', 'cancel')
+
+    def __init__(self, args, progress):
+        self.future = Future()
+        self.args = args
+        self.progress = progress
+        self.cancel = threading.Event()
+
+
+class AcceleratorJobQueue:
+    """Run accelerator publish jobs on a dedicated worker thread.
+
+    `submit()` queues a publish run and returns immediately with a 
+    `concurrent.futures.Future`, so the caller can keep doing software work
+    while the PL publishes. Jobs run one at a time, in submission order.
+
+    Attributes
+    ----------
+    accelerator : Accelerator
+        The accelerator running the jobs.
+
+    """
+    def __init__(self, accelerator):
+        """Start the worker thread.
+
+        Parameters
+        ----------
+        accelerator : Accelerator
+            The accelerator running the jobs.
+
+        """
+        self.accelerator = accelerator
+        self._queue = queue.Queue()
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="accelerator-jobs")
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.shutdown()
+
+    def submit(self, size, count, pl_mac_address, pl_ip_address,
+               server_ip_address, server_port_number, topic_id, qos,
+               verbose, net_iop, sensor_iop, progress=None):
+        """Queue a publish run.
+
+        The parameters are the same as for `Accelerator.publish_mmio()`.
+
+        Parameters
+        ----------
+        progress : function
+            Called as `progress(events_completed, count)` from the worker 
+            thread whenever the number of completed events changes.
+
+        Returns
+        -------
+        Future
+            Resolves to the final accelerator counters of the run.
+
+        """
+        job = _Job((size, count, pl_mac_address, pl_ip_address,
+                    server_ip_address, server_port_number, topic_id, qos,
+                    verbose, net_iop, sensor_iop), progress)
+        with self._lock:
+            self._jobs[job.future] = job
+        self._queue.put(job)
+        return job.future
+
+    def pending(self):
+        """Return the number of jobs waiting to run."""
+        return self._queue.qsize()
+
+    def cancel(self, future):
+        """Cancel a pending or running job.
+
+        A pending job is dropped from the queue; a running job is stopped 
+        through the accelerator reset register, and its future ends with a
+        `CancelledError` exception; see `job_cancelled()`.
+
+        Returns
+        -------
+        bool
+            True if the job will not complete.
+
+        """
+        if future.cancel():
+            return True
+        with self._lock:
+            job = self._jobs.get(future)
+        if job is None:
+            return False
+        job.cancel.set()
+        return True
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = self.accelerator.publish_mmio(
+                        *job.args, progress=job.progress, cancel=job.cancel)
+                except CancelledError:
+                    job.future.set_exception(CancelledError())
+                except BaseException as err:
+                    job.future.set_exception(err)
+                else:
+                    job.future.set_result(result)
+            finally:
+                with self._lock:
+                    self._jobs.pop(job.future, None)
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """Stop the worker thread once the queued jobs are done.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to block until the worker thread exits.
+        cancel_pending : bool
+            Whether to cancel the jobs not started yet.
+
+        """
+        if cancel_pending:
+            with self._lock:
+                futures = list(self._jobs)
+            for future in futures:
+                future.cancel()
+        self._queue.put(None)
+        if wait:
+            self._thread.join()
@@ -0,0 +1,231 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from pynq import PL, MMIO
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+ACCELERATOR_IP_NAME = 'read_and_process_packet_1'
+ACCELERATOR_VLNV = 'xilinx.com:hls:read_and_process_packet'
+ACCELERATOR_BASE_ADDR = 0x83c00000
+ACCELERATOR_ADDR_RANGE = 0x10000
+
+CONTROL_REGISTERS = {
+    'ap_ctrl': 0x00,
+    'global_interrupt_enable': 0x04,
+    'interrupt_enable': 0x08,
+    'interrupt_status': 0x0c,
+}
+
+CONFIG_REGISTERS = {
+    'b': 0x10,
+    'mac_address_low': 0x18,
+    'mac_address_high': 0x1c,
+    'ip_address': 0x24,
+    'i': 0x2c,
+    'dest_ip': 0x34,
+    'dest_port': 0x3c,
+    'topic_id': 0x44,
+    'qos': 0x4c,
+    'message': 0x54,
+    'valid_message': 0x5c,
+    'network_iop': 0x64,
+    'count': 0x6c,
+    'size': 0x74,
+    'reset': 0x7c,
+    'verbose': 0x84,
+}
+
+_CONFIG_OFFSETS = frozenset(CONFIG_REGISTERS.values())
+
+COUNTER_REGISTERS = {
+    'events_completed': 0x8c,
+    'publishes_sent': 0x94,
+    'packets_received': 0x9c,
+    'packets_sent': 0xa4,
+}
+
+
+def _register_property(name, offset):
+    def getter(self):
+        return self.read(offset)
+
+    def setter(self, value):
+        self.configure(**{name: value})
+
+    return property(getter, setter, doc="Register {} at 0x{:02x}.".format(
+        name, offset))
+
+
+def _counter_property(name, offset):
+    def getter(self):
+        return self.read(offset)
+
+    return property(getter, doc="Counter {} at 0x{:02x}.".format(
+        name, offset))
+
+
+class AcceleratorRegisters:
+    """Register map of the MQTT-SN accelerator.
+
+    The base address is resolved from `PL.ip_dict` once, falling back to 
+    `ACCELERATOR_BASE_ADDR` where SDSoC places the accelerator outside the
+    block design of the shipped overlays, and the MMIO is shared by all the
+    instances, in the same way as `NetworkIOP`. Every configuration register
+    written is kept in a shadow copy, so writing the same value again costs
+    nothing; the shadow is dropped when a new bitstream is downloaded.
+
+    Each register of the documented map is also available as an attribute,
+    for example `registers.topic_id = 3` or `registers.publishes_sent`.
+    Each counter register at offset `x` has its valid bit at `x + 4`.
+
+    Attributes
+    ----------
+    mmio : MMIO
+        The MMIO of the accelerator registers.
+    shadow : dict
+        The last value written to each configuration register.
+
+    """
+    mmio = None
+    shadow = {}
+    _bitstream = None
+
+    def __init__(self, ip_name=None, base_addr=None,
+                 addr_range=ACCELERATOR_ADDR_RANGE):
+        """Map the accelerator registers, unless already mapped.
+
+        Parameters
+        ----------
+        ip_name : str
+            Name of the accelerator in the IP dictionary. If `None`, the 
+            entry named `ACCELERATOR_IP_NAME` is used, or else the entry
+            whose VLNV matches `ACCELERATOR_VLNV` in any version, or else
+            `ACCELERATOR_BASE_ADDR`.
+        base_addr : int
+            Physical address of the registers, bypassing the IP dictionary.
+        addr_range : int
+            Size of the register space at `base_addr`.
+
+        """
+        bitstream = (PL.bitfile_name, getattr(PL, 'timestamp', None))
+        if AcceleratorRegisters.mmio is None or \
+                AcceleratorRegisters._bitstream != bitstream or \
+                (base_addr is not None and
+                 AcceleratorRegisters.mmio.base_addr != base_addr):
+            if base_addr is None:
+                base_addr, addr_range = self._resolve(ip_name)
+            AcceleratorRegisters.mmio = MMIO(base_addr, addr_range)
+            AcceleratorRegisters.shadow = {}
+            AcceleratorRegisters._bitstream = bitstream
+        self.base_addr = AcceleratorRegisters.mmio.base_addr
+
+    @staticmethod
+    def _resolve(ip_name):
+        ip_dict = PL.ip_dict
+        if ip_name is None and ACCELERATOR_IP_NAME in ip_dict:
+            ip_name = ACCELERATOR_IP_NAME
+        if ip_name is None:
+            for name, ip in ip_dict.items():
+                if ip.get('type', '').startswith(ACCELERATOR_VLNV + ':'):
+                    ip_name = name
+                    break
+            else:
+                return ACCELERATOR_BASE_ADDR, ACCELERATOR_ADDR_RANGE
+        if ip_name not in ip_dict:
+            raise ValueError("No IP named {} in the IP dictionary of {}."
+                             .format(ip_name, PL.bitfile_name))
+        ip = ip_dict[ip_name]
+        return ip['phys_addr'], ip['addr_range']
+
+    def read(self, offset):
+        """Read the register at the given byte offset."""
+        return self.mmio.read(offset)
+
+    def write(self, offset, value):
+        """Write the register at the given byte offset unconditionally.
+
+        The shadow copy is kept in sync for configuration registers.
+
+        """
+        self.mmio.write(offset, value)
+        if offset in _CONFIG_OFFSETS:
+            self.shadow[offset] = value
+
+    def configure(self, **fields):
+        """Write the configuration registers whose value has changed.
+
+        Parameters
+        ----------
+        fields : dict
+            Register values keyed by the names in `CONFIG_REGISTERS`; 
+            `mac_address` is accepted and split into its 2 words.
+
+        Returns
+        -------
+        int
+            Number of registers actually written.
+
+        """
+        if 'mac_address' in fields:
+            mac = fields.pop('mac_address')
+            fields['mac_address_low'] = mac & 0xFFFFFFFF
+            fields['mac_address_high'] = mac >> 32
+        writes = 0
+        shadow = self.shadow
+        for name, value in fields.items():
+            offset = CONFIG_REGISTERS[name]
+            if shadow.get(offset) != value:
+                self.mmio.write(offset, value)
+                shadow[offset] = value
+                writes += 1
+        return writes
+
+    def invalidate(self):
+        """Forget the shadow copy, so the next writes always happen."""
+        self.shadow.clear()
+
+    @property
+    def mac_address(self):
+        """The 48-bit MAC address of the accelerator."""
+        return (self.read(0x1c) << 32) | self.read(0x18)
+
+    @mac_address.setter
+    def mac_address(self, value):
+        self.configure(mac_address=value)
+
+
+for _name, _offset in CONFIG_REGISTERS.items():
+    setattr(AcceleratorRegisters, _name, _register_property(_name, _offset))
+for _name, _offset in COUNTER_REGISTERS.items():
+    setattr(AcceleratorRegisters, _name, _counter_property(_name, _offset))
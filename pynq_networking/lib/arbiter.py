@@ -0,0 +1,334 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import fcntl
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from queue import Full
+from .slurper import PacketSlurper, frame_bytes, check_frame_length
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+ACCELERATOR = 'accelerator'
+
+_arbiter = None
+
+
+def get_arbiter():
+    """Return the arbiter of the network IOP shared by the process.
+
+    The PL accelerator and the software senders must use the same arbiter,
+    since they write into the same BRAM window.
+
+    """
+    global _arbiter
+    if _arbiter is None:
+        _arbiter = IOPArbiter(PacketSlurper())
+    return _arbiter
+
+
+class ProcessLock:
+    """Exclusive lock shared by the processes driving one network IOP.
+
+    The lock is an `flock()` on a file, so the kernel releases it if the 
+    process holding it dies.
+
+    Attributes
+    ----------
+    path : str
+        The lock file.
+
+    """
+    def __init__(self, path):
+        """Open the lock file, creating it if needed.
+
+        Parameters
+        ----------
+        path : str
+            The lock file, the same in every process.
+
+        """
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def acquire(self, blocking=True, timeout=None):
+        """Take the lock.
+
+        Parameters
+        ----------
+        blocking : bool
+            Whether to wait for the lock to be free.
+        timeout : float
+            Max number of seconds to wait, forever if `None`.
+
+        Returns
+        -------
+        Bool
+            True if the lock is taken.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if not blocking or (deadline is not None and
+                                    time.monotonic() > deadline):
+                    return False
+            time.sleep(0.0001)
+
+    def release(self):
+        """Release the lock."""
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self):
+        """Close the lock file, releasing the lock if it is held."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class IOPArbiter:
+    """Ownership and arbitration of the network IOP transmit window.
+
+    The transmit BRAM window is written both by the PL accelerator, through
+    the physical address of the network IOP, and by `PacketSlurper.send()`
+    from Python. An owner, such as `ACCELERATOR`, can acquire the window for
+    a whole run; software frames sent meanwhile are queued and only written
+    when the owner drains them, between two of its own frames, or releases
+    the window.
+
+    While the window is owned, a queued frame is only written once the 
+    previous frame has been taken by the hardware, i.e. the TX enable 
+    register is clear; otherwise `PacketSlurper.send()` waits for it.
+
+    When several processes drive the same IOP, each arbiter is given the 
+    same `process_lock`: an owner holds it for its whole run, and software
+    frames are only written while it is free, otherwise they are queued. 
+    Frames queued while no owner is in this process are written by the next
+    `send()` or `flush()` finding the lock free; the writer thread of the 
+    slurper polls `flush(0)` while frames are queued.
+
+    Attributes
+    ----------
+    slurper : PacketSlurper
+        The packet interface frames are written to.
+    owner : str
+        The current owner of the window, `None` if it is free.
+    max_pending : int
+        Number of software frames queued before new ones are dropped.
+    stats : dict
+        Number of software frames sent directly, queued, drained and 
+        dropped.
+    process_lock : ProcessLock
+        The lock shared with the other processes driving the IOP, `None` if
+        this process is the only one.
+
+    """
+    def __init__(self, slurper, max_pending=256):
+        """Initialize the arbiter with a free window.
+
+        Parameters
+        ----------
+        slurper : PacketSlurper
+            The packet interface frames are written to.
+        max_pending : int
+            Number of software frames queued before new ones are dropped.
+
+        """
+        self.slurper = slurper
+        self.owner = None
+        self.max_pending = max_pending
+        self.pending = deque()
+        self.stats = {'sent': 0, 'queued': 0, 'drained': 0, 'dropped': 0}
+        self.process_lock = None
+        self._lock = threading.Lock()
+        self._free = threading.Condition(self._lock)
+
+    def acquire(self, owner, timeout=None):
+        """Take the ownership of the transmit window.
+
+        Parameters
+        ----------
+        owner : str
+            The name of the new owner, e.g. `ACCELERATOR`.
+        timeout : float
+            Max number of seconds to wait for the window to be free.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._free:
+            if not self._free.wait_for(lambda: self.owner is None, timeout):
+                raise TimeoutError("Network IOP owned by {}.".format(
+                    self.owner))
+            self.owner = owner
+        # software frames are queued while waiting for the other processes
+        if self.process_lock is not None and not self.process_lock.acquire(
+                timeout=None if deadline is None else
+                max(0, deadline - time.monotonic())):
+            with self._free:
+                self.owner = None
+                self._free.notify_all()
+            raise TimeoutError("Network IOP owned by another process.")
+
+    def release(self, owner):
+        """Give the window back and write the software frames queued."""
+        with self._free:
+            if self.owner != owner:
+                raise RuntimeError("Network IOP not owned by {}.".format(
+                    owner))
+            self.owner = None
+            self._drain(block=True)
+            if self.process_lock is not None:
+                self.process_lock.release()
+            self._free.notify_all()
+
+    @contextmanager
+    def owned(self, owner, timeout=None):
+        """Context manager owning the window for the enclosed block."""
+        self.acquire(owner, timeout)
+        try:
+            yield self
+        finally:
+            self.release(owner)
+
+    def _lock_process(self):
+        return self.process_lock is None or \
+            self.process_lock.acquire(blocking=False)
+
+    def _unlock_process(self):
+        if self.process_lock is not None:
+            self.process_lock.release()
+
+    def _tx_idle(self):
+        return self.slurper.array[self.slurper.TX_EN_OFFSET] == 0
+
+    def _drain(self, limit=None, block=False):
+        # only called by the owner, or with the process lock held
+        # while owned, never wait for the owner's frame to be taken
+        drained = 0
+        while self.pending and (limit is None or drained < limit) and \
+                (block or self._tx_idle()):
+            self.slurper.send(self.pending.popleft())
+            drained += 1
+        self.stats['drained'] += drained
+        return drained
+
+    def drain(self, owner, limit=None):
+        """Write queued software frames while the owner is between frames.
+
+        Parameters
+        ----------
+        owner : str
+            The current owner; the call is only valid while it is idle.
+        limit : int
+            Max number of frames to write, all of them if `None`.
+
+        Returns
+        -------
+        int
+            The number of frames written.
+
+        """
+        if not self.pending:
+            return 0
+        with self._lock:
+            if self.owner != owner:
+                raise RuntimeError("Network IOP not owned by {}.".format(
+                    owner))
+            return self._drain(limit)
+
+    def send(self, frame):
+        """Send a software frame, or queue it if the window is busy.
+
+        The frame is a bytes-like object or a list of segments, as for 
+        `PacketSlurper.send()`; it is only copied when it has to be queued.
+
+        Returns
+        -------
+        Bool
+            True if the frame has been written, False if it is queued.
+
+        Raises
+        ------
+        queue.Full
+            If the frame is dropped because `max_pending` frames are 
+            queued already.
+
+        """
+        with self._lock:
+            if self.owner is None and self._lock_process():
+                try:
+                    self._drain(block=True)
+                    self.slurper.send(frame)
+                finally:
+                    self._unlock_process()
+                self.stats['sent'] += 1
+                return True
+            if len(self.pending) >= self.max_pending:
+                self.stats['dropped'] += 1
+                raise Full("Network IOP queue full, frame dropped.")
+            # the caller may reuse its buffers once the call returns
+            frame = frame_bytes(frame)
+            check_frame_length(len(frame))
+            self.pending.append(frame)
+            self.stats['queued'] += 1
+            return False
+
+    def flush(self, timeout=None):
+        """Block until the queued software frames are written.
+
+        Returns
+        -------
+        Bool
+            True if the queue is empty, False on timeout.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self.pending and self.owner is None and \
+                        self._lock_process():
+                    try:
+                        self._drain(block=True)
+                    finally:
+                        self._unlock_process()
+                if not self.pending:
+                    return True
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.0001)
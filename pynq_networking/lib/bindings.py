@@ -0,0 +1,191 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import logging
+logging.getLogger("kamene.runtime").setLevel(logging.ERROR)
+from kamene.all import *
+from .mqtt import *
+from .mqttsn import *
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+""" Registry of the kamene layer bindings used by this package.
+
+    kamene keeps its layer bindings in global tables and `bind_layers` 
+    appends to them on every call, even if the binding already exists. 
+    Every binding is therefore made through this registry, which binds each
+    layer exactly once and can unbind it again.
+
+    Bindings are reference counted: the broker and the clients of a port 
+    each bind it, and the layers are only split once every one of them has
+    unbound it.
+
+    The MQTT and MQTT-SN message types need no binding: those layers find
+    their payload class from the type field directly.
+
+"""
+
+
+_bindings = {}
+
+
+def _key(lower, upper, fields):
+    return lower, upper, tuple(sorted(fields.items()))
+
+
+def bind_layer(lower, upper, **fields):
+    """Bind two layers, or count one more user of an existing binding.
+
+    Parameters
+    ----------
+    lower : Packet
+        The lower layer class.
+    upper : Packet
+        The upper layer class.
+    fields : dict
+        The field values of the lower layer selecting the upper layer.
+
+    Returns
+    -------
+    bool
+        True if a new binding has been made.
+
+    """
+    key = _key(lower, upper, fields)
+    count = _bindings.get(key, 0)
+    if not count:
+        bind_layers(lower, upper, fields)
+    _bindings[key] = count + 1
+    return not count
+
+
+def unbind_layer(lower, upper, **fields):
+    """Release a binding made by `bind_layer()`.
+
+    The layers are split when the last user of the binding releases it.
+
+    Returns
+    -------
+    bool
+        True if the binding has been removed.
+
+    """
+    key = _key(lower, upper, fields)
+    count = _bindings.get(key, 0)
+    if count > 1:
+        _bindings[key] = count - 1
+        return False
+    if not count:
+        return False
+    split_layers(lower, upper, **fields)
+    del _bindings[key]
+    return True
+
+
+def bound_layers():
+    """Return the list of (lower, upper, fields) bindings in place."""
+    return [(lower, upper, dict(fields))
+            for lower, upper, fields in _bindings]
+
+
+def bind_mqtt(ports=(1883,)):
+    """Bind the MQTT dissectors to the given TCP ports.
+
+    Parameters
+    ----------
+    ports : list
+        The MQTT port numbers in use.
+
+    Returns
+    -------
+    list
+        The ports which were not bound yet.
+
+    """
+    bound = []
+    for port in ports:
+        if bind_layer(TCP, MQTT_Stream, dport=port) | \
+                bind_layer(TCP, MQTT_Stream, sport=port):
+            bound.append(port)
+    return bound
+
+
+def bind_mqttsn(ports=(1884,)):
+    """Bind the MQTT-SN dissectors to the given UDP ports.
+
+    Parameters
+    ----------
+    ports : list
+        The MQTT-SN port numbers in use.
+
+    Returns
+    -------
+    list
+        The ports which were not bound yet.
+
+    """
+    bound = []
+    for port in ports:
+        if bind_layer(UDP, MQTTSN, dport=port) | \
+                bind_layer(UDP, MQTTSN, sport=port):
+            bound.append(port)
+    return bound
+
+
+def unbind_ports(mqtt_ports=(), mqttsn_ports=()):
+    """Release the dissectors of the given ports only.
+
+    Each call releases one reference taken by `bind_mqtt()` or 
+    `bind_mqttsn()`; a port stays bound while others still use it.
+
+    Parameters
+    ----------
+    mqtt_ports : list
+        The MQTT port numbers no longer in use.
+    mqttsn_ports : list
+        The MQTT-SN port numbers no longer in use.
+
+    """
+    for port in mqtt_ports:
+        unbind_layer(TCP, MQTT_Stream, dport=port)
+        unbind_layer(TCP, MQTT_Stream, sport=port)
+    for port in mqttsn_ports:
+        unbind_layer(UDP, MQTTSN, dport=port)
+        unbind_layer(UDP, MQTTSN, sport=port)
+
+
+def unbind_all():
+    """Remove every binding made through this registry, used or not."""
+    for lower, upper, fields in list(_bindings):
+        split_layers(lower, upper, **dict(fields))
+    _bindings.clear()
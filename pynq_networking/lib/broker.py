@@ -30,16 +30,17 @@
 
 import subprocess
 import os
+import signal
 import socket
 import struct
+import time
 import ipaddress
 import netifaces
 from uuid import getnode
-import logging
-logging.getLogger("kamene.runtime").setLevel(logging.ERROR)
-from kamene.all import *
-from .mqtt import *
-from .mqttsn_sw import *
+from .gateway import MQTTSNGateway
+from .supervisor import BrokerProcess, tcp_port_open
+from .broker_config import BrokerConfig, Listener
+from .broker_log import BrokerLogMonitor
 from site import getsitepackages
 
 __author__ = "Yun Rock Qu"
@@ -109,18 +110,53 @@ def mac_str_to_int(mac_str):
     return int(mac_str.replace(':', ''), 16)
 
 
-def get_pid(process_name):
-    return int(subprocess.check_output(["pidof", process_name]))
+def get_pids(process_name):
+    """Get the process IDs of all the processes with the given name.
+
+    Returns
+    -------
+    list
+        The list of process IDs, empty if there is no such process.
+
+    """
+    try:
+        output = subprocess.check_output(["pidof", process_name])
+    except subprocess.CalledProcessError:
+        return []
+    return [int(pid) for pid in output.split()]
 
 
 class Broker(object):
     """Broker class sets up the broker server for MQTT client to talk to.
 
     Ideally, there should be only 1 broker set up for each board.
+
+    Two engines are available: `rsmb` runs the prebuilt `broker_mqtts`
+    binary, while `python` runs the pure-Python `MQTTSNGateway`, which only
+    serves MQTT-SN but does not need the binary.
+
+    rsmb is single-threaded, so several instances can be started to spread
+    the load across cores. Instance `i` listens on `mqtt_port + 2*i` and
+    `mqttsn_port + 2*i`, and is pinned to core `i % cpu_count`. Clients can
+    use `ShardedClient` to spread topics across the instances.
     
+    Attributes
+    ----------
+    endpoints : list
+        The (mqtt_port, mqttsn_port) tuple of each instance.
+    broker_config : BrokerConfig
+        The rsmb settings shared by all the instances.
+    configs : list
+        The configuration file of each instance.
+    logs : list
+        The log file of each instance.
+    log_max_size : int
+        The size in bytes above which a log is rotated.
+
     """
     def __init__(self, ip_address=None, mqtt_port=1883, mqttsn_port=1884,
-                 max_connections=100):
+                 max_connections=100, engine='rsmb', instances=1,
+                 config=None, log_max_size=1 << 20):
         """MQTT broker initialization. 
 
         Parameters
@@ -133,61 +169,182 @@ class Broker(object):
             MQTT-SN port number.
         max_connections : int
             Max number of connections allowed on each port.
+        engine : str
+            The broker engine, either `rsmb` or `python`.
+        instances : int
+            Number of broker instances to start.
+        config : BrokerConfig/str
+            The rsmb settings, or the name of one of the presets such as
+            `throughput` or `debug`. The listeners are always generated
+            from the port numbers above. The `throughput` preset turns the
+            rsmb trace off, so `metrics()` only reports zeros with it.
+        log_max_size : int
+            The size in bytes above which a log is rotated.
 
         """
+        if engine not in ('rsmb', 'python'):
+            raise ValueError("Broker engine must be 'rsmb' or 'python'.")
+        if instances < 1:
+            raise ValueError("At least 1 broker instance is required.")
         self.ip_address = get_ip_string() \
             if ip_address is None else ip_address
         self.mqtt_port = mqtt_port
         self.mqttsn_port = mqttsn_port
         self.max_connections = max_connections
-        self.log = 'broker.log'
-
-        with open("broker.cfg", 'w') as file:
-            file.write("trace_output on\n")
-            file.write("listener " + str(self.mqtt_port) + "\n")
-            file.write("    max_connections " +
-                       str(self.max_connections) + "\n")
-            file.write("listener " + str(self.mqttsn_port) + " " +
-                       self.ip_address + " mqtts\n")
-            file.write("    max_connections " +
-                       str(self.max_connections) + "\n")
-
-    def open(self):
+        self.engine = engine
+        self.instances = instances
+        if config is None:
+            config = 'default'
+        self.broker_config = BrokerConfig.preset(config) \
+            if isinstance(config, str) else config
+        self.endpoints = [(mqtt_port + 2 * i, mqttsn_port + 2 * i)
+                          for i in range(instances)]
+        self.configs = [self._instance_file('broker', i, 'cfg')
+                        for i in range(instances)]
+        self.logs = [self._instance_file('broker', i, 'log')
+                     for i in range(instances)]
+        self.config = self.configs[0]
+        self.log = self.logs[0]
+        self.log_max_size = log_max_size
+        self.gateways = []
+        self.processes = []
+        self.monitors = []
+        self._last_metrics = None
+        self._bound = ([], [])
+
+        if self.engine == 'rsmb':
+            self._write_configs()
+
+    @staticmethod
+    def _instance_file(name, index, extension):
+        if index == 0:
+            return "{}.{}".format(name, extension)
+        return "{}_{}.{}".format(name, index, extension)
+
+    def _write_configs(self):
+        """Validate the rsmb settings and write one file per instance."""
+        for config, (mqtt, mqttsn) in zip(self.configs, self.endpoints):
+            self.broker_config.with_listeners([
+                Listener(mqtt, None, 'mqtt', self.max_connections),
+                Listener(mqttsn, self.ip_address, 'mqtts',
+                         self.max_connections)]).write(config)
+
+    def open(self, timeout=5.0):
         """Open the server for client to connect.
 
         This method will open the server. It first check whether there is 
         any running broker already. Then it binds the port number to packets.
+        It returns as soon as the broker ports are ready.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait for the broker to be ready.
 
         """
         broker = os.path.join(getsitepackages()[0], 'pynq_networking', 'rsmb',
                            'rsmb', 'src', 'broker_mqtts')
 
         self.close()
-        os.system(f"nohup {broker} > {self.log}  &")
-
-        for t in MQTT_PACKET_TYPES:
-            bind_layers(MQTT, t, {'type': t.type})
+        if self.engine == 'python':
+            for _, mqttsn_port in self.endpoints:
+                gateway = MQTTSNGateway(self.ip_address, mqttsn_port,
+                                        self.max_connections)
+                gateway.open()
+                self.gateways.append(gateway)
+        else:
+            self._write_configs()
+            if any(tcp_port_open(mqtt) for mqtt, _ in self.endpoints):
+                self._stop_stale_brokers()
+            cpus = os.cpu_count() or 1
+            for i, (mqtt, mqttsn) in enumerate(self.endpoints):
+                process = BrokerProcess([broker, self.configs[i]],
+                                        self.logs[i], mqtt, mqttsn,
+                                        cpu=i % cpus)
+                process.start(timeout)
+                self.processes.append(process)
+                monitor = BrokerLogMonitor(self.logs[i], self.log_max_size)
+                monitor.start()
+                self.monitors.append(monitor)
+
+        from .bindings import bind_mqtt, bind_mqttsn
+        self._bound = ([mqtt for mqtt, _ in self.endpoints],
+                       [mqttsn for _, mqttsn in self.endpoints])
+        bind_mqtt(self._bound[0])
+        bind_mqttsn(self._bound[1])
 
-        bind_layers(TCP, MQTT_Stream, {'dport': self.mqtt_port})
-        bind_layers(TCP, MQTT_Stream, {'sport': self.mqtt_port})
+    def close(self):
+        """Close the server.
 
-        for t in MQTTSN_PACKET_TYPES:
-            bind_layers(MQTTSN, t, {'type': t.type})
+        It will kill the broker running in the background. The logs are
+        parsed one last time before being deleted, so `metrics()` still
+        reports the counters of the last run. The ports bound by `open()`
+        are released again; they stay bound while a client still uses them.
 
-        bind_layers(UDP, MQTTSN, {'dport': self.mqttsn_port})
-        bind_layers(UDP, MQTTSN, {'sport': self.mqttsn_port})
+        """
+        if any(self._bound):
+            from .bindings import unbind_ports
+            unbind_ports(*self._bound)
+            self._bound = ([], [])
+        for process in self.processes:
+            process.stop()
+        for monitor in self.monitors:
+            monitor.stop()
+        if self.gateways or self.monitors:
+            self._last_metrics = self.metrics()
+        for gateway in self.gateways:
+            gateway.close()
+        self.gateways = []
+        self.processes = []
+        self.monitors = []
+        for log in self.logs:
+            for path in (log, log + '.offset'):
+                if os.path.isfile(path):
+                    os.remove(path)
+
+    def metrics(self):
+        """Get the broker-side counters summed over all the instances.
+
+        Returns
+        -------
+        dict
+            The number of connects, publishes in and out, and dropped
+            messages, and the queue sizes reported by rsmb.
 
-    def close(self):
-        """Close the server.
+        """
+        if not self.gateways and not self.monitors:
+            return self._last_metrics
+        result = {'connects': 0, 'publishes_in': 0, 'publishes_out': 0,
+                  'dropped': 0}
+        for gateway in self.gateways:
+            for name in result:
+                result[name] += gateway.stats[name]
+        for monitor in self.monitors:
+            monitor.poll()
+            snapshot = monitor.snapshot()
+            for name in ('queued', 'queued_peak'):
+                result[name] = result.get(name, 0) + snapshot[name]
+            for name in ('connects', 'publishes_in', 'publishes_out',
+                         'dropped'):
+                result[name] += snapshot[name]
+        return result
+
+    def _stop_stale_brokers(self, timeout=2.0):
+        """Terminate brokers left behind by an earlier session.
 
-        It will kill the broker running in the background.
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait for the ports to be released.
 
         """
-        try:
-            process_id = get_pid("broker_mqtts")
-        except subprocess.CalledProcessError:
-            pass
-        else:
-            os.system("kill -9 {}".format(process_id))
-        if os.path.isfile(self.log):
-            os.system("rm -rf " + self.log)
+        for pid in get_pids("broker_mqtts"):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + timeout
+        while any(tcp_port_open(mqtt) for mqtt, _ in self.endpoints):
+            if time.monotonic() > deadline:
+                raise OSError("Broker ports are still in use.")
+            time.sleep(0.01)
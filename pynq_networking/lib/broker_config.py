@@ -0,0 +1,248 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import copy
+import ipaddress
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+TRACE_OUTPUTS = ('off', 'on', 'protocol')
+TRACE_LEVELS = ('minimum', 'medium', 'maximum')
+PROTOCOLS = ('mqtt', 'mqtts')
+
+
+PRESETS = {
+    'default': {
+        'trace_output': 'on',
+    },
+    # no trace at all: the broker log counters stay at 0 with this preset
+    'throughput': {
+        'trace_output': 'off',
+        'trace_level': 'minimum',
+        'connection_messages': False,
+        'persistence': False,
+        'retained_persistence': False,
+        'max_inflight_messages': 100,
+        'max_queued_messages': 10000,
+    },
+    'debug': {
+        'trace_output': 'protocol',
+        'trace_level': 'maximum',
+        'connection_messages': True,
+        'max_inflight_messages': 10,
+        'max_queued_messages': 100,
+    },
+}
+
+
+class Listener:
+    """A listener section of the rsmb configuration.
+
+    Attributes
+    ----------
+    port : int
+        The port number to listen on.
+    bind_address : str
+        The address to bind to, `None` to listen on all addresses.
+    protocol : str
+        Either `mqtt` or `mqtts` (MQTT-SN).
+    max_connections : int
+        Max number of connections allowed on this listener.
+
+    """
+    def __init__(self, port, bind_address=None, protocol='mqtt',
+                 max_connections=100):
+        self.port = port
+        self.bind_address = bind_address
+        self.protocol = protocol
+        self.max_connections = max_connections
+
+    def validate(self):
+        """Raise `ValueError` if the listener settings are invalid."""
+        if not isinstance(self.port, int) or not 0 < self.port < 65536:
+            raise ValueError("Invalid listener port {}.".format(self.port))
+        if self.protocol not in PROTOCOLS:
+            raise ValueError("Listener protocol must be one of {}.".format(
+                PROTOCOLS))
+        if self.bind_address is not None:
+            try:
+                ipaddress.ip_address(self.bind_address)
+            except ValueError:
+                raise ValueError("Invalid bind address {}.".format(
+                    self.bind_address)) from None
+        elif self.protocol == 'mqtts':
+            raise ValueError("MQTT-SN listeners need a bind address.")
+        if not isinstance(self.max_connections, int) or \
+                self.max_connections < 1:
+            raise ValueError("max_connections must be a positive integer.")
+
+    def render(self):
+        """Return the configuration lines of this listener."""
+        line = "listener {}".format(self.port)
+        if self.bind_address is not None:
+            line += " " + self.bind_address
+        if self.protocol != 'mqtt':
+            line += " " + self.protocol
+        return [line, "    max_connections {}".format(self.max_connections)]
+
+
+class BrokerConfig:
+    """Typed builder for the rsmb configuration file.
+
+    Only the settings that matter for performance are exposed. A setting
+    left to `None` is not written, so rsmb uses its own default.
+
+    Attributes
+    ----------
+    trace_output : str
+        One of `off`, `on` or `protocol`.
+    trace_level : str
+        One of `minimum`, `medium` or `maximum`.
+    connection_messages : bool
+        Whether connects and disconnects are logged.
+    persistence : bool
+        Whether the subscriptions and queued messages are saved to disk.
+    persistence_location : str
+        The directory used for persistence.
+    retained_persistence : bool
+        Whether retained messages are saved to disk.
+    max_inflight_messages : int
+        Max number of QoS 1 and 2 messages in flight per client.
+    max_queued_messages : int
+        Max number of messages queued per client.
+    listeners : list
+        The `Listener` sections.
+
+    """
+    def __init__(self, trace_output='on', trace_level=None,
+                 connection_messages=None, persistence=None,
+                 persistence_location=None, retained_persistence=None,
+                 max_inflight_messages=None, max_queued_messages=None):
+        self.trace_output = trace_output
+        self.trace_level = trace_level
+        self.connection_messages = connection_messages
+        self.persistence = persistence
+        self.persistence_location = persistence_location
+        self.retained_persistence = retained_persistence
+        self.max_inflight_messages = max_inflight_messages
+        self.max_queued_messages = max_queued_messages
+        self.listeners = []
+
+    @classmethod
+    def preset(cls, name, **overrides):
+        """Build a configuration from one of the `PRESETS`.
+
+        Parameters
+        ----------
+        name : str
+            The preset name, for example `throughput` or `debug`.
+        overrides : dict
+            Settings overriding the preset values.
+
+        """
+        if name not in PRESETS:
+            raise ValueError("Unknown preset {}, must be one of {}.".format(
+                name, list(PRESETS)))
+        settings = dict(PRESETS[name])
+        settings.update(overrides)
+        return cls(**settings)
+
+    def add_listener(self, port, bind_address=None, protocol='mqtt',
+                     max_connections=100):
+        """Add a listener section and return the configuration."""
+        self.listeners.append(Listener(port, bind_address, protocol,
+                                       max_connections))
+        return self
+
+    def with_listeners(self, listeners):
+        """Return a copy of the configuration with the given listeners."""
+        config = copy.copy(self)
+        config.listeners = list(listeners)
+        return config
+
+    def validate(self):
+        """Raise `ValueError` if any setting is invalid."""
+        if self.trace_output not in TRACE_OUTPUTS:
+            raise ValueError("trace_output must be one of {}.".format(
+                TRACE_OUTPUTS))
+        if self.trace_level is not None and \
+                self.trace_level not in TRACE_LEVELS:
+            raise ValueError("trace_level must be one of {}.".format(
+                TRACE_LEVELS))
+        for name in ('connection_messages', 'persistence',
+                     'retained_persistence'):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, bool):
+                raise ValueError("{} must be a bool.".format(name))
+        for name in ('max_inflight_messages', 'max_queued_messages'):
+            value = getattr(self, name)
+            if value is not None and (not isinstance(value, int) or
+                                      isinstance(value, bool) or value < 1):
+                raise ValueError("{} must be a positive integer.".format(
+                    name))
+        if self.persistence_location is not None and not self.persistence:
+            raise ValueError("persistence_location needs persistence on.")
+        if not self.listeners:
+            raise ValueError("At least 1 listener is required.")
+        ports = [listener.port for listener in self.listeners]
+        if len(set(ports)) != len(ports):
+            raise ValueError("Listener ports must be unique.")
+        for listener in self.listeners:
+            listener.validate()
+
+    def render(self):
+        """Validate the configuration and return its text."""
+        self.validate()
+        lines = ["trace_output " + self.trace_output]
+        if self.trace_level is not None:
+            lines.append("trace_level " + self.trace_level)
+        for name in ('connection_messages', 'persistence',
+                     'retained_persistence'):
+            value = getattr(self, name)
+            if value is not None:
+                lines.append("{} {}".format(name, str(value).lower()))
+        if self.persistence_location is not None:
+            lines.append("persistence_location " + self.persistence_location)
+        for name in ('max_inflight_messages', 'max_queued_messages'):
+            value = getattr(self, name)
+            if value is not None:
+                lines.append("{} {}".format(name, value))
+        for listener in self.listeners:
+            lines.extend(listener.render())
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Validate the configuration and write it to the given file."""
+        text = self.render()
+        with open(path, 'w') as file:
+            file.write(text)
@@ -0,0 +1,254 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import json
+import os
+import re
+import shutil
+import threading
+import time
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+class BrokerLogMonitor:
+    """Tail-follow parser turning the rsmb trace into counters.
+
+    The log is read incrementally from a file offset which is persisted next
+    to the log, so a new monitor resumes where the last one stopped. Once the
+    log grows above the size cap and has been fully parsed, it is truncated
+    in place; rsmb writes with `O_APPEND`, so it keeps writing at the start
+    of the file. The counters rely on the rsmb protocol trace, and stay at
+    0 when `trace_output` is off, as in the `throughput` preset.
+
+    Attributes
+    ----------
+    log : str
+        The log file to follow.
+    max_size : int
+        The size in bytes above which the log is rotated.
+    backups : int
+        Number of rotated copies to keep, 0 to discard parsed lines.
+    counters : dict
+        The number of connects, publishes in and out, and dropped messages,
+        plus the last and the peak queue sizes reported.
+
+    """
+    PATTERNS = {
+        'connects': re.compile(r'<- (?:MQTT-S )?CONNECT\b'),
+        'publishes_in': re.compile(r'<- (?:MQTT-S )?PUBLISH\b'),
+        'publishes_out': re.compile(r'-> (?:MQTT-S )?PUBLISH\b'),
+        'dropped': re.compile(r'(?i)\b(?:discard|dropp)'),
+    }
+    QUEUE_PATTERN = re.compile(r'(?i)\bqueued? (?:size|messages?|count)\D*'
+                               r'(\d+)')
+
+    def __init__(self, log, max_size=1 << 20, backups=0, offset_file=None):
+        """Initialize the monitor and load the persisted offset.
+
+        Parameters
+        ----------
+        log : str
+            The log file to follow.
+        max_size : int
+            The size in bytes above which the log is rotated.
+        backups : int
+            Number of rotated copies to keep.
+        offset_file : str
+            Where the offset is persisted, defaulted to `<log>.offset`.
+
+        """
+        self.log = log
+        self.max_size = max_size
+        self.backups = backups
+        self.offset_file = log + '.offset' if offset_file is None \
+            else offset_file
+        self.counters = {'connects': 0, 'publishes_in': 0,
+                         'publishes_out': 0, 'dropped': 0,
+                         'queued': 0, 'queued_peak': 0}
+        self.lines = 0
+        self.offset = 0
+        self._inode = None
+        self._partial = b''
+        self._thread = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._load_offset()
+
+    def _load_offset(self):
+        try:
+            with open(self.offset_file) as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return
+        self.offset = state.get('offset', 0)
+        self._inode = state.get('inode')
+        self._partial = state.get('partial', '').encode('latin-1')
+
+    def _save_offset(self):
+        with open(self.offset_file, 'w') as file:
+            json.dump({'offset': self.offset, 'inode': self._inode,
+                       'partial': self._partial.decode('latin-1')}, file)
+
+    def parse_line(self, line):
+        """Update the counters from one trace line."""
+        self.lines += 1
+        for name, pattern in self.PATTERNS.items():
+            if pattern.search(line):
+                self.counters[name] += 1
+        match = self.QUEUE_PATTERN.search(line)
+        if match:
+            queued = int(match.group(1))
+            self.counters['queued'] = queued
+            self.counters['queued_peak'] = max(queued,
+                                               self.counters['queued_peak'])
+
+    def poll(self):
+        """Parse the lines appended since the last call.
+
+        Returns
+        -------
+        int
+            The number of lines parsed.
+
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.log)
+            except FileNotFoundError:
+                return 0
+            if stat.st_ino != self._inode or stat.st_size < self.offset:
+                self._inode = stat.st_ino
+                self.offset = 0
+                self._partial = b''
+            if stat.st_size == self.offset:
+                return 0
+            with open(self.log, 'rb+') as file:
+                file.seek(self.offset)
+                count = self._consume(file.read())
+                if self.offset >= self.max_size:
+                    count += self._rotate(file)
+            self._save_offset()
+            return count
+
+    def _consume(self, data):
+        self.offset += len(data)
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self.parse_line(line.decode(errors='replace'))
+        return len(lines)
+
+    def _rotate(self, file):
+        # only truncate once the size matches what has been read, so lines
+        # rsmb appends meanwhile are parsed (and backed up) first
+        backup = None
+        if self.backups > 0:
+            for i in range(self.backups - 1, 0, -1):
+                older = "{}.{}".format(self.log, i)
+                if os.path.isfile(older):
+                    os.replace(older, "{}.{}".format(self.log, i + 1))
+            file.seek(0)
+            backup = open(self.log + '.1', 'wb')
+            shutil.copyfileobj(file, backup)
+            file.seek(self.offset)
+        count = 0
+        try:
+            while True:
+                data = file.read()
+                if data:
+                    count += self._consume(data)
+                    if backup is not None:
+                        backup.write(data)
+                elif os.fstat(file.fileno()).st_size == self.offset:
+                    os.ftruncate(file.fileno(), 0)
+                    break
+        finally:
+            if backup is not None:
+                backup.close()
+        self.offset = 0
+        return count
+
+    def start(self, interval=1.0):
+        """Follow the log in a background thread.
+
+        Parameters
+        ----------
+        interval : float
+            Number of seconds between two polls.
+
+        """
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+
+        def follow():
+            while not self._stopping.wait(interval):
+                self.poll()
+
+        self._thread = threading.Thread(target=follow, daemon=True,
+                                        name="broker-log-monitor")
+        self._thread.start()
+
+    def stop(self):
+        """Stop following the log, after parsing what is left in it."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+        self.poll()
+
+    def snapshot(self):
+        """Return a copy of the counters with a timestamp."""
+        with self._lock:
+            result = dict(self.counters)
+        result['time'] = time.time()
+        return result
+
+    @staticmethod
+    def rates(first, second):
+        """Compute the per-second rates between two snapshots.
+
+        Parameters
+        ----------
+        first : dict
+            The earlier snapshot.
+        second : dict
+            The later snapshot.
+
+        """
+        elapsed = second['time'] - first['time']
+        if elapsed <= 0:
+            return {}
+        return {name: (second[name] - first[name]) / elapsed
+                for name in ('connects', 'publishes_in', 'publishes_out',
+                             'dropped')}
@@ -0,0 +1,109 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import threading
+from collections import deque
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+class BufferPool:
+    """Fixed pool of preallocated receive buffers.
+
+    All the buffers are allocated once, so handing them out and taking them
+    back never allocates. A buffer must be released exactly once after use.
+
+    Attributes
+    ----------
+    count : int
+        Number of buffers in the pool.
+    size : int
+        Size of each buffer in bytes.
+    peak : int
+        Highest number of buffers in use at the same time.
+    misses : int
+        Number of requests made while every buffer was in use.
+
+    """
+    def __init__(self, count=64, size=1536):
+        """Allocate the buffers.
+
+        Parameters
+        ----------
+        count : int
+            Number of buffers in the pool.
+        size : int
+            Size of each buffer in bytes, e.g. the largest frame.
+
+        """
+        self.count = count
+        self.size = size
+        self.peak = 0
+        self.misses = 0
+        self._buffers = [bytearray(size) for _ in range(count)]
+        self._free = deque(self._buffers)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of buffers currently in use."""
+        return self.count - len(self._free)
+
+    def acquire(self):
+        """Take a buffer out of the pool.
+
+        Returns
+        -------
+        bytearray
+            The buffer, `None` if every buffer is in use.
+
+        """
+        with self._lock:
+            if not self._free:
+                self.misses += 1
+                return None
+            buffer = self._free.pop()
+            in_use = self.count - len(self._free)
+            if in_use > self.peak:
+                self.peak = in_use
+            return buffer
+
+    def release(self, buffer):
+        """Give a buffer back to the pool."""
+        with self._lock:
+            self._free.append(buffer)
+
+    def stats(self):
+        """Return the size and occupancy of the pool."""
+        with self._lock:
+            return {'count': self.count, 'size': self.size,
+                    'in_use': self.count - len(self._free),
+                    'peak': self.peak, 'misses': self.misses}
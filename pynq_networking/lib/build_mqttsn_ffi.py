@@ -0,0 +1,85 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+from site import getsitepackages
+from cffi import FFI
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+"""Build script of the out-of-line API-mode module for `lib_mqttsn.so`.
+
+It is run by `setup.py` through `cffi_modules`, so the C prototypes are 
+parsed and compiled once at install time instead of on every 
+`Accelerator()` construction. The module is linked against the 
+`lib_mqttsn.so` of the board overlay, and finds it again at run time in 
+the installed overlay folder.
+
+"""
+
+CFFI_INTERFACE = """
+void init_ethernet_raw(const char *interface, uint16_t myPort);
+float read_sensor(volatile char * sensor);
+void Top(int size, int count,
+         unsigned long long macAddress,
+         unsigned int ipAddress,
+         unsigned int destIP,
+         int destPort,
+         unsigned short topicID,
+         int qos,
+         bool verbose,
+         volatile char * networkIOP,
+         volatile char * sensor);
+void sds_mmap(int phys, int length, void *virtual);
+void *sds_alloc(size_t size);
+"""
+
+GIT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.realpath(__file__))))
+BUILD_LIB_DIR = os.path.join(GIT_DIR, 'pynq_networking', 'overlays', 'mqttsn')
+INSTALL_LIB_DIR = os.path.join(getsitepackages()[0], 'pynq_networking',
+                               'overlays', 'mqttsn')
+
+ffibuilder = FFI()
+ffibuilder.cdef(CFFI_INTERFACE)
+ffibuilder.set_source(
+    'pynq_networking.lib._mqttsn_ffi',
+    '#include <stdbool.h>\n#include <stddef.h>\n#include <stdint.h>\n' +
+    CFFI_INTERFACE,
+    libraries=['_mqttsn'],
+    library_dirs=[BUILD_LIB_DIR],
+    extra_link_args=['-Wl,-rpath,' + INSTALL_LIB_DIR])
+
+
+if __name__ == '__main__':
+    ffibuilder.compile(verbose=True)
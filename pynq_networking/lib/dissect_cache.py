@@ -0,0 +1,238 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+_MUTATORS = frozenset(('setfieldval', 'delfieldval', 'add_payload',
+                       'remove_payload', 'add_underlayer',
+                       'remove_underlayer', 'hide_defaults', 'init_fields',
+                       'dissect'))
+
+
+def _freeze(value):
+    """Wrap packets and dicts reached through a cached packet read-only."""
+    from kamene.packet import Packet
+    if isinstance(value, Packet):
+        return FrozenPacket(value)
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    return value
+
+
+class FrozenPacket:
+    """Read-only view of a cached packet.
+
+    Layers and fields are read from the shared packet, and `isinstance()`
+    sees the class of the packet. Inner layers, reached by indexing, 
+    `getlayer()` or `payload`, are read-only views as well, so are dicts 
+    such as `fields`, and the methods modifying a packet in place are 
+    refused. Only the `time` attribute, set
+    per reception, can be assigned; `copy()` returns a mutable packet.
+
+    """
+    __slots__ = ('_packet', 'time')
+
+    def __init__(self, packet, time=None):
+        object.__setattr__(self, '_packet', packet)
+        object.__setattr__(self, 'time', time)
+
+    @property
+    def __class__(self):
+        return self._packet.__class__
+
+    def __getattr__(self, name):
+        if name in _MUTATORS:
+            raise AttributeError("Cached packets are read-only.")
+        value = getattr(self._packet, name)
+        if name in ('getlayer', 'lastlayer', 'firstlayer'):
+            return lambda *args, **kwargs: _freeze(value(*args, **kwargs))
+        return _freeze(value)
+
+    def __setattr__(self, name, value):
+        if name != 'time':
+            raise AttributeError("Cached packets are read-only.")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("Cached packets are read-only.")
+
+    def __setitem__(self, layer, value):
+        raise TypeError("Cached packets are read-only.")
+
+    def __delitem__(self, layer):
+        raise TypeError("Cached packets are read-only.")
+
+    def __getitem__(self, layer):
+        return _freeze(self._packet[layer])
+
+    def __contains__(self, layer):
+        return layer in self._packet
+
+    def __bytes__(self):
+        return bytes(self._packet)
+
+    def __bool__(self):
+        return bool(self._packet)
+
+    def __len__(self):
+        return len(self._packet)
+
+    def __iter__(self):
+        return iter(self._packet)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenPacket):
+            other = object.__getattribute__(other, '_packet')
+        return self._packet == other
+
+    __hash__ = None
+
+    def __truediv__(self, other):
+        return self._packet / other
+
+    def __repr__(self):
+        return repr(self._packet)
+
+    def copy(self):
+        """Return a mutable copy of the packet."""
+        return self._packet.copy()
+
+
+class DissectionCache:
+    """Bounded LRU cache of dissected frames.
+
+    Frames seen before are returned as a `FrozenPacket` sharing the packet
+    built the first time, so repeated frames such as ARP requests or 
+    PUBACKs skip the dissection entirely.
+
+    With `prefix` set, the cache is keyed by the first `prefix` bytes and 
+    the length of the frame, which is cheaper to hash for long frames; the
+    whole frame is still compared before a hit is returned.
+
+    Attributes
+    ----------
+    maxsize : int
+        Number of frames kept.
+    max_frame : int
+        Longest frame cached, in bytes; longer frames are rarely repeated.
+    prefix : int
+        Number of leading bytes keying a frame, `None` for the whole frame.
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of frames dissected.
+
+    """
+    def __init__(self, maxsize=256, max_frame=256, prefix=None):
+        """Initialize an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Number of frames kept.
+        max_frame : int
+            Longest frame cached, in bytes.
+        prefix : int
+            Number of leading bytes keying a frame, `None` for the whole 
+            frame.
+
+        """
+        self.maxsize = maxsize
+        self.max_frame = max_frame
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of frames cached."""
+        return len(self._entries)
+
+    def _key(self, frame):
+        if self.prefix is None:
+            return frame
+        return frame[:self.prefix], len(frame)
+
+    def dissect(self, frame, dissector):
+        """Return the dissected frame, from the cache if possible.
+
+        Parameters
+        ----------
+        frame : bytes
+            The received frame.
+        dissector : function
+            Builds the packet from the frame on a miss, e.g. `Ether`.
+
+        Returns
+        -------
+        FrozenPacket/Packet
+            A read-only view for cacheable frames, the packet built by the
+            dissector otherwise.
+
+        """
+        if len(frame) > self.max_frame:
+            self.misses += 1
+            return dissector(frame)
+        key = self._key(frame)
+        entries = self._entries
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None and entry[0] == frame:
+                entries.move_to_end(key)
+                self.hits += 1
+                return FrozenPacket(entry[1])
+            self.misses += 1
+        packet = dissector(frame)
+        with self._lock:
+            entries[key] = (bytes(frame), packet)
+            entries.move_to_end(key)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+        return FrozenPacket(packet)
+
+    def clear(self):
+        """Drop every cached frame, e.g. after the dissectors are rebound."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the hit and miss counts and the hit ratio."""
+        lookups = self.hits + self.misses
+        return {'size': len(self._entries), 'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0}
@@ -0,0 +1,585 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import asyncio
+import struct
+import threading
+import time
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+""" Pure-Python MQTT-SN gateway.
+
+    This is a small asyncio stand-in for the rsmb broker. It only speaks the
+    UDP side of MQTT-SN (no MQTT over TCP), but it does not depend on kamene
+    or on a prebuilt binary, so it can be started anywhere in milliseconds.
+
+"""
+
+
+CONNECT = 0x04
+CONNACK = 0x05
+REGISTER = 0x0A
+REGACK = 0x0B
+PUBLISH = 0x0C
+PUBACK = 0x0D
+PUBCOMP = 0x0E
+PUBREC = 0x0F
+PUBREL = 0x10
+SUBSCRIBE = 0x12
+SUBACK = 0x13
+PINGREQ = 0x16
+PINGRESP = 0x17
+DISCONNECT = 0x18
+
+RC_ACCEPTED = 0x00
+RC_CONGESTION = 0x01
+RC_INVALID_TOPIC = 0x02
+RC_NOT_SUPPORTED = 0x03
+
+TOPIC_NORMAL = 0x00
+TOPIC_PREDEFINED = 0x01
+TOPIC_SHORT = 0x02
+
+FLAG_DUP = 0x80
+
+
+def encode_packet(msg_type, body=b''):
+    """Frame an MQTT-SN message with its length header.
+
+    Parameters
+    ----------
+    msg_type : int
+        The MQTT-SN message type.
+    body : bytes
+        The variable part of the message.
+
+    Returns
+    -------
+    bytes
+        The encoded message.
+
+    """
+    length = len(body) + 2
+    if length < 256:
+        return struct.pack("!BB", length, msg_type) + body
+    return struct.pack("!BHB", 0x01, length + 2, msg_type) + body
+
+
+def decode_packet(data):
+    """Split an MQTT-SN datagram into its type and variable part.
+
+    Parameters
+    ----------
+    data : bytes
+        The received datagram.
+
+    Returns
+    -------
+    tuple
+        The message type and the body bytes.
+
+    """
+    if len(data) < 2:
+        raise ValueError("MQTT-SN datagram too short.")
+    if data[0] == 0x01:
+        if len(data) < 4:
+            raise ValueError("MQTT-SN datagram too short.")
+        length = struct.unpack("!H", data[1:3])[0]
+        header = 3
+    else:
+        length = data[0]
+        header = 1
+    if length > len(data) or length < header + 1:
+        raise ValueError("MQTT-SN length field does not match datagram.")
+    return data[header], bytes(data[header + 1:length])
+
+
+def topic_matches(topic_filter, topic):
+    """Check whether a topic name matches a subscription filter.
+
+    Both the single-level `+` and multi-level `#` wildcards are supported.
+
+    """
+    if topic_filter == topic:
+        return True
+    filter_levels = topic_filter.split('/')
+    topic_levels = topic.split('/')
+    for i, level in enumerate(filter_levels):
+        if level == '#':
+            return True
+        if i >= len(topic_levels):
+            return False
+        if level != '+' and level != topic_levels[i]:
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+class _Session:
+    """Per-client state kept by the gateway.
+
+    Slots keep each session small, since a gateway may hold many of them.
+    Each `inflight` entry is the packet to retransmit for an unacknowledged
+    message ID, the time it was last sent and the number of retries.
+
+    """
+    __slots__ = ('client_id', 'duration', 'last_seen', 'subscriptions',
+                 'registered', 'inflight', 'awaiting_rel', 'next_msg_id')
+
+    def __init__(self, client_id, duration):
+        self.client_id = client_id
+        self.duration = duration
+        self.last_seen = time.monotonic()
+        self.subscriptions = {}
+        self.registered = set()
+        self.inflight = {}
+        self.awaiting_rel = {}
+        self.next_msg_id = 0
+
+    def new_msg_id(self):
+        self.next_msg_id = self.next_msg_id % 0xFFFF + 1
+        return self.next_msg_id
+
+    def expired(self, now):
+        return self.duration and now - self.last_seen > 1.5 * self.duration
+
+    def track(self, pending, msg_id, value, limit):
+        """Add an entry to `inflight` or `awaiting_rel`, dropping the oldest
+        one beyond `limit`; return the number of entries dropped."""
+        dropped = 0
+        while len(pending) >= limit:
+            del pending[next(iter(pending))]
+            dropped += 1
+        pending[msg_id] = value
+        return dropped
+
+
+class _GatewayProtocol(asyncio.DatagramProtocol):
+    def __init__(self, gateway):
+        self.gateway = gateway
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        for packet, dst in self.gateway.handle(data, addr):
+            self.transport.sendto(packet, dst)
+
+
+class MQTTSNGateway:
+    """Asyncio MQTT-SN gateway.
+
+    The gateway supports CONNECT, REGISTER, PUBLISH at QoS 0, 1 and 2,
+    SUBSCRIBE, PINGREQ and DISCONNECT. Topic IDs are allocated gateway-wide,
+    so every client sees the same ID for the same topic name.
+
+    QoS 1 and 2 messages sent to subscribers are retransmitted, with the
+    DUP flag set, every `retry_interval` seconds until acknowledged, up to
+    `max_retries` times. At most `max_inflight` of them are kept per
+    session; beyond that the oldest one is given up.
+
+    Attributes
+    ----------
+    host : str
+        The address the UDP socket is bound to.
+    port : int
+        The MQTT-SN port number.
+    max_connections : int
+        Max number of client sessions held at the same time.
+    sessions : dict
+        The client sessions, keyed by the client (host, port) address.
+    retry_interval : float
+        Seconds before an unacknowledged message is sent again.
+    max_retries : int
+        Number of retransmissions before a message is given up.
+    max_inflight : int
+        Number of unacknowledged messages kept per session.
+    stats : dict
+        Counters for connects, publishes in and out, retransmissions, and
+        dropped and expired messages.
+
+    """
+    def __init__(self, host='0.0.0.0', port=1884, max_connections=100,
+                 retry_interval=5.0, max_retries=3, max_inflight=32):
+        """Initialize the gateway without opening any socket.
+
+        Parameters
+        ----------
+        host : str
+            The address to bind the UDP socket to.
+        port : int
+            MQTT-SN port number.
+        max_connections : int
+            Max number of client sessions held at the same time.
+        retry_interval : float
+            Seconds before an unacknowledged message is sent again.
+        max_retries : int
+            Number of retransmissions before a message is given up.
+        max_inflight : int
+            Number of unacknowledged messages kept per session.
+
+        """
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.retry_interval = retry_interval
+        self.max_retries = max_retries
+        self.max_inflight = max_inflight
+        self.sessions = {}
+        self.topic_ids = {}
+        self.topic_names = {}
+        self.stats = {'connects': 0, 'publishes_in': 0,
+                      'publishes_out': 0, 'retransmits': 0, 'dropped': 0,
+                      'expired': 0}
+        self._retry_handle = None
+        self._transport = None
+        self._loop = None
+        self._thread = None
+
+    def topic_id(self, topic):
+        """Return the topic ID of a topic name, allocating it if needed."""
+        topic_id = self.topic_ids.get(topic)
+        if topic_id is None:
+            topic_id = len(self.topic_ids) + 1
+            self.topic_ids[topic] = topic_id
+            self.topic_names[topic_id] = topic
+        return topic_id
+
+    def handle(self, data, addr):
+        """Process one datagram received from a client.
+
+        Parameters
+        ----------
+        data : bytes
+            The received datagram.
+        addr : tuple
+            The (host, port) address of the client.
+
+        Returns
+        -------
+        list
+            A list of (packet, address) tuples to send back.
+
+        """
+        try:
+            msg_type, body = decode_packet(data)
+        except ValueError:
+            self.stats['dropped'] += 1
+            return []
+        handler = self._handlers.get(msg_type)
+        session = self.sessions.get(addr)
+        if handler is None or (session is None and msg_type != CONNECT):
+            if msg_type == PUBLISH and body and (body[0] >> 5) & 0x3 == 3:
+                return self._publish_qos_minus_one(body)
+            self.stats['dropped'] += 1
+            return []
+        if session is not None:
+            session.last_seen = time.monotonic()
+        try:
+            return handler(self, session, body, addr)
+        except (struct.error, IndexError, UnicodeDecodeError):
+            self.stats['dropped'] += 1
+            return []
+
+    def _connect(self, session, body, addr):
+        flags, _, duration = struct.unpack("!BBH", body[:4])
+        client_id = body[4:].decode()
+        if session is None:
+            now = time.monotonic()
+            for key in [k for k, s in self.sessions.items() if s.expired(now)]:
+                del self.sessions[key]
+            if len(self.sessions) >= self.max_connections:
+                return [(encode_packet(CONNACK, bytes([RC_CONGESTION])),
+                         addr)]
+        if session is None or flags & 0x04:
+            session = _Session(client_id, duration)
+            self.sessions[addr] = session
+        session.client_id = client_id
+        session.duration = duration
+        self.stats['connects'] += 1
+        return [(encode_packet(CONNACK, bytes([RC_ACCEPTED])), addr)]
+
+    def _register(self, session, body, addr):
+        _, msg_id = struct.unpack("!HH", body[:4])
+        topic_id = self.topic_id(body[4:].decode())
+        session.registered.add(topic_id)
+        return [(encode_packet(REGACK, struct.pack("!HHB", topic_id, msg_id,
+                                                   RC_ACCEPTED)), addr)]
+
+    def _resolve_topic(self, flags, raw_topic_id):
+        topic_type = flags & 0x03
+        if topic_type == TOPIC_SHORT:
+            return struct.pack("!H", raw_topic_id).decode()
+        return self.topic_names.get(raw_topic_id)
+
+    def _publish(self, session, body, addr):
+        flags = body[0]
+        qos = (flags >> 5) & 0x03
+        topic_id, msg_id = struct.unpack("!HH", body[1:5])
+        message = body[5:]
+        topic = self._resolve_topic(flags, topic_id)
+        if topic is None:
+            self.stats['dropped'] += 1
+            return [(encode_packet(PUBACK, struct.pack(
+                "!HHB", topic_id, msg_id, RC_INVALID_TOPIC)), addr)]
+        self.stats['publishes_in'] += 1
+        if qos == 2:
+            self.stats['expired'] += session.track(
+                session.awaiting_rel, msg_id, (topic, message),
+                self.max_inflight)
+            return [(encode_packet(PUBREC, struct.pack("!H", msg_id)), addr)]
+        out = self._deliver(topic, message, qos)
+        if qos == 1:
+            out.append((encode_packet(PUBACK, struct.pack(
+                "!HHB", topic_id, msg_id, RC_ACCEPTED)), addr))
+        return out
+
+    def _publish_qos_minus_one(self, body):
+        topic_id = struct.unpack("!H", body[1:3])[0]
+        topic = self._resolve_topic(body[0], topic_id)
+        if topic is None:
+            self.stats['dropped'] += 1
+            return []
+        self.stats['publishes_in'] += 1
+        return self._deliver(topic, body[5:], 0)
+
+    def _pubrel(self, session, body, addr):
+        msg_id = struct.unpack("!H", body[:2])[0]
+        out = []
+        pending = session.awaiting_rel.pop(msg_id, None)
+        if pending is not None:
+            out = self._deliver(pending[0], pending[1], 2)
+        out.append((encode_packet(PUBCOMP, struct.pack("!H", msg_id)), addr))
+        return out
+
+    def _ack(self, session, body, addr):
+        # PUBACK carries the topic ID before the message ID
+        offset = 2 if len(body) == 5 else 0
+        msg_id = struct.unpack("!H", body[offset:offset + 2])[0]
+        session.inflight.pop(msg_id, None)
+        return []
+
+    def _pubrec(self, session, body, addr):
+        msg_id = struct.unpack("!H", body[:2])[0]
+        packet = encode_packet(PUBREL, struct.pack("!H", msg_id))
+        # from now on PUBREL is retransmitted until PUBCOMP
+        if msg_id in session.inflight:
+            session.inflight[msg_id] = [packet, time.monotonic(), 0]
+        return [(packet, addr)]
+
+    def _subscribe(self, session, body, addr):
+        flags = body[0]
+        qos = min((flags >> 5) & 0x03, 2)
+        msg_id = struct.unpack("!H", body[1:3])[0]
+        topic_type = flags & 0x03
+        if topic_type == TOPIC_PREDEFINED:
+            topic = self.topic_names.get(struct.unpack("!H", body[3:5])[0])
+        else:
+            topic = body[3:].decode()
+        if topic is None:
+            return [(encode_packet(SUBACK, struct.pack(
+                "!BHHB", 0, 0, msg_id, RC_INVALID_TOPIC)), addr)]
+        session.subscriptions[topic] = qos
+        topic_id = 0
+        if '+' not in topic and '#' not in topic:
+            topic_id = self.topic_id(topic)
+            session.registered.add(topic_id)
+        return [(encode_packet(SUBACK, struct.pack(
+            "!BHHB", qos << 5, topic_id, msg_id, RC_ACCEPTED)), addr)]
+
+    def _pingreq(self, session, body, addr):
+        return [(encode_packet(PINGRESP), addr)]
+
+    def _disconnect(self, session, body, addr):
+        del self.sessions[addr]
+        return [(encode_packet(DISCONNECT), addr)]
+
+    def _deliver(self, topic, message, qos):
+        out = []
+        topic_id = None
+        for addr, session in self.sessions.items():
+            sub_qos = None
+            for topic_filter, filter_qos in session.subscriptions.items():
+                if topic_matches(topic_filter, topic):
+                    sub_qos = max(filter_qos, sub_qos or 0)
+            if sub_qos is None:
+                continue
+            if topic_id is None:
+                topic_id = self.topic_id(topic)
+            if topic_id not in session.registered:
+                session.registered.add(topic_id)
+                out.append((encode_packet(REGISTER, struct.pack(
+                    "!HH", topic_id, session.new_msg_id()) +
+                    topic.encode()), addr))
+            out_qos = min(qos, sub_qos)
+            msg_id = session.new_msg_id() if out_qos else 0
+            header = struct.pack("!HH", topic_id, msg_id)
+            packet = encode_packet(PUBLISH, bytes([out_qos << 5]) + header +
+                                   message)
+            if out_qos:
+                retry = encode_packet(PUBLISH, bytes(
+                    [out_qos << 5 | FLAG_DUP]) + header + message)
+                self.stats['expired'] += session.track(
+                    session.inflight, msg_id, [retry, time.monotonic(), 0],
+                    self.max_inflight)
+            self.stats['publishes_out'] += 1
+            out.append((packet, addr))
+        return out
+
+    _handlers = {
+        CONNECT: _connect,
+        REGISTER: _register,
+        REGACK: _ack,
+        PUBLISH: _publish,
+        PUBACK: _ack,
+        PUBREC: _pubrec,
+        PUBREL: _pubrel,
+        PUBCOMP: _ack,
+        SUBSCRIBE: _subscribe,
+        PINGREQ: _pingreq,
+        DISCONNECT: _disconnect,
+    }
+
+    def retransmit(self, now=None):
+        """Return the unacknowledged messages due for a retransmission.
+
+        Messages already retransmitted `max_retries` times are given up.
+
+        Returns
+        -------
+        list
+            A list of (packet, address) tuples to send again.
+
+        """
+        now = time.monotonic() if now is None else now
+        out = []
+        for addr, session in self.sessions.items():
+            inflight = session.inflight
+            for msg_id, entry in list(inflight.items()):
+                packet, sent, retries = entry
+                if now - sent < self.retry_interval:
+                    continue
+                if retries >= self.max_retries:
+                    del inflight[msg_id]
+                    self.stats['expired'] += 1
+                    continue
+                entry[1] = now
+                entry[2] = retries + 1
+                self.stats['retransmits'] += 1
+                out.append((packet, addr))
+        return out
+
+    def _retry(self):
+        transport = self._transport
+        if transport is None:
+            return
+        for packet, addr in self.retransmit():
+            transport.sendto(packet, addr)
+        self._retry_handle = asyncio.get_event_loop().call_later(
+            self.retry_interval / 2, self._retry)
+
+    async def start(self):
+        """Bind the UDP socket on the running event loop."""
+        loop = asyncio.get_event_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _GatewayProtocol(self), local_addr=(self.host, self.port))
+        self._retry_handle = loop.call_later(self.retry_interval / 2,
+                                             self._retry)
+
+    def stop(self):
+        """Close the UDP socket opened by `start()`."""
+        if self._retry_handle is not None:
+            self._retry_handle.cancel()
+            self._retry_handle = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def open(self, timeout=1.0):
+        """Run the gateway on its own event loop in a background thread.
+
+        This method returns as soon as the UDP socket is bound.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait for the socket to be bound.
+
+        """
+        if self._thread is not None:
+            return
+        ready = threading.Event()
+        abandoned = threading.Event()
+        errors = []
+        loop = self._loop = asyncio.new_event_loop()
+
+        def run():
+            try:
+                loop.run_until_complete(self.start())
+            except (OSError, RuntimeError) as err:
+                # RuntimeError: stopped by open() on timeout
+                errors.append(err)
+            else:
+                ready.set()
+                if not abandoned.is_set():
+                    loop.run_forever()
+            self.stop()
+            # the transport closes its socket in a callback of the loop
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+            ready.set()
+
+        self._thread = threading.Thread(target=run, daemon=True,
+                                        name="mqttsn-gateway")
+        self._thread.start()
+        if not ready.wait(timeout) or errors:
+            abandoned.set()
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except RuntimeError:
+                pass  # the thread has already closed the loop
+            self._thread.join()
+            self._thread = None
+            self._loop = None
+            raise OSError("Cannot open MQTT-SN gateway on port {}: {}".format(
+                self.port, errors[0] if errors else "timed out"))
+
+    def close(self):
+        """Stop the background event loop started by `open()`."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._loop = None
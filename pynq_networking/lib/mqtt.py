@@ -205,6 +205,9 @@ MQTT_PACKET_TYPES = [
     MQTT_DISCONNECT]
 
 
+MQTT_PAYLOAD_CLASSES = {t.type: t for t in MQTT_PACKET_TYPES}
+
+
 class MQTTLenField(ShortField):
     """ MQTT length field.
 
@@ -289,6 +292,24 @@ class MQTT(Packet):
             return 1
         return 0
 
+    def guess_payload_class(self, payload):
+        """Find the payload class from the type field.
+
+        A dict lookup replaces the linear scan of `payload_guess`, so the 
+        dissection cost does not depend on the number of packet types.
+
+        """
+        cls = MQTT_PAYLOAD_CLASSES.get(self.type)
+        if cls is None:
+            return Packet.guess_payload_class(self, payload)
+        return cls
+
+
+# Let each message type fill in the type field when stacked on MQTT
+for _cls in MQTT_PACKET_TYPES:
+    _cls.overload_fields = dict(_cls.overload_fields)
+    _cls.overload_fields[MQTT] = {'type': _cls.type}
+
 
 class MQTT_Stream(Packet):
     """MQTT stream class.
@@ -286,18 +286,23 @@ MQTTSN_PACKET_TYPES = [MQTTSN_ADVERTISE,
                        MQTTSN_WILLMSGRESP]
 
 
+MQTTSN_PAYLOAD_CLASSES = {t.type: t for t in MQTTSN_PACKET_TYPES}
+
+
 class MQTTSN_LenField(ShortField):
     """An MQTTSN Length field.
     
     It uses a variable-length encoding. Short lengths are one byte, longer 
-    lengths are 3 bytes. This works because the minimum length is 2, including 
-    the type field and the length field itself.
+    lengths are 3 bytes: 0x01 followed by the length on 2 bytes, in network
+    byte order. This works because the minimum length is 2, including 
+    the type field and the length field itself. The length always counts 
+    the whole message, so it includes the 3 bytes of a long length field.
 
     """
     def i2len(self, pkt, x):
         """Convert internal value to a length usable by a FieldLenField"""
         m = self.i2m(pkt, x)
-        if m <= 256:
+        if m <= 255:
             return 1
         else:
             return 3
@@ -306,22 +311,24 @@ class MQTTSN_LenField(ShortField):
         l = x
         if x is None:
             l = len(pkt.payload) + 2
+            if l > 255:
+                l = l + 2
         return l
 
     def addfield(self, pkt, s, val):
         """Add an internal value  to a string"""
         v = self.i2m(pkt,val)
-        if v <= 256:
-            return s+struct.pack("B", v)
+        if v <= 255:
+            return s + struct.pack("B", v)
         else:
-            return "\x01" + struct.pack("H", v)
+            return s + struct.pack("!BH", 0x01, v)
 
     def getfield(self, pkt, s):
         """Extract an internal value from a string"""
         i = struct.unpack("B", s[:1])[0]
         s2 = s[1:]
         if i == 1:
-                i = struct.unpack("H", s2[:2])[0]
+                i = struct.unpack("!H", s2[:2])[0]
                 s2 = s2[2:]
         return s2, i
    
@@ -352,4 +359,20 @@ class MQTTSN(Packet):
             return 1
         return 0
 
+    def guess_payload_class(self, payload):
+        """Find the payload class from the type field.
+
+        A dict lookup replaces the linear scan of `payload_guess`, so the 
+        dissection cost does not depend on the number of packet types.
+
+        """
+        cls = MQTTSN_PAYLOAD_CLASSES.get(self.type)
+        if cls is None:
+            return Packet.guess_payload_class(self, payload)
+        return cls
+
 
+# Let each message type fill in the type field when stacked on MQTTSN
+for _cls in MQTTSN_PACKET_TYPES:
+    _cls.overload_fields = dict(_cls.overload_fields)
+    _cls.overload_fields[MQTTSN] = {'type': _cls.type}
@@ -35,6 +35,7 @@ from kamene.all import *
 from .pynqsocket import L2PynqSocket
 from .broker import ip_str_to_int, mac_str_to_int, int_2_ip_str
 from .mqttsn import *
+from .bindings import bind_mqttsn
 from .accelerator import Accelerator
 
 
@@ -119,9 +120,10 @@ class MQTT_Client_PL:
         self.local_mac_str = LOCAL_MAC_STR
         self.local_mac_int = mac_str_to_int(self.local_mac_str)
         self.frame = None
+        bind_mqttsn([server_port])
 
         self.socket = conf.L2PynqSocket()
-        self.accel = Accelerator()
+        self.accel = Accelerator(verbose=bool(verbose))
 
     def __enter__(self):
         self.connect()
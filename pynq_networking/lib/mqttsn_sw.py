@@ -33,6 +33,7 @@ import logging
 logging.getLogger("kamene.runtime").setLevel(logging.ERROR)
 from kamene.all import *
 from .mqttsn import *
+from .bindings import bind_mqttsn
 
 
 __author__ = "Stephen Neuendorffer"
@@ -61,6 +62,7 @@ class MQTT_Client:
         self.serverPort = serverPort
         self.client = name
         self.verbose = verbose
+        bind_mqttsn([serverPort])
 
     def __enter__(self):
         try:
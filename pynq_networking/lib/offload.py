@@ -0,0 +1,296 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from .accelerator_jobs import AcceleratorJobQueue, job_cancelled
+from .arbiter import ACCELERATOR
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+HARDWARE = 'hw'
+SOFTWARE = 'sw'
+
+
+class _PathStats:
+    """Latency and throughput statistics of one publish path."""
+    __slots__ = ('requests', 'events', 'failed', 'cancelled', 'rate',
+                 'latencies')
+
+    def __init__(self, rate, history):
+        self.requests = 0
+        self.events = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rate = rate
+        self.latencies = deque(maxlen=history)
+
+    def record(self, events, latency, busy, smoothing):
+        self.requests += 1
+        self.events += events
+        self.latencies.append(latency)
+        if events and busy > 0:
+            self.rate += smoothing * (events / busy - self.rate)
+
+    def snapshot(self):
+        latencies = sorted(self.latencies)
+        n = len(latencies)
+        return {'requests': self.requests,
+                'events': self.events,
+                'failed': self.failed,
+                'cancelled': self.cancelled,
+                'events_per_second': self.rate,
+                'latency_mean': sum(latencies) / n if n else 0.0,
+                'latency_p50': latencies[n // 2] if n else 0.0,
+                'latency_p99': latencies[min(n - 1, n * 99 // 100)]
+                if n else 0.0}
+
+
+class PublishScheduler:
+    """Scheduler routing publishes between the PL and the software path.
+
+    Ad-hoc messages can only be built in software and always go through
+    `publish_sw()`. Sensor streams can go either way; each one is sent to
+    the path expected to finish it first, given the events already queued
+    on that path and its measured events per second. The hardware path is
+    skipped while another owner holds the network IOP, and streams shorter
+    than `hw_min_count` stay in software, where there is no reset cycle.
+
+    Every request returns a `concurrent.futures.Future`.
+
+    Attributes
+    ----------
+    client : MQTT_Client_PL
+        The connected client, providing both publish paths.
+    net_iop : NetworkIOP
+        The network IOP object used by the accelerator.
+    sensor_iop : Pmod_TMP2
+        The temperature sensor object the streams are read from.
+    jobs : AcceleratorJobQueue
+        The worker running the hardware publishes.
+
+    """
+    def __init__(self, client, net_iop, sensor_iop, frame_size=100,
+                 hw_min_count=16, hw_rate=1000.0, sw_rate=50.0,
+                 smoothing=0.2, history=256):
+        """Start the software worker and the accelerator job queue.
+
+        Parameters
+        ----------
+        client : MQTT_Client_PL
+            The connected client, providing both publish paths.
+        net_iop : NetworkIOP
+            The network IOP object used by the accelerator.
+        sensor_iop : Pmod_TMP2
+            The temperature sensor object the streams are read from.
+        frame_size : int
+            The size of the frames generated by the accelerator.
+        hw_min_count : int
+            Shortest sensor stream worth a hardware run.
+        hw_rate : float
+            Initial estimate of the hardware events per second.
+        sw_rate : float
+            Initial estimate of the software events per second.
+        smoothing : float
+            Weight of the last request in the measured rates.
+        history : int
+            Number of latencies kept per path.
+
+        """
+        self.client = client
+        self.net_iop = net_iop
+        self.sensor_iop = sensor_iop
+        self.frame_size = frame_size
+        self.hw_min_count = hw_min_count
+        self.smoothing = smoothing
+        self.jobs = AcceleratorJobQueue(client.accel)
+        self._stats = {HARDWARE: _PathStats(hw_rate, history),
+                       SOFTWARE: _PathStats(sw_rate, history)}
+        self._backlog = {HARDWARE: 0, SOFTWARE: 0}
+        self._hw_last_done = 0.0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="publish-scheduler")
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.shutdown()
+
+    def _finish_time(self, path, count):
+        stats = self._stats[path]
+        return (self._backlog[path] + count) / stats.rate
+
+    def route(self, count):
+        """Return the path a sensor stream of `count` events would take."""
+        if count < self.hw_min_count:
+            return SOFTWARE
+        owner = self.client.accel.arbiter.owner
+        with self._lock:
+            if owner not in (None, ACCELERATOR):
+                return SOFTWARE
+            if self._finish_time(HARDWARE, count) <= \
+                    self._finish_time(SOFTWARE, count):
+                return HARDWARE
+            return SOFTWARE
+
+    def publish(self, topic_id, message, qos=0):
+        """Publish an ad-hoc message through the software path.
+
+        Returns
+        -------
+        Future
+            Resolves to the value returned by `publish_sw()`.
+
+        """
+        return self._submit_sw(1, (topic_id, message, qos))
+
+    def publish_sensor(self, topic_id, count, qos=0):
+        """Publish `count` values of the sensor on the best path.
+
+        Returns
+        -------
+        Future
+            Resolves to the accelerator counters for a hardware run, or to
+            the number of values published in software.
+
+        """
+        if self.route(count) == SOFTWARE:
+            return self._submit_sw(count, (topic_id, None, qos))
+        client = self.client
+        with self._lock:
+            self._backlog[HARDWARE] += count
+        submitted = time.monotonic()
+        future = self.jobs.submit(self.frame_size, count,
+                                  client.local_mac_int, client.local_ip_int,
+                                  client.server_ip_int, client.server_port,
+                                  topic_id, qos, client.verbose,
+                                  self.net_iop, self.sensor_iop)
+        future.add_done_callback(
+            lambda f: self._hw_done(f, count, submitted))
+        return future
+
+    def _hw_done(self, future, count, submitted):
+        now = time.monotonic()
+        with self._lock:
+            self._backlog[HARDWARE] -= count
+            stats = self._stats[HARDWARE]
+            if job_cancelled(future):
+                stats.cancelled += 1
+                return
+            if future.exception() is not None:
+                stats.failed += 1
+                return
+            result = future.result()
+            events = result.get('events_completed', count)
+            # runs are serialized, so the busy time is bounded by the time
+            # since the previous hardware run finished
+            busy = now - max(submitted, self._hw_last_done)
+            self._hw_last_done = now
+            stats.record(events, now - submitted, busy, self.smoothing)
+
+    def _submit_sw(self, count, request):
+        future = Future()
+        with self._lock:
+            self._backlog[SOFTWARE] += count
+        self._queue.put((future, count, request, time.monotonic()))
+        return future
+
+    def _run(self):
+        client = self.client
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, count, (topic_id, message, qos), submitted = item
+            try:
+                if not future.set_running_or_notify_cancel():
+                    with self._lock:
+                        self._stats[SOFTWARE].cancelled += 1
+                    continue
+                started = time.monotonic()
+                try:
+                    if message is not None:
+                        result = client.publish_sw(topic_id, message, qos)
+                    else:
+                        result = 0
+                        for _ in range(count):
+                            value = client.accel.read_sensor(self.sensor_iop)
+                            if client.publish_sw(topic_id, str(value), qos):
+                                result += 1
+                except BaseException as err:
+                    with self._lock:
+                        self._stats[SOFTWARE].failed += 1
+                    future.set_exception(err)
+                else:
+                    now = time.monotonic()
+                    with self._lock:
+                        self._stats[SOFTWARE].record(
+                            count, now - submitted, now - started,
+                            self.smoothing)
+                    future.set_result(result)
+            finally:
+                with self._lock:
+                    self._backlog[SOFTWARE] -= count
+
+    def stats(self):
+        """Return the statistics of both paths.
+
+        Returns
+        -------
+        dict
+            For `HARDWARE` and `SOFTWARE`: the requests, events, failures
+            and cancellations handled, the measured events per second, the
+            latencies from submission to completion, and the events still
+            queued.
+
+        """
+        with self._lock:
+            result = {}
+            for path, stats in self._stats.items():
+                result[path] = stats.snapshot()
+                result[path]['backlog'] = self._backlog[path]
+            return result
+
+    def shutdown(self, wait=True):
+        """Stop both workers once the queued requests are done."""
+        self._queue.put(None)
+        self.jobs.shutdown(wait)
+        if wait:
+            self._thread.join()
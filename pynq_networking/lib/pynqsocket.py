@@ -28,10 +28,18 @@
 #   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+import asyncio
+import os
+import select
+import threading
+import time
+from collections import deque
 import logging
 logging.getLogger("kamene.runtime").setLevel(logging.ERROR)
 from kamene.all import *
 from .slurper import PacketSlurper
+from .arbiter import get_arbiter
+from .buffer_pool import BufferPool
 
 
 __author__ = "Stephen Neuendorffer, Yun Rock Qu"
@@ -39,20 +47,210 @@ __copyright__ = "Copyright 2017, Xilinx"
 __email__ = "stephenn@xilinx.com"
 
 
+def _event_fd():
+    """Return the read and write ends of a counting event descriptor.
+
+    Each write of 1 makes one read succeed, so the descriptor stays 
+    readable exactly as long as frames are queued. An eventfd is used when
+    available, a pipe otherwise.
+
+    """
+    if hasattr(os, 'eventfd'):
+        fd = os.eventfd(0, os.EFD_SEMAPHORE | os.EFD_NONBLOCK |
+                        os.EFD_CLOEXEC)
+        return fd, fd
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    return read_fd, write_fd
+
+
 class L2PynqSocket(SuperSocket):
     """A kamene-like socket object that reads and writes packets.
     
     The packets will be accessed using the PYNQ NetworkIOP interface;
     i.e., read/write packets at layer 2 using PYNQ bypass.
 
+    `fileno()` starts a drain thread moving the received frames into a 
+    queue and returns a descriptor that is readable while the queue is not
+    empty, so the socket can be used with `select`, asyncio or `sniff()`.
+
+    The drain thread receives into the buffers of a fixed `BufferPool`, so
+    the steady-state receive path does not allocate; `recv_into()` and 
+    `recv_buffer()` hand the frames out without building packets. While 
+    every buffer is in use, frames are left in the interface. The pool is
+    only allocated when the drain thread starts, and only one socket at a
+    time may drain the interface, since all of them share it.
+
+    With a `DissectionCache`, frames seen before are returned as read-only
+    views of the packet built the first time.
+
     """
     _slurper = PacketSlurper()
+    _draining = None
+    _draining_lock = threading.Lock()
 
-    def __init__(self, iface=None, type=ETH_P_ALL, filter=None, nofilter=0):
+    def __init__(self, iface=None, type=ETH_P_ALL, filter=None, nofilter=0,
+                 max_pending=64, dissect_cache=None):
         if iface is None:
             self.iface = conf.iface
         self.LL = Ether
         self.slurper = L2PynqSocket._slurper
+        self.arbiter = get_arbiter()
+        self.closed = 0
+        self.max_pending = max_pending
+        self.pool = None
+        self.dissect_cache = dissect_cache
+        self._frames = deque()
+        self._read_fd = None
+        self._write_fd = None
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def _drain(self, idle_sleep):
+        slurper = self.slurper
+        frames = self._frames
+        while not self._stopping.is_set():
+            if not slurper.has_packet():
+                time.sleep(idle_sleep)
+                continue
+            buffer = self.pool.acquire()
+            if buffer is None:
+                # leave the frame to the hardware until a buffer is free
+                time.sleep(idle_sleep)
+                continue
+            length = slurper.recv_into(buffer)
+            if not length:
+                self.pool.release(buffer)
+                continue
+            frames.append((buffer, length))
+            os.write(self._write_fd, (1).to_bytes(8, 'little'))
+
+    def start_drain(self, idle_sleep=0.0001):
+        """Start moving the received frames into the socket queue.
+
+        `RuntimeError` is raised if another socket is draining the 
+        interface already.
+
+        Parameters
+        ----------
+        idle_sleep : float
+            Number of seconds to sleep when the interface has no frame.
+
+        """
+        if self._thread is not None:
+            return
+        with L2PynqSocket._draining_lock:
+            if L2PynqSocket._draining is not None:
+                raise RuntimeError("The interface is already drained by "
+                                   "another socket; close it first.")
+            L2PynqSocket._draining = self
+        if self.pool is None:
+            self.pool = BufferPool(self.max_pending, self.slurper.rx_size)
+        self._read_fd, self._write_fd = _event_fd()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._drain, args=(idle_sleep,),
+                                        daemon=True, name="l2-drain")
+        self._thread.start()
+
+    def fileno(self):
+        """Return a descriptor readable while received frames are queued.
+
+        The drain thread is started on the first call.
+
+        """
+        self.start_drain()
+        return self._read_fd
+
+    def _take(self, timeout=None):
+        if not select.select([self._read_fd], [], [], timeout)[0]:
+            return None
+        try:
+            os.read(self._read_fd, 8)
+        except BlockingIOError:
+            return None
+        return self._frames.popleft()
+
+    def _take_bytes(self, timeout=None):
+        item = self._take(timeout)
+        if item is None:
+            return None
+        buffer, length = item
+        pkt = bytes(memoryview(buffer)[:length])
+        self.pool.release(buffer)
+        return pkt
+
+    def recv_buffer(self, timeout=None):
+        """Receive a frame in a pooled buffer, without copying it.
+
+        The buffer must be given back with `release()` once used.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait, forever if `None`.
+
+        Returns
+        -------
+        tuple
+            The buffer and the length of the frame, `None` on timeout.
+
+        """
+        self.start_drain()
+        return self._take(timeout)
+
+    def release(self, buffer):
+        """Give a buffer of `recv_buffer()` back to the pool."""
+        self.pool.release(buffer)
+
+    def recv_into(self, buffer, timeout=None):
+        """Receive a frame into the given buffer.
+
+        Like `socket.recv_into()`, the frame is truncated if the buffer is
+        too small.
+
+        Parameters
+        ----------
+        buffer : bytearray/memoryview
+            A writable buffer.
+        timeout : float
+            Max number of seconds to wait, forever if `None`.
+
+        Returns
+        -------
+        int
+            The number of bytes received, 0 on timeout.
+
+        """
+        if self._thread is None:
+            deadline = None if timeout is None else time.time() + timeout
+            while not self.slurper.has_packet():
+                if deadline is not None and time.time() > deadline:
+                    return 0
+            return self.slurper.recv_into(buffer)
+        item = self._take(timeout)
+        if item is None:
+            return 0
+        pooled, length = item
+        with memoryview(buffer) as view:
+            length = min(length, view.nbytes)
+            view[:length] = memoryview(pooled)[:length]
+        self.pool.release(pooled)
+        return length
+
+    def close(self):
+        """Stop the drain thread and close the descriptor."""
+        if self.closed:
+            return
+        self.closed = 1
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+            os.close(self._read_fd)
+            if self._write_fd != self._read_fd:
+                os.close(self._write_fd)
+            with L2PynqSocket._draining_lock:
+                L2PynqSocket._draining = None
 
     def flush(self):
         """Flush any packets buffered up in the interface.
@@ -73,6 +271,8 @@ class L2PynqSocket(SuperSocket):
 
     def has_packet(self):
         """Return true if the interface has a packet to read. """
+        if self._thread is not None:
+            return len(self._frames) > 0
         return self.slurper.has_packet()
 
     def srp1(self, outframe, valid_ack, ptype):
@@ -99,24 +299,74 @@ class L2PynqSocket(SuperSocket):
         This function blocks until a frame is received.
 
         """
-        pkt = self.slurper.recv()
+        if self._thread is not None:
+            pkt = self._take_bytes()
+        else:
+            pkt = self.slurper.recv()
+        return self._dissect(pkt)
+
+    def _build(self, pkt):
         try:
-            q = self.LL(pkt)
+            return self.LL(pkt)
         except KeyboardInterrupt:
             raise
         except:
             if conf.debug_dissector:
                 raise
-            q = conf.raw_layer(pkt)
+            return conf.raw_layer(pkt)
+
+    def _dissect(self, pkt):
+        if self.dissect_cache is None:
+            q = self._build(pkt)
+        else:
+            q = self.dissect_cache.dissect(pkt, self._build)
         q.time = time.time()
         return q
 
+    async def recv_async(self):
+        """Receive a frame without blocking the event loop."""
+        loop = asyncio.get_event_loop()
+        fd = self.fileno()
+        while True:
+            future = loop.create_future()
+
+            def ready():
+                loop.remove_reader(fd)
+                if not future.done():
+                    future.set_result(self._take_bytes(0))
+
+            loop.add_reader(fd, ready)
+            try:
+                pkt = await future
+            finally:
+                loop.remove_reader(fd)
+            if pkt is not None:
+                return self._dissect(pkt)
+
     def send(self, x):
         """Send a frame.
 
-        This function blocks until the frame has been sent.
+        The frame goes through the network IOP arbiter: while the 
+        accelerator owns the interface, it is queued and sent between two
+        accelerator events.
+
+        Besides packets, bytes-like objects and lists of segments, such as
+        a header template and a payload buffer, are written to the TX 
+        window without building the whole frame first.
+
+        Returns
+        -------
+        Bool
+            True if the frame has been written, False if it is queued.
+
+        Raises
+        ------
+        queue.Full
+            If the frame is dropped because the arbiter queue is full.
 
         """
-        if hasattr(x, "sent_time"):
-            x.sent_time = time.time()
-        return self.slurper.send(bytes(x))
+        if isinstance(x, Packet):
+            if hasattr(x, "sent_time"):
+                x.sent_time = time.time()
+            x = bytes(x)
+        return self.arbiter.send(x)
@@ -0,0 +1,195 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import bisect
+import hashlib
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def _hash(key):
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], 'big')
+
+
+class TopicRouter:
+    """Consistent hash ring mapping topic names to broker instances.
+
+    Each node is placed on the ring several times, so topics spread evenly
+    and only a small share of them move when a node is added or removed. 
+    The points of a node are hashed from its name, so a node removed and
+    added again owns the same topics as before, whatever the order.
+
+    Attributes
+    ----------
+    nodes : list
+        The nodes on the ring, for example broker endpoints or clients.
+    replicas : int
+        Number of points each node occupies on the ring.
+    key : function
+        Returns the name of a node, `str` by default.
+
+    """
+    def __init__(self, nodes=(), replicas=64, key=str):
+        """Build the hash ring.
+
+        Parameters
+        ----------
+        nodes : list
+            The nodes to place on the ring.
+        replicas : int
+            Number of points each node occupies on the ring.
+        key : function
+            Returns the name of a node; nodes must have distinct names.
+
+        """
+        self.nodes = []
+        self.replicas = replicas
+        self.key = key
+        self._keys = []
+        self._ring = {}
+        for node in nodes:
+            self.add_node(node)
+
+    def _points(self, node):
+        name = self.key(node)
+        return [_hash("{}-{}".format(name, replica))
+                for replica in range(self.replicas)]
+
+    def add_node(self, node):
+        """Place a node on the ring."""
+        name = self.key(node)
+        if any(self.key(other) == name for other in self.nodes):
+            raise ValueError("Node {} already on the ring.".format(name))
+        self.nodes.append(node)
+        for key in self._points(node):
+            self._ring[key] = node
+            bisect.insort(self._keys, key)
+
+    def remove_node(self, node):
+        """Remove a node from the ring."""
+        self.nodes.remove(node)
+        for key in self._points(node):
+            if self._ring.get(key) is node:
+                del self._ring[key]
+                self._keys.remove(key)
+
+    def route(self, topic):
+        """Return the node owning the given topic name."""
+        if not self._keys:
+            raise ValueError("No node available on the ring.")
+        position = bisect.bisect(self._keys, _hash(topic)) % len(self._keys)
+        return self._ring[self._keys[position]]
+
+
+def _endpoint(client):
+    """Return the broker endpoint of `MQTT_Client` or `MQTT_Client_PL`."""
+    ip = getattr(client, 'server_ip', getattr(client, 'serverIP', None))
+    port = getattr(client, 'server_port', getattr(client, 'serverPort', None))
+    if ip is None or port is None:
+        return str(client)
+    return "{}:{}".format(ip, port)
+
+
+class ShardedClient:
+    """MQTT-SN client spreading topics across several broker instances.
+
+    It wraps one client per broker instance, either `MQTT_Client` or
+    `MQTT_Client_PL`, and routes every topic to one of them through a
+    `TopicRouter`. Topics are published by name; the topic ID returned by
+    the owning instance is cached on the first use. Clients are placed on
+    the ring by the address and port of their broker instance, so every 
+    process routes a topic to the same instance.
+
+    """
+    def __init__(self, clients, replicas=64):
+        """Initialize the client from one client per broker instance.
+
+        Parameters
+        ----------
+        clients : list
+            The clients, one per broker instance.
+        replicas : int
+            Number of points each client occupies on the hash ring.
+
+        """
+        self.clients = list(clients)
+        self.router = TopicRouter(self.clients, replicas, key=_endpoint)
+        self.topics = {}
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.disconnect()
+
+    def connect(self):
+        """Connect every client to its broker instance."""
+        return all([client.connect() is not False
+                    for client in self.clients])
+
+    def disconnect(self):
+        """Disconnect every client from its broker instance."""
+        for client in self.clients:
+            client.disconnect()
+
+    def client(self, topic):
+        """Return the client owning the given topic name."""
+        return self.router.route(topic)
+
+    def register(self, topic):
+        """Register the topic with the broker instance owning it.
+
+        Returns
+        -------
+        int
+            The topic ID on the owning broker instance.
+
+        """
+        if topic not in self.topics:
+            client = self.client(topic)
+            self.topics[topic] = (client, client.register(topic))
+        return self.topics[topic][1]
+
+    def publish(self, topic, message, qos=1):
+        """Publish the message on the broker instance owning the topic.
+
+        Returns
+        -------
+        Bool
+            True if the publish succeeds.
+
+        """
+        self.register(topic)
+        client, topic_id = self.topics[topic]
+        publish = getattr(client, 'publish_sw', None) or client.publish
+        return publish(topic_id, message, qos)
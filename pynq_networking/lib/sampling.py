@@ -0,0 +1,319 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import heapq
+import queue
+import threading
+import time
+import numpy as np
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def encode_block(block):
+    """Encode a block of samples into a publish message.
+
+    The message is the timestamp of the first sample as a little-endian
+    double, followed by every sample value as a little-endian float.
+
+    """
+    return block[0, 0].astype('<f8').tobytes() + \
+        block[:, 1].astype('<f4').tobytes()
+
+
+class BatchPublisher:
+    """Publisher of sample blocks running on its own thread.
+
+    Blocks are queued by the samplers and published one message per block
+    through the software path of the client, so the samplers never wait on
+    the network. Several samplers can share one publisher.
+
+    Attributes
+    ----------
+    client : MQTT_Client/MQTT_Client_PL/ShardedClient
+        The client the blocks are published through.
+    qos : int
+        The MQTTSN qos of the publishes.
+    encode : function
+        Turns a block into the message to publish.
+    stats : dict
+        Number of blocks published, failed and dropped on a full queue.
+
+    """
+    def __init__(self, client, qos=0, encode=encode_block, max_pending=64):
+        """Initialize the publisher without starting it.
+
+        Parameters
+        ----------
+        client : MQTT_Client/MQTT_Client_PL/ShardedClient
+            The client, connected and with its topics registered.
+        qos : int
+            The MQTTSN qos of the publishes.
+        encode : function
+            Turns a block into the message to publish.
+        max_pending : int
+            Number of blocks queued before new blocks are dropped.
+
+        """
+        self.client = client
+        self.qos = qos
+        self.encode = encode
+        self.stats = {'published': 0, 'failed': 0, 'dropped': 0}
+        self._publish = getattr(client, 'publish_sw', None) or client.publish
+        self._queue = queue.Queue(max_pending)
+        self._thread = None
+
+    def submit(self, topic, block):
+        """Queue a block of samples for publishing.
+
+        Parameters
+        ----------
+        topic : int/str
+            The topic ID, or the topic name for a `ShardedClient`.
+        block : numpy.ndarray
+            The samples, one row per sample with the timestamp first.
+
+        Returns
+        -------
+        Bool
+            False if the block is dropped because the queue is full.
+
+        """
+        try:
+            self._queue.put_nowait((topic, block))
+        except queue.Full:
+            self.stats['dropped'] += 1
+            return False
+        return True
+
+    def flush(self):
+        """Block until every queued block has been published."""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                topic, block = item
+                if self._publish(topic, self.encode(block), self.qos):
+                    self.stats['published'] += 1
+                else:
+                    self.stats['failed'] += 1
+            except Exception:
+                self.stats['failed'] += 1
+            finally:
+                self._queue.task_done()
+
+    def start(self):
+        """Publish the queued blocks in a background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="batch-publisher")
+        self._thread.start()
+
+    def stop(self):
+        """Publish the blocks already queued and stop the thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+
+class _Sensor:
+    """One sensor of a `SensorSampler` and its sample ring."""
+    __slots__ = ('name', 'read', 'period', 'topic', 'ring', 'index',
+                 'count', 'pending', 'missed', 'errors')
+
+    def __init__(self, name, read, rate, topic, capacity):
+        self.name = name
+        self.read = read
+        self.period = 1.0 / rate
+        self.topic = topic
+        self.ring = np.zeros((capacity, 2), dtype=np.float64)
+        self.index = 0
+        self.count = 0
+        self.pending = 0
+        self.missed = 0
+        self.errors = 0
+
+
+class SensorSampler:
+    """Sampler polling several sensors at independent rates.
+
+    One background thread serves every sensor from a deadline heap. Each
+    sample is timestamped into the preallocated ring of its sensor; every
+    `block_size` new samples, a copy of the block is handed to the
+    publisher if there is one.
+
+    A sensor is any function returning a number, for instance the `read()`
+    method of a Pmod sensor or `functools.partial(accel.read_sensor, iop)`.
+    A sensor raising an exception in the background thread only loses that
+    sample; the failures are counted by `errors()`.
+
+    """
+    def __init__(self, publisher=None, block_size=32, capacity=1024):
+        """Initialize the sampler without starting it.
+
+        Parameters
+        ----------
+        publisher : BatchPublisher
+            Receives the full blocks, `None` to only fill the rings.
+        block_size : int
+            Number of samples per published block.
+        capacity : int
+            Number of samples kept in the ring of each sensor.
+
+        """
+        if not 0 < block_size <= capacity:
+            raise ValueError("Block size must be between 1 and the "
+                             "ring capacity.")
+        self.publisher = publisher
+        self.block_size = block_size
+        self.capacity = capacity
+        self.sensors = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def add_sensor(self, name, read, rate, topic=None):
+        """Add a sensor to sample.
+
+        Parameters
+        ----------
+        name : str
+            The name of the sensor.
+        read : function
+            Called without arguments, returns the sensor value.
+        rate : float
+            Number of samples per second.
+        topic : int/str
+            The topic the blocks of this sensor are published on, `None`
+            to not publish them.
+
+        """
+        if rate <= 0:
+            raise ValueError("Sample rate must be positive.")
+        if self._thread is not None:
+            raise RuntimeError("Sensors cannot be added while sampling.")
+        self.sensors[name] = _Sensor(name, read, rate, topic, self.capacity)
+
+    def _store(self, sensor, timestamp, value):
+        with self._lock:
+            row = sensor.ring[sensor.index]
+            row[0] = timestamp
+            row[1] = value
+            sensor.index = (sensor.index + 1) % self.capacity
+            sensor.count = min(sensor.count + 1, self.capacity)
+            sensor.pending += 1
+            if sensor.pending < self.block_size:
+                return None
+            sensor.pending = 0
+            end = sensor.index or self.capacity
+            if end >= self.block_size:
+                return sensor.ring[end - self.block_size:end].copy()
+            return np.concatenate((sensor.ring[end - self.block_size:],
+                                   sensor.ring[:end]))
+
+    def sample(self, name):
+        """Take one timestamped sample of the given sensor."""
+        sensor = self.sensors[name]
+        value = sensor.read()
+        block = self._store(sensor, time.monotonic(), value)
+        if block is not None and self.publisher is not None and \
+                sensor.topic is not None:
+            self.publisher.submit(sensor.topic, block)
+        return value
+
+    def samples(self, name):
+        """Return a copy of the samples of a sensor, oldest first."""
+        sensor = self.sensors[name]
+        with self._lock:
+            if sensor.count < self.capacity:
+                return sensor.ring[:sensor.count].copy()
+            return np.roll(sensor.ring, -sensor.index, axis=0)
+
+    def jitter(self, name):
+        """Standard deviation of the sampling interval of a sensor, in s."""
+        data = self.samples(name)
+        if len(data) < 3:
+            return 0.0
+        return float(np.diff(data[:, 0]).std())
+
+    def missed(self, name):
+        """Number of sample deadlines of a sensor skipped while late."""
+        return self.sensors[name].missed
+
+    def errors(self, name):
+        """Number of samples of a sensor lost to an exception."""
+        return self.sensors[name].errors
+
+    def _run(self):
+        now = time.monotonic()
+        deadlines = [(now, name) for name in self.sensors]
+        heapq.heapify(deadlines)
+        while deadlines and not self._stopping.is_set():
+            deadline, name = deadlines[0]
+            delay = deadline - time.monotonic()
+            if delay > 0 and self._stopping.wait(delay):
+                break
+            sensor = self.sensors[name]
+            try:
+                self.sample(name)
+            except Exception:
+                sensor.errors += 1
+            deadline += sensor.period
+            now = time.monotonic()
+            if deadline < now:
+                # skip the deadlines already missed instead of bursting
+                skipped = int((now - deadline) / sensor.period) + 1
+                sensor.missed += skipped
+                deadline += skipped * sensor.period
+            heapq.heapreplace(deadlines, (deadline, name))
+
+    def start(self):
+        """Sample the sensors in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="sensor-sampler")
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background sampling."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,213 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import itertools
+import struct
+import threading
+import time
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+"""Segmentation of large payloads across several MQTT-SN publishes.
+
+Every segment starts with a header made of the message ID, the index of 
+the segment and the number of segments, each on 2 bytes in network byte 
+order. The default segment size keeps a publish, with its Ethernet, IP, 
+UDP and MQTT-SN headers, within the 1500-byte MTU of the network IOP.
+
+"""
+
+SEGMENT_HEADER = struct.Struct("!HHH")
+MAX_SEGMENT = 1400
+
+
+def segment_message(message, message_id, max_segment=MAX_SEGMENT):
+    """Split a payload into segments, each with its sequence header.
+
+    Parameters
+    ----------
+    message : bytes
+        The payload to split.
+    message_id : int
+        The ID shared by the segments of this payload.
+    max_segment : int
+        Max size of a segment, header included.
+
+    Returns
+    -------
+    list
+        The segments, in order.
+
+    """
+    size = max_segment - SEGMENT_HEADER.size
+    if size <= 0:
+        raise ValueError("Segment size too small for the header.")
+    count = max(1, -(-len(message) // size))
+    if count > 0xFFFF:
+        raise ValueError("Message too large for {} byte segments.".format(
+            max_segment))
+    view = memoryview(message)
+    return [SEGMENT_HEADER.pack(message_id & 0xFFFF, index, count) +
+            view[index * size:(index + 1) * size]
+            for index in range(count)]
+
+
+class SegmentingPublisher:
+    """Publisher splitting large payloads across several publishes.
+
+    Attributes
+    ----------
+    client : MQTT_Client/MQTT_Client_PL/ShardedClient
+        The client the segments are published through.
+    max_segment : int
+        Max size of a segment, header included.
+
+    """
+    def __init__(self, client, max_segment=MAX_SEGMENT):
+        """Initialize the publisher.
+
+        Parameters
+        ----------
+        client : MQTT_Client/MQTT_Client_PL/ShardedClient
+            The client, connected and with its topics registered.
+        max_segment : int
+            Max size of a segment, header included.
+
+        """
+        self.client = client
+        self.max_segment = max_segment
+        self._publish = getattr(client, 'publish_sw', None) or client.publish
+        self._ids = itertools.count()
+
+    def publish(self, topic, message, qos=1):
+        """Publish a payload of any size as a sequence of segments.
+
+        Returns
+        -------
+        Bool
+            True if every segment is published.
+
+        """
+        message_id = next(self._ids) & 0xFFFF
+        return all([self._publish(topic, segment, qos) for segment in
+                    segment_message(message, message_id, self.max_segment)])
+
+
+class Reassembler:
+    """Subscriber side of `SegmentingPublisher`.
+
+    Segments are collected per topic and message ID until the payload is 
+    complete. Duplicated segments are ignored, and partial payloads are 
+    dropped once older than `timeout`.
+
+    Attributes
+    ----------
+    timeout : float
+        Number of seconds a partial payload is kept.
+    max_pending : int
+        Number of partial payloads kept; the oldest one is dropped first.
+    stats : dict
+        Number of payloads completed, segments received, and partial 
+        payloads expired.
+
+    """
+    def __init__(self, timeout=5.0, max_pending=64):
+        """Initialize an empty reassembler.
+
+        Parameters
+        ----------
+        timeout : float
+            Number of seconds a partial payload is kept.
+        max_pending : int
+            Number of partial payloads kept.
+
+        """
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.stats = {'completed': 0, 'segments': 0, 'expired': 0}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _expire(self, now):
+        pending = self._pending
+        for key in [key for key, (started, _, _) in pending.items()
+                    if now - started > self.timeout]:
+            del pending[key]
+            self.stats['expired'] += 1
+        while len(pending) >= self.max_pending:
+            oldest = min(pending, key=lambda key: pending[key][0])
+            del pending[oldest]
+            self.stats['expired'] += 1
+
+    def feed(self, topic, segment):
+        """Add a received segment.
+
+        Parameters
+        ----------
+        topic : int/str
+            The topic the segment is received on.
+        segment : bytes
+            The message of the publish, starting with the segment header.
+
+        Returns
+        -------
+        bytes
+            The whole payload once its last segment is received, `None` 
+            otherwise.
+
+        """
+        if len(segment) < SEGMENT_HEADER.size:
+            raise ValueError("Segment shorter than its header.")
+        message_id, index, count = SEGMENT_HEADER.unpack_from(segment)
+        if index >= count:
+            raise ValueError("Segment index out of range.")
+        data = bytes(segment[SEGMENT_HEADER.size:])
+        with self._lock:
+            self.stats['segments'] += 1
+            if count == 1:
+                self.stats['completed'] += 1
+                return data
+            key = (topic, message_id)
+            now = time.monotonic()
+            if key not in self._pending:
+                self._expire(now)
+                self._pending[key] = (now, count, {})
+            _, expected, parts = self._pending[key]
+            if expected != count:
+                raise ValueError("Segment count changed within a message.")
+            parts[index] = data
+            if len(parts) < count:
+                return None
+            del self._pending[key]
+            self.stats['completed'] += 1
+            return b''.join(parts[i] for i in range(count))
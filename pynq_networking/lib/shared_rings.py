@@ -0,0 +1,496 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import ctypes
+import multiprocessing
+import os
+import platform
+import tempfile
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from queue import Full
+import numpy as np
+from .arbiter import ProcessLock, get_arbiter
+from .slurper import frame_segments, check_frame_length
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+"""Shared-memory frame rings around a single network IOP owner.
+
+The BRAM of the network IOP can only be driven by one process. The owner 
+process services the `PacketSlurper` and exchanges frames with any number 
+of worker processes through rings in `multiprocessing.shared_memory`: 
+one TX ring per producer and one RX ring per consumer. Every ring has a 
+single writer and a single reader, so no lock is shared between processes.
+
+The TX rings are written to the IOP through the arbiter of the owner 
+process. A worker process running the accelerator calls 
+`share_network_iop()` first, so the owner only writes frames while no 
+accelerator run holds the IOP.
+
+`multiprocessing.shared_memory` needs Python 3.8, so unlike the rest of the
+package this module cannot be imported on the Python 3.6 of the board 
+image; it is not imported by `pynq_networking.lib` for that reason.
+
+"""
+
+# header words, the head and the tail are kept on separate cache lines
+_HEAD = 0
+_TAIL = 8
+_SLOTS = 16
+_SLOT_SIZE = 17
+_DROPPED = 18
+_HEADER_WORDS = 24
+_HEADER_SIZE = _HEADER_WORDS * 8
+_LEN_SIZE = 4
+
+SLOT_SIZE = 2048
+
+
+def _memory_barrier_function():
+    machine = platform.machine()
+    if machine.startswith('armv6') or machine.startswith('armv7'):
+        # __kuser_memory_barrier, see Documentation/arm/kernel_user_helpers
+        return ctypes.CFUNCTYPE(None)(0xffff0fa0)
+    if machine in ('x86_64', 'AMD64', 'i386', 'i686'):
+        # stores are not reordered with other stores, nor loads with loads
+        return lambda: None
+    lock = threading.Lock()
+
+    def barrier():
+        # the atomics of an uncontended lock round trip order the accesses
+        with lock:
+            pass
+        with lock:
+            pass
+    return barrier
+
+
+memory_barrier = _memory_barrier_function()
+
+
+def lock_path(name):
+    """Return the lock file shared by the processes around an owner."""
+    return os.path.join(tempfile.gettempdir(), name + '.lock')
+
+
+def share_network_iop(name='pynq_l2'):
+    """Make the accelerator runs of this process exclude the owner process.
+
+    The arbiter of this process takes the process lock of the owner for 
+    every run, and the owner stops writing frames to the IOP meanwhile.
+
+    Parameters
+    ----------
+    name : str
+        The prefix of the shared memory segments of the owner.
+
+    """
+    arbiter = get_arbiter()
+    if arbiter.process_lock is None:
+        arbiter.process_lock = ProcessLock(lock_path(name))
+    return arbiter
+
+
+def ring_name(name, direction, index):
+    """Return the shared memory name of a TX or RX ring."""
+    return '{}_{}{}'.format(name, direction, index)
+
+
+class FrameRing:
+    """Single-producer, single-consumer ring of frames in shared memory.
+
+    Each slot holds a 32-bit length followed by the frame. The producer 
+    only writes the head, the consumer only writes the tail. A memory 
+    barrier separates the slot accesses from the head and tail updates, 
+    since the ARM cores may reorder them otherwise.
+
+    Attributes
+    ----------
+    name : str
+        The name of the shared memory segment.
+    slots : int
+        Number of frames the ring holds.
+    slot_size : int
+        Size of a slot in bytes, including the length word.
+
+    """
+    def __init__(self, name, slots=64, slot_size=SLOT_SIZE, create=False):
+        """Create a ring, or attach to an existing one by name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the shared memory segment.
+        slots : int
+            Number of frames, only used on creation.
+        slot_size : int
+            Size of a slot in bytes, only used on creation.
+        create : bool
+            Whether to create the segment instead of attaching to it.
+
+        """
+        if create:
+            self.shm = shared_memory.SharedMemory(
+                name, create=True, size=_HEADER_SIZE + slots * slot_size)
+        else:
+            # only the creator may remove the segment when it exits
+            try:
+                self.shm = shared_memory.SharedMemory(name, track=False)
+            except TypeError:
+                self.shm = shared_memory.SharedMemory(name)
+                resource_tracker.unregister(self.shm._name, 'shared_memory')
+        self.name = name
+        self.header = np.ndarray((_HEADER_WORDS,), dtype=np.uint64,
+                                 buffer=self.shm.buf)
+        if create:
+            self.header[:] = 0
+            self.header[_SLOTS] = slots
+            self.header[_SLOT_SIZE] = slot_size
+        self.slots = int(self.header[_SLOTS])
+        self.slot_size = int(self.header[_SLOT_SIZE])
+        self.data = self.shm.buf[_HEADER_SIZE:]
+        self._owner = create
+
+    def __len__(self):
+        """Number of frames waiting in the ring."""
+        return int(self.header[_HEAD] - self.header[_TAIL])
+
+    @property
+    def dropped(self):
+        """Number of frames the producer could not put in a full ring."""
+        return int(self.header[_DROPPED])
+
+    def put(self, frame):
+        """Copy a frame, or a list of its segments, into the ring.
+
+        Returns
+        -------
+        Bool
+            False if the ring is full and the frame is dropped.
+
+        """
+        header = self.header
+        head = int(header[_HEAD])
+        if head - int(header[_TAIL]) >= self.slots:
+            header[_DROPPED] += 1
+            return False
+        segments = frame_segments(frame)
+        length = sum(segment.nbytes for segment in segments)
+        if length > self.slot_size - _LEN_SIZE:
+            raise ValueError("Frame of {} bytes does not fit in a slot."
+                             .format(length))
+        start = (head % self.slots) * self.slot_size
+        data = self.data
+        data[start:start + _LEN_SIZE] = length.to_bytes(_LEN_SIZE, 'little')
+        offset = start + _LEN_SIZE
+        for segment in segments:
+            end = offset + segment.nbytes
+            data[offset:end] = segment
+            offset = end
+        # publish the slot only once it is complete
+        memory_barrier()
+        header[_HEAD] = head + 1
+        return True
+
+    def get(self):
+        """Take the oldest frame out of the ring.
+
+        Returns
+        -------
+        bytes
+            The frame, `None` if the ring is empty.
+
+        """
+        header = self.header
+        tail = int(header[_TAIL])
+        if tail == int(header[_HEAD]):
+            return None
+        memory_barrier()
+        start = (tail % self.slots) * self.slot_size
+        data = self.data
+        length = int.from_bytes(data[start:start + _LEN_SIZE], 'little')
+        offset = start + _LEN_SIZE
+        frame = bytes(data[offset:offset + length])
+        # free the slot only once it has been read
+        memory_barrier()
+        header[_TAIL] = tail + 1
+        return frame
+
+    def close(self):
+        """Detach from the segment, and remove it if it was created here."""
+        del self.header
+        self.data.release()
+        self.shm.close()
+        if self._owner:
+            # an attached ring sharing our resource tracker may have 
+            # unregistered the segment already
+            resource_tracker.register(self.shm._name, 'shared_memory')
+            self.shm.unlink()
+
+
+def _serve(name, tx_names, rx_names, stopping, cpu, idle_sleep):
+    """Body of the owner process, only given names so it can be spawned."""
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    arbiter = share_network_iop(name)
+    slurper = arbiter.slurper
+    tx_rings = [FrameRing(tx) for tx in tx_names]
+    rx_rings = [FrameRing(rx) for rx in rx_names]
+    try:
+        while not stopping.is_set():
+            busy = False
+            # while another process owns the IOP, frames wait in the rings
+            if not arbiter.pending or arbiter.flush(0):
+                for ring in tx_rings:
+                    frame = ring.get()
+                    if frame is not None:
+                        try:
+                            arbiter.send(frame)
+                        except Full:
+                            # counted in the dropped frames of the arbiter
+                            pass
+                        busy = True
+            if slurper.has_packet():
+                frame = slurper.recv()
+                for ring in rx_rings:
+                    ring.put(frame)
+                busy = True
+            if not busy:
+                time.sleep(idle_sleep)
+    finally:
+        arbiter.flush(1.0)
+        for ring in tx_rings + rx_rings:
+            ring.close()
+
+
+class IOOwner:
+    """Process owning the network IOP on behalf of worker processes.
+
+    The rings are created by `start()`, before the owner process runs, so 
+    workers can attach to them by name with `RingSocket` right away. The 
+    owner sends the frames of the TX rings in a round-robin, one per ring 
+    per pass, and copies each frame received to every RX ring; a consumer
+    that falls behind only loses its own frames. Frames are written through
+    the arbiter of the owner process, which holds the process lock of the 
+    IOP while writing.
+
+    Attributes
+    ----------
+    name : str
+        The prefix of the shared memory segments.
+    producers : int
+        Number of TX rings.
+    consumers : int
+        Number of RX rings.
+    cpu : int
+        The core the owner process is pinned to, if any.
+
+    """
+    def __init__(self, name='pynq_l2', producers=2, consumers=2, slots=64,
+                 slot_size=SLOT_SIZE, cpu=None, idle_sleep=0.0001):
+        """Initialize the owner without starting it.
+
+        Parameters
+        ----------
+        name : str
+            The prefix of the shared memory segments.
+        producers : int
+            Number of TX rings, one per sending worker.
+        consumers : int
+            Number of RX rings, one per receiving worker.
+        slots : int
+            Number of frames in each ring.
+        slot_size : int
+            Size of a slot in bytes.
+        cpu : int
+            The core to pin the owner process to, if any.
+        idle_sleep : float
+            Number of seconds to sleep when there is nothing to do.
+
+        """
+        self.name = name
+        self.producers = producers
+        self.consumers = consumers
+        self.slots = slots
+        self.slot_size = slot_size
+        self.cpu = cpu
+        self.idle_sleep = idle_sleep
+        self.tx_rings = []
+        self.rx_rings = []
+        self._stopping = multiprocessing.Event()
+        self._process = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    def start(self):
+        """Create the rings and start the owner process."""
+        if self._process is not None:
+            return
+        self.tx_rings = [FrameRing(ring_name(self.name, 'tx', i), self.slots,
+                                   self.slot_size, create=True)
+                         for i in range(self.producers)]
+        self.rx_rings = [FrameRing(ring_name(self.name, 'rx', i), self.slots,
+                                   self.slot_size, create=True)
+                         for i in range(self.consumers)]
+        self._stopping.clear()
+        self._process = multiprocessing.Process(
+            target=_serve, daemon=True, name="network-iop-owner",
+            args=(self.name, [ring.name for ring in self.tx_rings],
+                  [ring.name for ring in self.rx_rings],
+                  self._stopping, self.cpu, self.idle_sleep))
+        self._process.start()
+
+    def stats(self):
+        """Return the frames waiting and dropped in every ring."""
+        return {ring.name: {'pending': len(ring), 'dropped': ring.dropped}
+                for ring in self.tx_rings + self.rx_rings}
+
+    def stop(self, timeout=1.0):
+        """Stop the owner process and remove the rings."""
+        if self._process is None:
+            return
+        self._stopping.set()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+        for ring in self.tx_rings + self.rx_rings:
+            ring.close()
+        self.tx_rings = []
+        self.rx_rings = []
+
+
+class RingSocket:
+    """Worker side of an `IOOwner`, sending and receiving raw frames.
+
+    Attributes
+    ----------
+    tx : FrameRing
+        The TX ring of this worker, `None` if it does not send.
+    rx : FrameRing
+        The RX ring of this worker, `None` if it does not receive.
+
+    """
+    def __init__(self, name='pynq_l2', producer=None, consumer=None):
+        """Attach to the rings of a running owner.
+
+        Parameters
+        ----------
+        name : str
+            The prefix of the shared memory segments.
+        producer : int
+            Index of the TX ring to send on.
+        consumer : int
+            Index of the RX ring to receive from.
+
+        """
+        self.tx = None if producer is None else \
+            FrameRing(ring_name(name, 'tx', producer))
+        self.rx = None if consumer is None else \
+            FrameRing(ring_name(name, 'rx', consumer))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def send(self, frame, timeout=None):
+        """Send a frame, or a list of its segments, through the owner.
+
+        Parameters
+        ----------
+        frame : bytes-like/list
+            The frame to send; kamene packets are converted with `bytes()`.
+        timeout : float
+            Max number of seconds to wait while the TX ring is full, 
+            forever if `None`.
+
+        Returns
+        -------
+        Bool
+            False if the ring is still full after the timeout.
+
+        """
+        if hasattr(frame, 'build'):
+            frame = bytes(frame)
+        # checked here, so a long frame never reaches the owner process
+        check_frame_length(sum(segment.nbytes
+                               for segment in frame_segments(frame)))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self.tx) >= self.tx.slots:
+            if deadline is not None and time.monotonic() > deadline:
+                return self.tx.put(frame)
+            time.sleep(0)
+        return self.tx.put(frame)
+
+    def has_packet(self):
+        """Return true if a received frame is waiting."""
+        return len(self.rx) > 0
+
+    def recv(self, timeout=None):
+        """Receive a frame.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait, forever if `None`.
+
+        Returns
+        -------
+        bytes
+            The frame, `None` on timeout.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self.rx.get()
+            if frame is not None:
+                return frame
+            if deadline is not None and time.monotonic() > deadline:
+                return None
+            time.sleep(0.0001)
+
+    def close(self):
+        """Detach from the rings."""
+        for ring in (self.tx, self.rx):
+            if ring is not None:
+                ring.close()
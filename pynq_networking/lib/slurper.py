@@ -28,7 +28,9 @@
 #   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-from queue import Queue
+import threading
+import time
+from queue import Queue, Full, Empty
 from .network_iop import NetworkIOP
 
 
@@ -54,12 +56,70 @@ def fmt_packet(data):
     return '\n'.join(result)
 
 
+TX_SPIN = 1000
+# largest frame the packetSlurper core sends, see MTU in packetSlurper.cpp
+TX_MTU = 1500
+
+
+def check_frame_length(length):
+    """Raise `ValueError` if a frame is too long for the core to send.
+
+    The TX window holds 1536 bytes, but the core only sends up to `TX_MTU`
+    bytes, Ethernet header included.
+
+    """
+    if length > TX_MTU:
+        raise ValueError("Frame of {} bytes exceeds the {}-byte MTU of the "
+                         "network IOP.".format(length, TX_MTU))
+
+
+def frame_segments(frame):
+    """Return the segments of a frame as flat byte memoryviews.
+
+    Parameters
+    ----------
+    frame : bytes-like/list
+        A bytes-like object, or a list or tuple of them, e.g. a header and
+        a payload.
+
+    """
+    if not isinstance(frame, (list, tuple)):
+        frame = (frame,)
+    return [memoryview(segment).cast('B') for segment in frame]
+
+
+def frame_bytes(frame):
+    """Copy a frame, possibly made of segments, into a single bytes."""
+    if isinstance(frame, bytes):
+        return frame
+    return b''.join(frame_segments(frame))
+
+
 class PacketSlurper(NetworkIOP):
     """Wrapper class around a NetworkIOP Controller.
 
     This wrapper can interface with Steve's HLS PacketSlurper.
 
+    A frame is only written once the hardware has cleared `TX_EN` for the
+    previous one. The sender spins on the register for `TX_SPIN` reads, 
+    then yields the CPU between reads. Frames can also be handed to a 
+    writer thread through `send_async()`; the writer sends them through the
+    arbiter of the network IOP, so they are queued while the accelerator
+    owns the TX window.
+
+    Attributes
+    ----------
+    tx_stats : dict
+        Shared by all the instances: number of frames sent, of sends that
+        found the previous frame still pending, the time spent waiting in
+        seconds, and the frames given up on timeout or dropped on a full 
+        writer queue.
+
     """
+    tx_stats = {'sent': 0, 'stalls': 0, 'stall_time': 0.0,
+                'timeouts': 0, 'dropped': 0}
+    _tx_lock = threading.Lock()
+
     def __init__(self):
         super().__init__()
 
@@ -77,26 +137,49 @@ class PacketSlurper(NetworkIOP):
         # remove some indirection
         self.array = self.mmio.array
         self.mem = self.mmio.mem
+        self.rx_size = (self.RX_CTRL_OFFSET - self.RX_DATA_OFFSET) << 2
+        self._rx_view = memoryview(self.mem)[
+            self.RX_DATA_OFFSET << 2:self.RX_CTRL_OFFSET << 2]
+
+        self._tx_queue = None
+        self._tx_thread = None
 
     def has_packet(self):
         t = super().read32(self.RX_EN_OFFSET)
         return t == 1
 
+    def recv_into(self, buffer):
+        """Copy the pending frame into the given buffer.
+
+        The frame is copied straight from the RX window, without any 
+        intermediate object; like `socket.recv_into()`, it is truncated if
+        the buffer is too small.
+
+        Parameters
+        ----------
+        buffer : bytearray/memoryview
+            A writable buffer, e.g. taken from a `BufferPool`.
+
+        Returns
+        -------
+        int
+            The number of bytes copied, 0 if there is no frame.
+
+        """
+        if not self.has_packet():
+            return 0
+        length = min(int(self.array[self.RX_LEN_OFFSET]), self.rx_size)
+        with memoryview(buffer) as view:
+            length = min(length, view.nbytes)
+            view[:length] = self._rx_view[:length]
+        self.array[self.RX_EN_OFFSET] = 0x00
+        return length
+
     def recv(self):
         if self.has_packet():
-            to_read = super().read32(self.RX_LEN_OFFSET)
-            i = 0
-            pkt = b""
-            while to_read>4:
-                data = super().read32(self.RX_DATA_OFFSET+i)
-                pkt = pkt + data.to_bytes(4, byteorder='little')
-                to_read = to_read - 4
-                i = i + 1
-            data = super().read32(self.RX_DATA_OFFSET+i)
-            remainder = data.to_bytes(4, byteorder='little')
-            remainder = remainder[0:to_read]
-            pkt = pkt + remainder
-            super().write32(self.RX_EN_OFFSET, 0x00)
+            length = min(int(self.array[self.RX_LEN_OFFSET]), self.rx_size)
+            pkt = bytes(self._rx_view[:length])
+            self.array[self.RX_EN_OFFSET] = 0x00
             return pkt
         return None
 
@@ -116,13 +199,144 @@ class PacketSlurper(NetworkIOP):
     def _issue_eth_tx_packet(self):
         super().write32(self.TX_EN_OFFSET, 0x01)
 
-    def send(self, packet):
-        mem = self.mem
+    def tx_done(self):
+        """Return true if the hardware has taken the last frame sent."""
+        return self.array[self.TX_EN_OFFSET] == 0
+
+    def wait_tx(self, timeout=None):
+        """Wait for the hardware to take the last frame sent.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait, forever if `None`.
+
+        Returns
+        -------
+        Bool
+            False if the frame is still pending after the timeout.
+
+        """
         array = self.array
-        mem.seek(0x0)
-        mem.write(packet)
-        array[0x194] = len(packet)
-        array[0x190] = 0x01
+        tx_en = self.TX_EN_OFFSET
+        for _ in range(TX_SPIN):
+            if array[tx_en] == 0:
+                return True
+        stats = self.tx_stats
+        stats['stalls'] += 1
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        while array[tx_en] != 0:
+            now = time.monotonic()
+            if deadline is not None and now > deadline:
+                stats['stall_time'] += now - start
+                return False
+            time.sleep(0)
+        stats['stall_time'] += time.monotonic() - start
+        return True
+
+    def send(self, packet, timeout=None):
+        """Write a frame into the TX window and hand it to the hardware.
+
+        Each segment is written straight into the mapped window at its 
+        offset, so a frame made of a header and a payload is never copied
+        into a temporary object. Frames longer than `TX_MTU` raise 
+        `ValueError`.
+
+        Parameters
+        ----------
+        packet : bytes-like/list
+            The frame to send, or a list of its segments.
+        timeout : float
+            Max number of seconds to wait for the previous frame to be 
+            taken, forever if `None`.
+
+        Returns
+        -------
+        Bool
+            False if the previous frame is still pending after the timeout;
+            the new frame is not written then.
+
+        """
+        segments = frame_segments(packet)
+        start = self.TX_DATA_OFFSET << 2
+        length = sum(segment.nbytes for segment in segments)
+        check_frame_length(length)
+        with self._tx_lock:
+            if not self.wait_tx(timeout):
+                self.tx_stats['timeouts'] += 1
+                return False
+            mem = self.mem
+            offset = start
+            for segment in segments:
+                end = offset + segment.nbytes
+                mem[offset:end] = segment
+                offset = end
+            array = self.array
+            array[self.TX_LEN_OFFSET] = length
+            array[self.TX_EN_OFFSET] = 0x01
+            self.tx_stats['sent'] += 1
+            return True
+
+    def start_writer(self, max_pending=256):
+        """Start a writer thread sending the frames of `send_async()`."""
+        if self._tx_thread is not None:
+            return
+        from .arbiter import get_arbiter
+        arbiter = get_arbiter()
+        self._tx_queue = Queue(max_pending)
+
+        def run():
+            queue = self._tx_queue
+            while True:
+                # frames queued behind another process are retried
+                try:
+                    packet = queue.get(
+                        timeout=0.001 if arbiter.pending else None)
+                except Empty:
+                    arbiter.flush(0)
+                    continue
+                try:
+                    if packet is None:
+                        return
+                    arbiter.send(packet)
+                except Full:
+                    self.tx_stats['dropped'] += 1
+                finally:
+                    queue.task_done()
+
+        self._tx_thread = threading.Thread(target=run, daemon=True,
+                                           name="slurper-writer")
+        self._tx_thread.start()
+
+    def send_async(self, packet):
+        """Queue a frame for the writer thread.
+
+        The frame is sent later, so its buffers must not be modified in the
+        meantime.
+
+        Returns
+        -------
+        Bool
+            False if the frame is dropped because the queue is full.
+
+        """
+        if self._tx_queue is None:
+            raise RuntimeError("The writer thread is not started.")
+        try:
+            self._tx_queue.put_nowait(packet)
+        except Full:
+            self.tx_stats['dropped'] += 1
+            return False
+        return True
+
+    def stop_writer(self):
+        """Send the frames already queued and stop the writer thread."""
+        if self._tx_thread is not None:
+            self._tx_queue.put(None)
+            self._tx_thread.join()
+            self._tx_thread = None
+            self._tx_queue = None
 
     def flush(self):
         super().flush32(0x00)
@@ -0,0 +1,347 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import atexit
+import os
+import socket
+import subprocess
+import threading
+import time
+import weakref
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+_live = weakref.WeakSet()
+
+
+def tcp_port_open(port, host='127.0.0.1', timeout=0.05):
+    """Check whether a TCP port accepts connections.
+
+    Parameters
+    ----------
+    port : int
+        The TCP port number.
+    host : str
+        The host to connect to.
+    timeout : float
+        Max number of seconds to wait for the connection.
+
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _socket_inodes(pid):
+    """Return the socket inodes open in a process, `None` if unreadable."""
+    fd_dir = '/proc/{}/fd'.format(pid)
+    try:
+        names = os.listdir(fd_dir)
+    except OSError:
+        return None
+    inodes = set()
+    for name in names:
+        try:
+            target = os.readlink(os.path.join(fd_dir, name))
+        except OSError:
+            continue
+        if target.startswith('socket:['):
+            inodes.add(target[len('socket:['):-1])
+    return inodes
+
+
+def _udp_port_in_use(port):
+    """Check whether binding a UDP port fails, i.e. someone holds it."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        try:
+            probe.bind(('', port))
+        except OSError:
+            return True
+    return False
+
+
+def udp_port_bound(port, pid=None):
+    """Check whether a UDP port is bound, by a given process if any.
+
+    UDP has no handshake to probe, so the kernel socket tables are read
+    instead, and the inode of the socket is matched against the sockets 
+    open in the process. Without the tables, a probe socket is bound to
+    the port instead, which cannot tell which process holds it.
+
+    Parameters
+    ----------
+    port : int
+        The UDP port number.
+    pid : int
+        The process expected to hold the port, `None` for any process.
+
+    """
+    suffix = ":{:04X}".format(port)
+    inodes = None if pid is None else _socket_inodes(pid)
+    found_table = False
+    for table in ('/proc/net/udp', '/proc/net/udp6'):
+        try:
+            with open(table) as file:
+                lines = file.readlines()[1:]
+        except OSError:
+            continue
+        found_table = True
+        for line in lines:
+            fields = line.split()
+            if len(fields) > 9 and fields[1].endswith(suffix) and \
+                    (inodes is None or fields[9] in inodes):
+                return True
+    if found_table:
+        return False
+    return _udp_port_in_use(port)
+
+
+@atexit.register
+def _stop_all():
+    """Stop the brokers still running when the interpreter exits."""
+    for process in list(_live):
+        process.stop()
+
+
+class BrokerProcess:
+    """Supervised broker process.
+
+    The broker is started with `subprocess`, and `start()` only returns once
+    the MQTT TCP port and the MQTT-SN UDP port are up. If the broker exits
+    unexpectedly, it is restarted with an exponential backoff; a restarted
+    broker which does not get ready in time counts as a failed restart.
+
+    The broker is pinned to its core after it has been spawned, as nothing
+    but `exec` is safe in the child of a threaded process. Brokers are 
+    stopped when the interpreter exits; if it is killed instead, they are 
+    left running until `Broker.open()` stops them as stale brokers.
+
+    Attributes
+    ----------
+    command : list
+        The command line used to start the broker.
+    log : str
+        The file the broker output is written to.
+    restarts : int
+        Number of restarts since the broker last ran for `stable_time`.
+
+    """
+    def __init__(self, command, log, mqtt_port=None, mqttsn_port=None,
+                 max_restarts=5, backoff=0.1, max_backoff=5.0, cpu=None,
+                 stable_time=30.0):
+        """Initialize the supervisor without starting the broker.
+
+        Parameters
+        ----------
+        command : list
+            The command line used to start the broker.
+        log : str
+            The file the broker output is written to.
+        mqtt_port : int
+            MQTT port number to probe, `None` to skip the probe.
+        mqttsn_port : int
+            MQTT-SN port number to probe, `None` to skip the probe.
+        max_restarts : int
+            Max number of automatic restarts before giving up.
+        backoff : float
+            Initial delay in seconds before a restart.
+        max_backoff : float
+            Upper bound of the restart delay in seconds.
+        cpu : int
+            The core the broker is pinned to, `None` to leave it unpinned.
+        stable_time : float
+            Seconds a broker has to run before the restart count and the
+            backoff are reset.
+
+        """
+        self.command = command
+        self.log = log
+        self.mqtt_port = mqtt_port
+        self.mqttsn_port = mqttsn_port
+        self.max_restarts = max_restarts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.cpu = cpu
+        self.stable_time = stable_time
+        self.restarts = 0
+        self.timeout = 5.0
+        self._started = None
+        self._process = None
+        self._monitor = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self):
+        """The process ID of the running broker, or `None`."""
+        return self._process.pid if self.running else None
+
+    @property
+    def running(self):
+        """Whether the broker process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def _spawn(self):
+        with open(self.log, 'ab') as log:
+            self._process = subprocess.Popen(
+                self.command, stdout=log, stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL)
+        self._started = time.monotonic()
+        if self.cpu is not None:
+            try:
+                os.sched_setaffinity(self._process.pid, {self.cpu})
+            except OSError:
+                pass
+
+    def ready(self):
+        """Return true if every configured port is up in the broker."""
+        if not self.running:
+            return False
+        if self.mqtt_port is not None and not tcp_port_open(self.mqtt_port):
+            return False
+        if self.mqttsn_port is not None and \
+                not udp_port_bound(self.mqttsn_port, self._process.pid):
+            return False
+        return True
+
+    def wait_ready(self, timeout=5.0, interval=0.005):
+        """Poll the broker ports until they are up.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait.
+        interval : float
+            Delay in seconds between two probes.
+
+        """
+        deadline = time.monotonic() + timeout
+        while not self.ready():
+            if self._process is not None and self._process.poll() is not None \
+                    and self._monitor is None:
+                raise RuntimeError("Broker exited with code {}.".format(
+                    self._process.returncode))
+            if time.monotonic() > deadline:
+                raise TimeoutError("Broker not ready after {}s.".format(
+                    timeout))
+            time.sleep(interval)
+
+    def start(self, timeout=5.0):
+        """Start the broker and block until it is ready.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait for the broker to be ready.
+
+        """
+        if self.running:
+            return
+        self.timeout = timeout
+        self._stopping.clear()
+        _live.add(self)
+        with self._lock:
+            self._spawn()
+        try:
+            self.wait_ready(timeout)
+        except (RuntimeError, TimeoutError):
+            self.stop()
+            raise
+        self._monitor = threading.Thread(target=self._supervise, daemon=True,
+                                         name="broker-supervisor")
+        self._monitor.start()
+
+    def _supervise(self):
+        delay = self.backoff
+        while not self._stopping.is_set():
+            process = self._process
+            process.wait()
+            if self._stopping.is_set():
+                return
+            if time.monotonic() - self._started >= self.stable_time:
+                delay = self.backoff
+                self.restarts = 0
+            if self.restarts >= self.max_restarts:
+                return
+            if self._stopping.wait(delay):
+                return
+            delay = min(delay * 2, self.max_backoff)
+            with self._lock:
+                if self._stopping.is_set():
+                    return
+                self._spawn()
+            self.restarts += 1
+            self._wait_restarted()
+
+    def _wait_restarted(self, interval=0.005):
+        """Kill a restarted broker which does not get ready in time."""
+        deadline = time.monotonic() + self.timeout
+        while not self.ready():
+            if self._stopping.is_set() or self._process.poll() is not None:
+                return
+            if time.monotonic() > deadline:
+                with self._lock:
+                    if not self._stopping.is_set():
+                        self._process.kill()
+                return
+            time.sleep(interval)
+
+    def stop(self, timeout=2.0):
+        """Stop the broker gracefully.
+
+        SIGTERM is sent first; SIGKILL is only used if the broker does not
+        exit within the timeout.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait after SIGTERM.
+
+        """
+        self._stopping.set()
+        _live.discard(self)
+        with self._lock:
+            process = self._process
+            if process is not None and process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+        if self._monitor is not None and \
+                self._monitor is not threading.current_thread():
+            self._monitor.join()
+        self._monitor = None
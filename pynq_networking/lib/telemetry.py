@@ -0,0 +1,186 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import threading
+import time
+import numpy as np
+from .accelerator_registers import AcceleratorRegisters, COUNTER_REGISTERS
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+COUNTERS = ('events_completed', 'publishes_sent', 'packets_received',
+            'packets_sent')
+
+
+class AcceleratorTelemetry:
+    """Background sampler of the accelerator hardware counters.
+
+    Each counter has a valid bit 4 bytes above its data register, which is
+    cleared when read. A counter value is only taken when its valid bit is
+    set; otherwise the last value seen is kept, since the data register may
+    not hold a completed update.
+
+    Samples are stored in a fixed-size NumPy ring, one row per sample with
+    the timestamp followed by the counters in the order of `COUNTERS`.
+
+    Attributes
+    ----------
+    registers : AcceleratorRegisters
+        The register map the counters are read from.
+    rate : float
+        Number of samples per second taken by the background thread.
+    ring : numpy.ndarray
+        The preallocated sample ring.
+    latest : dict
+        The last valid value of each counter.
+
+    """
+    def __init__(self, registers=None, rate=10.0, capacity=1024):
+        """Initialize the sampler without starting it.
+
+        Parameters
+        ----------
+        registers : AcceleratorRegisters
+            The register map, defaulted to the shared accelerator map.
+        rate : float
+            Number of samples per second.
+        capacity : int
+            Number of samples kept in the ring.
+
+        """
+        if rate <= 0:
+            raise ValueError("Sample rate must be positive.")
+        self.registers = AcceleratorRegisters() if registers is None \
+            else registers
+        self.rate = rate
+        self.ring = np.zeros((capacity, len(COUNTERS) + 1), dtype=np.float64)
+        self.latest = {name: 0 for name in COUNTERS}
+        self._offsets = [COUNTER_REGISTERS[name] for name in COUNTERS]
+        self._index = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def __len__(self):
+        """Number of samples held in the ring."""
+        return self._count
+
+    def read_counters(self):
+        """Read the counters, honouring their clear-on-read valid bits.
+
+        Returns
+        -------
+        dict
+            The last valid value of each counter.
+
+        """
+        registers = self.registers
+        for name, offset in zip(COUNTERS, self._offsets):
+            if registers.read(offset + 4) & 0x1:
+                self.latest[name] = registers.read(offset)
+        return dict(self.latest)
+
+    def sample(self):
+        """Take one timestamped sample and store it in the ring."""
+        counters = self.read_counters()
+        with self._lock:
+            row = self.ring[self._index]
+            row[0] = time.monotonic()
+            for i, name in enumerate(COUNTERS):
+                row[i + 1] = counters[name]
+            self._index = (self._index + 1) % len(self.ring)
+            self._count = min(self._count + 1, len(self.ring))
+        return counters
+
+    def samples(self):
+        """Return a copy of the samples held, oldest first."""
+        with self._lock:
+            if self._count < len(self.ring):
+                return self.ring[:self._count].copy()
+            return np.roll(self.ring, -self._index, axis=0)
+
+    def rates(self, window=None):
+        """Compute the per-second rate of each counter.
+
+        Parameters
+        ----------
+        window : int
+            Number of most recent samples to use, all of them if `None`.
+
+        Returns
+        -------
+        dict
+            The rate of each counter, e.g. `publishes_sent` per second.
+
+        """
+        data = self.samples()
+        if window is not None:
+            data = data[-window:]
+        if len(data) < 2:
+            return {name: 0.0 for name in COUNTERS}
+        elapsed = data[-1, 0] - data[0, 0]
+        # a counter going backwards means the accelerator has been reset
+        deltas = np.diff(data[:, 1:], axis=0)
+        deltas = np.where(deltas < 0, data[1:, 1:], deltas).sum(axis=0)
+        return {name: float(deltas[i] / elapsed) if elapsed > 0 else 0.0
+                for i, name in enumerate(COUNTERS)}
+
+    def start(self):
+        """Sample the counters in a background thread."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+
+        def run():
+            period = 1.0 / self.rate
+            deadline = time.monotonic()
+            while not self._stopping.is_set():
+                self.sample()
+                deadline += period
+                delay = deadline - time.monotonic()
+                if delay < 0:
+                    deadline = time.monotonic()
+                    delay = 0
+                self._stopping.wait(delay)
+
+        self._thread = threading.Thread(target=run, daemon=True,
+                                        name="accelerator-telemetry")
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background sampling."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,163 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import asyncio
+import glob
+import os
+import select
+import struct
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+class UioInterrupt:
+    """Wait for the interrupts of a UIO device.
+
+    The interrupt is unmasked by writing 1 to the device, and reading the
+    device blocks until the next interrupt, returning the interrupt count.
+
+    Attributes
+    ----------
+    device : str
+        The UIO device path, for example `/dev/uio1`.
+    count : int
+        The interrupt count reported by the last read.
+
+    """
+    def __init__(self, device):
+        """Open the UIO device.
+
+        Parameters
+        ----------
+        device : str
+            The UIO device path, or the name of the device as listed in
+            `/sys/class/uio/uio*/name`.
+
+        """
+        if not device.startswith('/'):
+            device = self.find(device)
+        self.device = device
+        self.count = 0
+        self._fd = os.open(device, os.O_RDWR)
+
+    @staticmethod
+    def find(name):
+        """Return the path of the UIO device with the given name."""
+        for path in sorted(glob.glob('/sys/class/uio/uio*/name')):
+            with open(path) as file:
+                if file.read().strip() == name:
+                    return '/dev/' + path.split('/')[-2]
+        raise ValueError("No UIO device named {}.".format(name))
+
+    def fileno(self):
+        """Return the file descriptor to wait on."""
+        return self._fd
+
+    def enable(self):
+        """Unmask the interrupt, so the next one wakes up a reader."""
+        os.write(self._fd, struct.pack("I", 1))
+
+    def _read(self):
+        self.count = struct.unpack("I", os.read(self.fileno(), 4))[0]
+        return self.count
+
+    def wait(self, timeout=None):
+        """Block until the next interrupt.
+
+        Parameters
+        ----------
+        timeout : float
+            Max number of seconds to wait, `None` to wait forever.
+
+        Returns
+        -------
+        bool
+            True if an interrupt arrived, False on timeout.
+
+        """
+        self.enable()
+        readable, _, _ = select.select([self.fileno()], [], [], timeout)
+        if not readable:
+            return False
+        self._read()
+        return True
+
+    async def wait_async(self):
+        """Wait for the next interrupt without blocking the event loop."""
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def ready():
+            loop.remove_reader(self.fileno())
+            if not future.done():
+                future.set_result(self._read())
+
+        self.enable()
+        loop.add_reader(self.fileno(), ready)
+        try:
+            return await future
+        finally:
+            loop.remove_reader(self.fileno())
+
+    def close(self):
+        """Close the UIO device."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class SimulatedUio(UioInterrupt):
+    """Stand-in for a UIO device, backed by a pipe.
+
+    Calling `trigger()` behaves like the hardware raising the interrupt, so
+    the code waiting on a UIO device can run without the overlay.
+
+    """
+    def __init__(self):
+        self.device = None
+        self.count = 0
+        self.enabled = False
+        self._fd, self._write_fd = os.pipe()
+
+    def enable(self):
+        self.enabled = True
+
+    def trigger(self):
+        """Raise the interrupt."""
+        self.count += 1
+        os.write(self._write_fd, struct.pack("I", self.count))
+
+    def close(self):
+        super().close()
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
@@ -0,0 +1,100 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import types
+import pytest
+from .fakes import FakeMMIO, FakeBram, SimulatedCore, SimulatedMac
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+@pytest.fixture
+def fake_pl(monkeypatch):
+    """Patch the PL and MMIO used by the accelerator register map."""
+    pytest.importorskip('pynq')
+    from pynq_networking.lib import accelerator_registers
+    pl = types.SimpleNamespace(bitfile_name='mqttsn.bit', timestamp='now',
+                               ip_dict={})
+    monkeypatch.setattr(accelerator_registers, 'PL', pl)
+    monkeypatch.setattr(accelerator_registers, 'MMIO', FakeMMIO)
+    monkeypatch.setattr(accelerator_registers.AcceleratorRegisters, 'mmio',
+                        None)
+    return pl
+
+
+@pytest.fixture
+def fake_iop(fake_pl, monkeypatch):
+    """Patch the network IOP with a BRAM in memory; return its MMIO."""
+    from pynq_networking.lib import network_iop, arbiter
+    fake_pl.ip_dict['networkIOP/axi_bram_ctrl_0'] = {
+        'phys_addr': 0x46000000, 'addr_range': 0x2000, 'type': ''}
+    monkeypatch.setattr(network_iop, 'PL', fake_pl)
+    monkeypatch.setattr(network_iop, 'MMIO', FakeBram)
+    monkeypatch.setattr(network_iop.NetworkIOP, 'mmio', None)
+    monkeypatch.setattr(arbiter, '_arbiter', None)
+    return network_iop.NetworkIOP().mmio
+
+
+@pytest.fixture
+def slurper(fake_iop):
+    """A `PacketSlurper` over the fake network IOP."""
+    from pynq_networking.lib.slurper import PacketSlurper
+    slurper = PacketSlurper()
+    yield slurper
+    slurper.stop_writer()
+
+
+@pytest.fixture
+def mac(slurper):
+    """The simulated hardware taking the frames of the slurper fixture."""
+    mac = SimulatedMac(slurper)
+    yield mac
+    mac.stop()
+
+
+@pytest.fixture
+def accelerator(fake_pl, fake_iop, monkeypatch):
+    """An `Accelerator` over a fake register file, without the C library."""
+    pytest.importorskip('wurlitzer')
+    from pynq_networking.lib import accelerator as module
+    fake_pl.bitfile_name = module.BITFILE
+    monkeypatch.setattr(module, 'PL', fake_pl)
+    cffi = pytest.importorskip('cffi')
+    dll = types.SimpleNamespace(sds_mmap=lambda phys, length, virt: None)
+    monkeypatch.setattr(module, '_ffi_handle', (cffi.FFI(), dll))
+    return module.Accelerator()
+
+
+@pytest.fixture
+def core(accelerator):
+    """The simulated control register of the accelerator fixture."""
+    return SimulatedCore(accelerator.registers.mmio)
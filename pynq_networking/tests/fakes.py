@@ -0,0 +1,177 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import mmap
+import threading
+import time
+import pytest
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+# control register bits, as in accelerator.py
+AP_START = 0x1
+AP_DONE = 0x2
+AP_IDLE = 0x4
+AP_READY = 0x8
+AUTO_RESTART = 0x80
+
+
+class FakeMMIO:
+    """Register file standing in for `pynq.MMIO`.
+
+    `on_write` maps an offset to a hook called with the value written, so
+    a test can model how the hardware reacts to a register write.
+
+    """
+    def __init__(self, base_addr, length=0x10000):
+        self.base_addr = base_addr
+        self.length = length
+        self.virt_offset = 0
+        self.registers = {}
+        self.writes = []
+        self.on_write = {}
+
+    def read(self, offset, length=4):
+        return self.registers.get(offset, 0)
+
+    def write(self, offset, value):
+        self.writes.append((offset, value))
+        self.registers[offset] = value
+        hook = self.on_write.get(offset)
+        if hook is not None:
+            hook(value)
+
+
+class FakeBram(FakeMMIO):
+    """Memory-backed `pynq.MMIO`, exposing `mem` and `array` like pynq.
+
+    The memory is a shared mapping, so forked processes see the same BRAM.
+
+    """
+    def __init__(self, base_addr, length=0x2000):
+        super().__init__(base_addr, length)
+        numpy = pytest.importorskip('numpy')
+        self.mem = mmap.mmap(-1, length)
+        self.array = numpy.frombuffer(self.mem, dtype=numpy.uint32)
+
+    def read(self, offset, length=4):
+        return int(self.array[offset >> 2])
+
+    def write(self, offset, value):
+        self.array[offset >> 2] = value
+
+
+class SimulatedCore:
+    """Model of the accelerator control register on a `FakeMMIO`.
+
+    Writing ap_start runs one event, which only counts when the reset
+    register is clear. With auto_restart also set, events keep running in
+    a thread until the control register is written without it.
+
+    """
+    def __init__(self, mmio, event_time=0.0005):
+        self.mmio = mmio
+        self.event_time = event_time
+        self.resets = 0
+        self.thread = None
+        mmio.registers[0x0] = AP_IDLE
+        mmio.on_write[0x0] = self.control
+
+    def event(self):
+        registers = self.mmio.registers
+        if registers.get(0x7c):
+            self.resets += 1
+            return
+        for offset in (0x8c, 0x94, 0xa4):
+            registers[offset] = registers.get(offset, 0) + 1
+
+    def control(self, value):
+        registers = self.mmio.registers
+        if value & AUTO_RESTART and value & AP_START:
+            registers[0x0] = AUTO_RESTART | AP_START
+            self.thread = threading.Thread(target=self.free_run)
+            self.thread.start()
+        elif value & AP_START:
+            self.event()
+            registers[0x0] = AP_DONE | AP_IDLE | AP_READY
+        elif self.thread is None:
+            registers[0x0] = AP_IDLE
+
+    def free_run(self):
+        registers = self.mmio.registers
+        while True:
+            time.sleep(self.event_time)
+            self.event()
+            if not registers[0x0] & AUTO_RESTART:
+                break
+        registers[0x0] = AP_DONE | AP_IDLE
+        self.thread = None
+
+
+class SimulatedMac:
+    """Thread taking the frames written into the TX window of a slurper.
+
+    Like the hardware, it copies each frame out once `TX_EN` is set, then
+    clears `TX_EN`; the frames are kept in `frames`.
+
+    """
+    def __init__(self, slurper):
+        self.slurper = slurper
+        self.frames = []
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def run(self):
+        slurper = self.slurper
+        array = slurper.array
+        start = slurper.TX_DATA_OFFSET << 2
+        while not self._stopping.is_set():
+            if array[slurper.TX_EN_OFFSET]:
+                length = int(array[slurper.TX_LEN_OFFSET])
+                self.frames.append(bytes(slurper.mem[start:start + length]))
+                array[slurper.TX_EN_OFFSET] = 0
+            else:
+                time.sleep(0.0001)
+
+    def stop(self):
+        self._stopping.set()
+        self._thread.join()
+
+
+def deliver(slurper, frame):
+    """Put a frame in the RX window of a slurper, as the hardware does."""
+    start = slurper.RX_DATA_OFFSET << 2
+    slurper.mem[start:start + len(frame)] = frame
+    slurper.array[slurper.RX_LEN_OFFSET] = len(frame)
+    slurper.array[slurper.RX_EN_OFFSET] = 1
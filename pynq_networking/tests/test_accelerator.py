@@ -0,0 +1,155 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import threading
+import time
+import types
+from concurrent.futures import CancelledError
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib.accelerator import AP_START, AP_IDLE, AUTO_RESTART
+from .fakes import FakeBram
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def run_args(count, fake_iop, verbose=0):
+    sensor = types.SimpleNamespace(mmio=FakeBram(0x40000000, 0x10000))
+    network = types.SimpleNamespace(mmio=fake_iop)
+    return (100, count, 0x000a35000102, '192.168.1.99', '192.168.3.99',
+            1884, 1, 0, verbose, network, sensor)
+
+
+def control_writes(mmio):
+    return [value for offset, value in mmio.writes if offset == 0x0]
+
+
+def test_free_running(accelerator, fake_iop, core):
+    mmio = accelerator.registers.mmio
+    result = accelerator.publish_free_running(*run_args(20, fake_iop),
+                                              poll_interval=0.001)
+    assert control_writes(mmio) == [AP_START, AUTO_RESTART | AP_START, 0]
+    assert core.thread is None
+    assert core.resets == 1
+    assert result['events_completed'] >= 20
+    assert result['events_completed'] == mmio.registers[0x8c]
+    assert result['events_per_second'] > 0
+    assert mmio.registers[0x7c] == 0
+    assert not mmio.registers[0x0] & AUTO_RESTART
+
+
+def test_free_running_stops_on_error(accelerator, fake_iop, core,
+                                     monkeypatch):
+    from pynq_networking.lib import accelerator as module
+
+    def interrupted(seconds):
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(module, 'time', types.SimpleNamespace(
+        sleep=interrupted, perf_counter=time.perf_counter))
+    mmio = accelerator.registers.mmio
+    with pytest.raises(KeyboardInterrupt):
+        accelerator.publish_free_running(*run_args(1000, fake_iop))
+    assert control_writes(mmio)[-1] == 0
+    assert mmio.registers[0x0] & AP_IDLE
+    assert mmio.registers[0x8c] < 1000
+
+
+def test_abort(accelerator, fake_iop, core):
+    mmio = accelerator.registers.mmio
+    accelerator.abort()
+    assert (0x7c, 1) in mmio.writes
+    assert control_writes(mmio) == [AP_START]
+    assert core.resets == 1
+    assert mmio.registers.get(0x8c, 0) == 0
+
+
+def test_cancel_aborts(accelerator, fake_iop, core, capsys):
+    mmio = accelerator.registers.mmio
+    cancel = threading.Event()
+
+    def progress(completed, total):
+        if completed >= 5:
+            cancel.set()
+
+    with pytest.raises(CancelledError):
+        accelerator.publish_mmio(*run_args(100, fake_iop),
+                                 progress=progress, cancel=cancel)
+    assert mmio.registers[0x8c] == 5
+    assert mmio.registers[0x7c] == 1
+    assert core.resets == 2
+    assert accelerator.arbiter.owner is None
+
+
+def test_publish_quiet_unless_verbose(accelerator, fake_iop, core, capsys):
+    result = accelerator.publish_mmio(*run_args(1000, fake_iop))
+    assert capsys.readouterr().out == ''
+    assert result == {'events_completed': 1000, 'publishes_sent': 1000,
+                      'packets_received': 0, 'packets_sent': 1000}
+    result = accelerator.publish_mmio(*run_args(1000, fake_iop, verbose=1))
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].startswith('calls')
+    assert output[1:] == ['{}: {}'.format(name, value)
+                          for name, value in result.items()]
+
+
+def batch_args(fake_iop):
+    args = run_args(0, fake_iop)
+    return args[:1] + args[2:6] + args[8:]
+
+
+def test_batch_reprograms_between_jobs(accelerator, fake_iop, core):
+    mmio = accelerator.registers.mmio
+    programmed = {0x44: [], 0x4c: []}
+    for offset, values in programmed.items():
+        mmio.on_write[offset] = lambda value, values=values: values.append(
+            (value, mmio.registers.get(0x8c, 0)))
+    progress = []
+    jobs = [(7, 1, 10), (7, 1, 5), (9, 0, 8)]
+    results = accelerator.publish_batch(
+        jobs, *batch_args(fake_iop),
+        progress=lambda completed, total: progress.append((completed, total)))
+    assert results == [{'topic_id': 7, 'qos': 1, 'events_completed': 10},
+                       {'topic_id': 7, 'qos': 1, 'events_completed': 5},
+                       {'topic_id': 9, 'qos': 0, 'events_completed': 8}]
+    # written once by the setup, then only when the next job changes them
+    assert programmed[0x44] == [(7, 0), (9, 15)]
+    assert programmed[0x4c] == [(1, 0), (0, 15)]
+    assert control_writes(mmio).count(AP_START) == 24
+    assert core.resets == 1
+    assert progress[-1] == (23, 23)
+    assert accelerator.arbiter.owner is None
+
+
+def test_batch_empty(accelerator, fake_iop, core):
+    assert accelerator.publish_batch([], *batch_args(fake_iop)) == []
+    assert control_writes(accelerator.registers.mmio) == []
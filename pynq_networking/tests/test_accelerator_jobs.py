@@ -0,0 +1,142 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+from concurrent.futures import CancelledError
+import pytest
+from pynq_networking.lib.accelerator_jobs import AcceleratorJobQueue
+from pynq_networking.lib.accelerator_jobs import job_cancelled
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+class FakeAccelerator:
+    """Runs `publish_mmio()` one event at a time, gated by the tests."""
+    def __init__(self):
+        self.runs = []
+        self.started = threading.Event()
+        self.step = threading.Semaphore(0)
+
+    def publish_mmio(self, size, count, *args, progress=None, cancel=None):
+        self.runs.append((size, count) + args)
+        self.started.set()
+        for event in range(1, count + 1):
+            while not self.step.acquire(timeout=0.01):
+                if cancel is not None and cancel.is_set():
+                    raise CancelledError("cancelled after {} events".format(
+                        event - 1))
+            if size < 0:
+                raise RuntimeError("bad frame size")
+            if progress is not None:
+                progress(event, count)
+        return {'events_completed': count}
+
+
+def submit(jobs, size, count, progress=None):
+    return jobs.submit(size, count, 1, 2, 3, 1884, 7, 0, 0, 'net', 'sensor',
+                       progress=progress)
+
+
+@pytest.fixture
+def accelerator():
+    return FakeAccelerator()
+
+
+@pytest.fixture
+def jobs(accelerator):
+    jobs = AcceleratorJobQueue(accelerator)
+    yield jobs
+    for _ in range(100):
+        accelerator.step.release()
+    jobs.shutdown(cancel_pending=True)
+
+
+def test_result_and_progress(jobs, accelerator):
+    seen = []
+    future = submit(jobs, 100, 3, lambda done, total: seen.append(done))
+    for _ in range(3):
+        accelerator.step.release()
+    assert future.result(1.0) == {'events_completed': 3}
+    assert seen == [1, 2, 3]
+    assert accelerator.runs == [(100, 3, 1, 2, 3, 1884, 7, 0, 0, 'net',
+                                 'sensor')]
+
+
+def test_runs_in_order(jobs, accelerator):
+    futures = [submit(jobs, 100 + i, 1) for i in range(3)]
+    assert accelerator.started.wait(1.0)
+    assert jobs.pending() == 2
+    for _ in range(3):
+        accelerator.step.release()
+    assert [f.result(1.0) for f in futures] == [{'events_completed': 1}] * 3
+    assert [run[0] for run in accelerator.runs] == [100, 101, 102]
+
+
+def test_error(jobs, accelerator):
+    future = submit(jobs, -1, 1)
+    accelerator.step.release()
+    with pytest.raises(RuntimeError):
+        future.result(1.0)
+    assert not job_cancelled(future)
+
+
+def test_cancel_pending(jobs, accelerator):
+    running = submit(jobs, 100, 1)
+    pending = submit(jobs, 101, 1)
+    assert accelerator.started.wait(1.0)
+    assert jobs.cancel(pending)
+    assert pending.cancelled() and job_cancelled(pending)
+    accelerator.step.release()
+    assert running.result(1.0) == {'events_completed': 1}
+    jobs.shutdown()
+    assert len(accelerator.runs) == 1
+
+
+def test_cancel_running(jobs, accelerator):
+    future = submit(jobs, 100, 5)
+    assert accelerator.started.wait(1.0)
+    accelerator.step.release()
+    assert jobs.cancel(future)
+    with pytest.raises(CancelledError):
+        future.result(1.0)
+    assert job_cancelled(future)
+    assert not future.cancelled()
+    assert not jobs.cancel(future)
+
+
+def test_shutdown_cancel_pending(jobs, accelerator):
+    running = submit(jobs, 100, 1)
+    pending = [submit(jobs, 101, 1) for _ in range(2)]
+    assert accelerator.started.wait(1.0)
+    accelerator.step.release()
+    jobs.shutdown(cancel_pending=True)
+    assert running.result(0) == {'events_completed': 1}
+    assert all(future.cancelled() for future in pending)
@@ -0,0 +1,90 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib.accelerator_registers import AcceleratorRegisters
+from pynq_networking.lib.accelerator_registers import ACCELERATOR_IP_NAME
+from pynq_networking.lib.accelerator_registers import ACCELERATOR_BASE_ADDR
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def test_resolve_by_name(fake_pl):
+    fake_pl.ip_dict[ACCELERATOR_IP_NAME] = {
+        'phys_addr': 0x83c10000, 'addr_range': 0x10000, 'type': ''}
+    assert AcceleratorRegisters().base_addr == 0x83c10000
+
+
+def test_resolve_by_vlnv(fake_pl):
+    fake_pl.ip_dict['leds_gpio'] = {
+        'phys_addr': 0x41250000, 'addr_range': 0x10000,
+        'type': 'xilinx.com:ip:axi_gpio:2.0'}
+    fake_pl.ip_dict['publisher'] = {
+        'phys_addr': 0x43c20000, 'addr_range': 0x10000,
+        'type': 'xilinx.com:hls:read_and_process_packet:1.1'}
+    assert AcceleratorRegisters().base_addr == 0x43c20000
+
+
+def test_resolve_explicit_name(fake_pl):
+    fake_pl.ip_dict['other'] = {
+        'phys_addr': 0x43c30000, 'addr_range': 0x10000, 'type': ''}
+    assert AcceleratorRegisters('other').base_addr == 0x43c30000
+
+
+def test_resolve_default(fake_pl):
+    fake_pl.ip_dict['audio_direct_0'] = {
+        'phys_addr': 0x43c00000, 'addr_range': 0x10000,
+        'type': 'xilinx.com:user:audio_direct:1.1'}
+    fake_pl.ip_dict['networkIOP/packetSlurper_0'] = {
+        'phys_addr': 0x43c10000, 'addr_range': 0x10000,
+        'type': 'xilinx.com:hls:packetSlurper:1.0'}
+    assert AcceleratorRegisters().base_addr == ACCELERATOR_BASE_ADDR == \
+        0x83c00000
+
+
+def test_resolve_missing(fake_pl):
+    with pytest.raises(ValueError, match='No IP named missing'):
+        AcceleratorRegisters('missing')
+
+
+def test_explicit_address(fake_pl):
+    assert AcceleratorRegisters().base_addr == ACCELERATOR_BASE_ADDR
+    assert AcceleratorRegisters(base_addr=0x83c10000).base_addr == \
+        0x83c10000
+
+
+def test_shadow_skips_unchanged_writes(fake_pl):
+    registers = AcceleratorRegisters()
+    assert registers.configure(topic_id=3, qos=1) == 2
+    assert registers.configure(topic_id=3, qos=2) == 1
+    assert registers.mmio.writes == [(0x44, 3), (0x4c, 1), (0x4c, 2)]
@@ -0,0 +1,168 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+import time
+from queue import Full
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib import arbiter as module
+from pynq_networking.lib.arbiter import ACCELERATOR, IOPArbiter, ProcessLock
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def frame(i):
+    return bytes([i]) * 60
+
+
+def wait_frames(mac, count, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while len(mac.frames) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return mac.frames
+
+
+@pytest.fixture
+def arbiter(slurper, monkeypatch):
+    arbiter = IOPArbiter(slurper, max_pending=4)
+    monkeypatch.setattr(module, '_arbiter', arbiter)
+    return arbiter
+
+
+@pytest.fixture
+def other_process(arbiter, tmp_path):
+    """A process lock shared with the arbiter, held by another "process"."""
+    path = str(tmp_path / 'iop.lock')
+    arbiter.process_lock = ProcessLock(path)
+    other = ProcessLock(path)
+    assert other.acquire(blocking=False)
+    yield other
+    other.close()
+    arbiter.process_lock.close()
+
+
+def test_send_free_window(arbiter, mac):
+    assert arbiter.send(frame(1)) is True
+    assert wait_frames(mac, 1) == [frame(1)]
+    assert arbiter.stats['sent'] == 1
+
+
+def test_queued_while_owned(arbiter, mac):
+    arbiter.acquire(ACCELERATOR)
+    assert arbiter.send(frame(1)) is False
+    assert arbiter.send([frame(2)[:14], frame(2)[14:]]) is False
+    assert arbiter.owner == ACCELERATOR
+    assert mac.frames == []
+    arbiter.release(ACCELERATOR)
+    assert wait_frames(mac, 2) == [frame(1), frame(2)]
+    assert arbiter.stats == {'sent': 0, 'queued': 2, 'drained': 2,
+                             'dropped': 0}
+
+
+def test_acquire_exclusive(arbiter, mac):
+    with arbiter.owned(ACCELERATOR):
+        with pytest.raises(TimeoutError):
+            arbiter.acquire('software', timeout=0.01)
+        with pytest.raises(RuntimeError):
+            arbiter.release('software')
+        acquired = threading.Event()
+
+        def other():
+            with arbiter.owned('software', timeout=1.0):
+                acquired.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        assert not acquired.wait(0.05)
+    thread.join()
+    assert acquired.is_set()
+    assert arbiter.owner is None
+
+
+def test_drain_between_frames(arbiter, slurper, mac):
+    with arbiter.owned(ACCELERATOR):
+        for i in range(2):
+            arbiter.send(frame(i))
+        with pytest.raises(RuntimeError):
+            arbiter.drain('software')
+        assert arbiter.drain(ACCELERATOR, limit=1) == 1
+        assert wait_frames(mac, 1) == [frame(0)]
+        # the owner's frame is still waiting for the hardware
+        mac.stop()
+        slurper.array[slurper.TX_EN_OFFSET] = 1
+        assert arbiter.drain(ACCELERATOR) == 0
+        slurper.array[slurper.TX_EN_OFFSET] = 0
+        assert arbiter.drain(ACCELERATOR) == 1
+    assert not arbiter.pending
+
+
+def test_drop_when_full(arbiter, mac):
+    with arbiter.owned(ACCELERATOR):
+        for i in range(4):
+            assert arbiter.send(frame(i)) is False
+        with pytest.raises(Full):
+            arbiter.send(frame(4))
+    assert wait_frames(mac, 4) == [frame(i) for i in range(4)]
+    assert arbiter.stats['dropped'] == 1
+
+
+def test_other_process_owner(arbiter, mac, other_process):
+    assert arbiter.send(frame(1)) is False
+    assert not arbiter.flush(0.01)
+    with pytest.raises(TimeoutError):
+        arbiter.acquire(ACCELERATOR, timeout=0.01)
+    assert arbiter.owner is None
+    other_process.release()
+    # the queued frame goes first on the next send
+    assert arbiter.send(frame(2)) is True
+    assert wait_frames(mac, 2) == [frame(1), frame(2)]
+
+
+def test_writer_drains_after_other_process(arbiter, slurper, mac,
+                                           other_process):
+    slurper.start_writer()
+    assert slurper.send_async(frame(1))
+    slurper._tx_queue.join()
+    assert len(arbiter.pending) == 1
+    other_process.release()
+    assert wait_frames(mac, 1) == [frame(1)]
+    assert not arbiter.pending
+
+
+def test_writer_counts_drops(arbiter, slurper, mac):
+    slurper.start_writer()
+    with arbiter.owned(ACCELERATOR):
+        for i in range(5):
+            assert slurper.send_async(frame(i))
+        slurper._tx_queue.join()
+        assert slurper.tx_stats['dropped'] == 1
+    assert wait_frames(mac, 4) == [frame(i) for i in range(4)]
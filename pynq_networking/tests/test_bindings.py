@@ -0,0 +1,106 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+from kamene.all import Ether, IP, UDP, TCP, Raw
+from pynq_networking.lib import bindings
+from pynq_networking.lib.bindings import bind_mqtt, bind_mqttsn, bound_layers
+from pynq_networking.lib.bindings import unbind_ports, unbind_all
+from pynq_networking.lib.mqtt import MQTT_Stream
+from pynq_networking.lib.mqttsn import MQTTSN, MQTTSN_PINGREQ
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    """Start every test from an empty registry and leave none behind."""
+    saved = dict(bindings._bindings)
+    unbind_all()
+    yield
+    unbind_all()
+    for (lower, upper, fields), count in saved.items():
+        for _ in range(count):
+            bindings.bind_layer(lower, upper, **dict(fields))
+
+
+def dissect(port):
+    frame = Ether() / IP() / UDP(sport=port, dport=port) / MQTTSN() / \
+        MQTTSN_PINGREQ()
+    return Ether(bytes(frame))
+
+
+def test_bind_once():
+    assert bind_mqttsn([1884, 1886]) == [1884, 1886]
+    assert bind_mqttsn([1884]) == []
+    assert sorted(fields['dport'] for _, _, fields in bound_layers()
+                  if 'dport' in fields) == [1884, 1886]
+    assert UDP.payload_guess.count(({'dport': 1884}, MQTTSN)) == 1
+    assert MQTTSN_PINGREQ in dissect(1884)
+
+
+def test_overlapping_owners():
+    bind_mqttsn([1884])
+    bind_mqttsn([1884])
+    unbind_ports(mqttsn_ports=[1884])
+    assert MQTTSN_PINGREQ in dissect(1884)
+    unbind_ports(mqttsn_ports=[1884])
+    assert MQTTSN not in dissect(1884)
+    assert isinstance(dissect(1884)[UDP].payload, Raw)
+    assert bound_layers() == []
+
+
+def test_unbind_unknown_port():
+    bind_mqttsn([1884])
+    unbind_ports(mqttsn_ports=[1886])
+    unbind_ports(mqttsn_ports=[1884])
+    unbind_ports(mqttsn_ports=[1884])
+    assert bound_layers() == []
+    assert bind_mqttsn([1884]) == [1884]
+
+
+def test_mqtt_ports():
+    assert bind_mqtt([1883]) == [1883]
+    assert bind_mqtt([1883]) == []
+    assert (TCP, MQTT_Stream, {'sport': 1883}) in bound_layers()
+    unbind_ports(mqtt_ports=[1883])
+    assert (TCP, MQTT_Stream, {'sport': 1883}) in bound_layers()
+    unbind_ports(mqtt_ports=[1883])
+    assert bound_layers() == []
+
+
+def test_unbind_all():
+    bind_mqtt([1883])
+    bind_mqttsn([1884])
+    bind_mqttsn([1884])
+    unbind_all()
+    assert bound_layers() == []
+    assert MQTTSN not in dissect(1884)
@@ -0,0 +1,93 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import threading
+from pynq_networking.lib.broker_log import BrokerLogMonitor
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+LINE = b'20261019 120000.000 3 client <- MQTT-S PUBLISH msgid: 1\n'
+
+
+def test_counters(tmp_path):
+    log = str(tmp_path / 'broker.log')
+    with open(log, 'wb') as f:
+        f.write(b'<- CONNECT\n-> PUBLISH\n-> PUBLISH\nqueued messages: 7\n')
+        f.write(b'<- PUBL')
+    monitor = BrokerLogMonitor(log)
+    assert monitor.poll() == 4
+    with open(log, 'ab') as f:
+        f.write(b'ISH\n')
+    assert monitor.poll() == 1
+    snapshot = monitor.snapshot()
+    assert snapshot['connects'] == 1
+    assert snapshot['publishes_in'] == 1
+    assert snapshot['publishes_out'] == 2
+    assert snapshot['queued_peak'] == 7
+
+
+def test_offset_persisted(tmp_path):
+    log = str(tmp_path / 'broker.log')
+    with open(log, 'wb') as f:
+        f.write(LINE * 3)
+    BrokerLogMonitor(log).poll()
+    with open(log, 'ab') as f:
+        f.write(LINE)
+    monitor = BrokerLogMonitor(log)
+    assert monitor.poll() == 1
+
+
+def test_rotate_under_writer(tmp_path):
+    log = str(tmp_path / 'broker.log')
+    open(log, 'wb').close()
+    monitor = BrokerLogMonitor(log, max_size=4096, backups=1)
+    total = 20000
+
+    def writer():
+        fd = os.open(log, os.O_WRONLY | os.O_APPEND)
+        try:
+            for _ in range(total):
+                os.write(fd, LINE)
+        finally:
+            os.close(fd)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while thread.is_alive():
+        monitor.poll()
+    thread.join()
+    monitor.poll()
+    assert monitor.counters['publishes_in'] == total
+    assert os.path.getsize(log) < 4096 + len(LINE) * total // 2
+    assert os.path.getsize(log + '.1') > 0
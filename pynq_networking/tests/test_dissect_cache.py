@@ -0,0 +1,109 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+from kamene.all import Ether, IP, UDP
+from pynq_networking.lib.bindings import bind_mqttsn, unbind_ports
+from pynq_networking.lib.dissect_cache import DissectionCache, FrozenPacket
+from pynq_networking.lib.mqttsn import MQTTSN, MQTTSN_PUBACK
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+@pytest.fixture
+def puback():
+    bind_mqttsn([1884])
+    try:
+        yield bytes(Ether() / IP() / UDP(sport=1884, dport=1884) /
+                    MQTTSN() / MQTTSN_PUBACK(topicID=1, messageID=2))
+    finally:
+        unbind_ports(mqttsn_ports=[1884])
+
+
+def test_cache_hit(puback):
+    cache = DissectionCache()
+    first = cache.dissect(puback, Ether)
+    second = cache.dissect(puback, Ether)
+    assert isinstance(second, FrozenPacket)
+    assert isinstance(second, Ether)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert bytes(second) == bytes(first) == puback
+
+
+def test_frozen_inner_layers(puback):
+    cache = DissectionCache()
+    packet = cache.dissect(puback, Ether)
+    with pytest.raises(AttributeError):
+        packet[MQTTSN_PUBACK].topicID = 99
+    with pytest.raises(AttributeError):
+        packet.getlayer(MQTTSN_PUBACK).topicID = 99
+    with pytest.raises(AttributeError):
+        packet.payload.payload.ttl = 1
+    with pytest.raises(AttributeError):
+        packet[IP].setfieldval('ttl', 1)
+    with pytest.raises(TypeError):
+        packet[MQTTSN] = MQTTSN_PUBACK()
+    assert cache.dissect(puback, Ether)[MQTTSN_PUBACK].topicID == 1
+    assert bytes(cache.dissect(puback, Ether)) == puback
+
+
+def test_frozen_dicts(puback):
+    cache = DissectionCache()
+    packet = cache.dissect(puback, Ether)
+    for fields in (packet.fields, packet[IP].fields,
+                   packet[MQTTSN_PUBACK].fields,
+                   packet[MQTTSN_PUBACK].overloaded_fields,
+                   packet[MQTTSN_PUBACK].default_fields):
+        with pytest.raises(TypeError):
+            fields['topicID'] = 99
+    with pytest.raises(AttributeError):
+        packet[MQTTSN_PUBACK].fields.clear()
+    assert packet[MQTTSN_PUBACK].fields['topicID'] == 1
+    assert cache.dissect(puback, Ether)[MQTTSN_PUBACK].topicID == 1
+    assert bytes(cache.dissect(puback, Ether)) == puback
+
+
+def test_copy_is_mutable(puback):
+    cache = DissectionCache()
+    packet = cache.dissect(puback, Ether).copy()
+    packet[MQTTSN_PUBACK].topicID = 99
+    assert packet[MQTTSN_PUBACK].topicID == 99
+    assert cache.dissect(puback, Ether)[MQTTSN_PUBACK].topicID == 1
+
+
+def test_time_is_per_view(puback):
+    cache = DissectionCache()
+    first = cache.dissect(puback, Ether)
+    first.time = 1.0
+    second = cache.dissect(puback, Ether)
+    second.time = 2.0
+    assert first.time == 1.0
@@ -0,0 +1,194 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import asyncio
+import socket
+import struct
+import threading
+import pytest
+from pynq_networking.lib.gateway import MQTTSNGateway, encode_packet
+from pynq_networking.lib.gateway import decode_packet, CONNECT, CONNACK
+from pynq_networking.lib.gateway import PUBLISH, PUBACK, PUBREC, PUBREL
+from pynq_networking.lib.gateway import PUBCOMP, SUBSCRIBE, FLAG_DUP
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def free_udp_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def connect(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(2.0)
+        sock.sendto(encode_packet(CONNECT, b'\x04\x01\x00\x3cclient'),
+                    ('127.0.0.1', port))
+        msg_type, _ = decode_packet(sock.recv(1024))
+        return msg_type
+
+
+SUBSCRIBER = ('10.0.0.2', 5000)
+PUBLISHER = ('10.0.0.3', 5000)
+
+
+def subscribed_gateway(qos, **kwargs):
+    gateway = MQTTSNGateway(**kwargs)
+    for addr in (SUBSCRIBER, PUBLISHER):
+        gateway.handle(encode_packet(CONNECT, b'\x04\x01\x00\x3cclient'),
+                       addr)
+    gateway.handle(encode_packet(SUBSCRIBE, bytes([qos << 5]) +
+                                 b'\x00\x01sensors'), SUBSCRIBER)
+    return gateway, gateway.topic_id('sensors')
+
+
+def publish(gateway, topic_id, msg_id):
+    out = gateway.handle(encode_packet(PUBLISH, struct.pack(
+        "!BHH", 1 << 5, topic_id, msg_id) + b'data'), PUBLISHER)
+    return [decode_packet(packet) for packet, addr in out
+            if addr == SUBSCRIBER]
+
+
+def test_gateway_inflight_bounded():
+    gateway, topic_id = subscribed_gateway(1, max_inflight=4)
+    for msg_id in range(1, 11):
+        publish(gateway, topic_id, msg_id)
+    inflight = gateway.sessions[SUBSCRIBER].inflight
+    assert len(inflight) == 4
+    assert gateway.stats['expired'] == 6
+
+
+def test_gateway_retransmit_then_expire():
+    gateway, topic_id = subscribed_gateway(1, retry_interval=1.0,
+                                           max_retries=2)
+    [(msg_type, body)] = publish(gateway, topic_id, 1)
+    assert msg_type == PUBLISH and not body[0] & FLAG_DUP
+    msg_id = struct.unpack("!H", body[3:5])[0]
+    now = gateway.sessions[SUBSCRIBER].inflight[msg_id][1]
+    assert gateway.retransmit(now + 0.5) == []
+    for retry in range(1, 3):
+        [(packet, addr)] = gateway.retransmit(now + retry)
+        msg_type, resent = decode_packet(packet)
+        assert addr == SUBSCRIBER and msg_type == PUBLISH
+        assert resent[0] & FLAG_DUP and resent[1:] == body[1:]
+    assert gateway.retransmit(now + 3) == []
+    assert gateway.sessions[SUBSCRIBER].inflight == {}
+    assert gateway.stats['retransmits'] == 2
+    assert gateway.stats['expired'] == 1
+
+
+def test_gateway_ack_clears_inflight():
+    gateway, topic_id = subscribed_gateway(1, retry_interval=0.0)
+    [(_, body)] = publish(gateway, topic_id, 1)
+    gateway.handle(encode_packet(PUBACK, body[1:5] + b'\x00'), SUBSCRIBER)
+    assert gateway.sessions[SUBSCRIBER].inflight == {}
+    assert gateway.retransmit() == []
+
+
+def test_gateway_qos2_retransmits_pubrel():
+    gateway, topic_id = subscribed_gateway(2, retry_interval=0.0)
+    [(_, body)] = publish(gateway, topic_id, 1)
+    msg_id = body[3:5]
+    gateway.handle(encode_packet(PUBREC, msg_id), SUBSCRIBER)
+    [(packet, _)] = gateway.retransmit()
+    assert decode_packet(packet) == (PUBREL, msg_id)
+    gateway.handle(encode_packet(PUBCOMP, msg_id), SUBSCRIBER)
+    assert gateway.retransmit() == []
+
+
+def test_gateway_open_timeout_joins_thread(monkeypatch):
+    gateway = MQTTSNGateway('127.0.0.1', free_udp_port())
+
+    async def hang():
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(gateway, 'start', hang)
+    with pytest.raises(OSError):
+        gateway.open(timeout=0.1)
+    assert gateway._thread is None
+    assert not any(thread.name == "mqttsn-gateway"
+                   for thread in threading.enumerate())
+
+
+def test_gateway_reopen():
+    port = free_udp_port()
+    gateway = MQTTSNGateway('127.0.0.1', port)
+    for _ in range(3):
+        gateway.open()
+        assert connect(port) == CONNACK
+        gateway.close()
+    assert gateway.stats['connects'] == 3
+
+
+def test_gateway_port_released():
+    port = free_udp_port()
+    gateway = MQTTSNGateway('127.0.0.1', port)
+    gateway.open()
+    gateway.close()
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', port))
+
+
+def test_broker_python_engine_reopen():
+    pytest.importorskip('netifaces')
+    from pynq_networking.lib.broker import Broker
+    port = free_udp_port()
+    broker = Broker('127.0.0.1', mqttsn_port=port, engine='python')
+    try:
+        broker.open()
+        broker.open()
+        assert connect(port) == CONNACK
+    finally:
+        broker.close()
+
+
+def test_broker_close_unbinds_own_ports():
+    pytest.importorskip('netifaces')
+    from pynq_networking.lib.broker import Broker
+    from pynq_networking.lib.bindings import bind_mqttsn, bound_layers
+    from pynq_networking.lib.bindings import unbind_ports
+    port = free_udp_port()
+    bind_mqttsn([port])
+    broker = Broker('127.0.0.1', mqtt_port=port + 1, mqttsn_port=port,
+                    engine='python')
+    try:
+        broker.open()
+        ports = [fields for _, _, fields in bound_layers()]
+        assert {'dport': port + 1} in ports
+        broker.close()
+        ports = [fields for _, _, fields in bound_layers()]
+        assert {'dport': port + 1} not in ports
+        assert {'dport': port} in ports
+    finally:
+        broker.close()
+        unbind_ports(mqttsn_ports=[port])
@@ -0,0 +1,122 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import asyncio
+import threading
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib.accelerator import AP_DONE, AP_IDLE
+from pynq_networking.lib.uio import SimulatedUio
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def complete_later(mmio, irq, delay=0.05):
+    """Set ap_done and ap_idle, then raise the interrupt."""
+    def done():
+        mmio.registers[0x0] = AP_DONE | AP_IDLE
+        mmio.registers[0x0c] = 1
+        irq.trigger()
+    timer = threading.Timer(delay, done)
+    timer.start()
+    return timer
+
+
+def test_enable_interrupts(accelerator):
+    mmio = accelerator.registers.mmio
+    irq = SimulatedUio()
+    accelerator.enable_interrupts(irq)
+    assert accelerator.irq is irq
+    assert mmio.registers[0x08] == 0x3
+    assert mmio.registers[0x04] == 1
+    accelerator.disable_interrupts()
+    assert accelerator.irq is None
+    assert mmio.registers[0x04] == 0
+    assert mmio.registers[0x08] == 0
+
+
+def test_wait_status(accelerator):
+    mmio = accelerator.registers.mmio
+    irq = SimulatedUio()
+    accelerator.enable_interrupts(irq)
+    timer = complete_later(mmio, irq)
+    try:
+        assert accelerator.wait_status(mmio, AP_DONE, timeout=2.0) & AP_DONE
+    finally:
+        timer.join()
+        accelerator.disable_interrupts()
+    assert irq.enabled
+    assert irq.count == 1
+
+
+def test_wait_status_already_set(accelerator):
+    mmio = accelerator.registers.mmio
+    accelerator.enable_interrupts(SimulatedUio())
+    mmio.registers[0x0] = AP_IDLE
+    try:
+        assert accelerator.wait_status(mmio, AP_IDLE, timeout=0.01) == \
+            AP_IDLE
+    finally:
+        accelerator.disable_interrupts()
+
+
+def test_wait_status_timeout(accelerator):
+    mmio = accelerator.registers.mmio
+    accelerator.enable_interrupts(SimulatedUio())
+    try:
+        with pytest.raises(TimeoutError):
+            accelerator.wait_status(mmio, AP_DONE, timeout=0.05)
+    finally:
+        accelerator.disable_interrupts()
+
+
+def test_wait_status_async(accelerator):
+    mmio = accelerator.registers.mmio
+    irq = SimulatedUio()
+    accelerator.enable_interrupts(irq)
+
+    async def wait():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, lambda: complete_later(mmio, irq, 0))
+        return await asyncio.wait_for(
+            accelerator.wait_status_async(mmio, AP_DONE), 2.0)
+
+    try:
+        assert asyncio.run(wait()) & AP_DONE
+    finally:
+        accelerator.disable_interrupts()
+
+
+def test_wait_status_async_needs_interrupts(accelerator):
+    mmio = accelerator.registers.mmio
+    with pytest.raises(RuntimeError):
+        asyncio.run(accelerator.wait_status_async(mmio, AP_DONE))
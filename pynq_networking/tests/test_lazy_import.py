@@ -0,0 +1,87 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import subprocess
+import sys
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The parent package imports the overlay, hence pynq and numpy, so only the
+# lib subpackage is imported here, below an empty parent package.
+PRELUDE = """
+import sys, types
+package = types.ModuleType('pynq_networking')
+package.__path__ = [{!r}]
+sys.modules['pynq_networking'] = package
+import pynq_networking.lib as lib
+""".format(PACKAGE)
+
+
+def run(code):
+    result = subprocess.run([sys.executable, '-c', PRELUDE + code],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_import_is_lazy():
+    output = run("print(sorted(m for m in sys.modules "
+                 "if m.split('.')[0] in ('kamene', 'numpy')))")
+    assert output.strip() == '[]'
+
+
+def test_lazy_names_resolve():
+    output = run("""
+for module, names in lib._LAZY_NAMES.items():
+    for name in names:
+        assert getattr(lib, name) is getattr(
+            sys.modules['pynq_networking.lib' + module], name), name
+assert set(lib._LAZY_MODULES) <= set(dir(lib))
+print('kamene' in sys.modules)
+""")
+    assert output.strip() == 'True'
+
+
+def test_eager_before_python_37():
+    output = run("""
+import importlib
+sys.version_info = (3, 6, 5)
+importlib.reload(lib)
+assert set(lib._LAZY_MODULES) <= set(vars(lib))
+print('kamene' in sys.modules)
+""")
+    assert output.strip() == 'True'
@@ -0,0 +1,100 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+from kamene.all import Ether, IP, UDP, Raw
+from pynq_networking.lib.bindings import bind_mqttsn, unbind_ports
+from pynq_networking.lib.mqtt import MQTT, MQTT_PACKET_TYPES
+from pynq_networking.lib.mqttsn import MQTTSN, MQTTSN_PACKET_TYPES
+from pynq_networking.lib.mqttsn import MQTTSN_PUBLISH
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+@pytest.mark.parametrize('cls', MQTTSN_PACKET_TYPES,
+                         ids=lambda cls: cls.name)
+def test_mqttsn_round_trip(cls):
+    data = bytes(MQTTSN() / cls())
+    assert data[1] == cls.type
+    packet = MQTTSN(data)
+    assert packet.type == cls.type
+    if len(data) > 2:
+        assert type(packet.payload) is cls
+    assert bytes(packet) == data
+
+
+@pytest.mark.parametrize('cls', MQTT_PACKET_TYPES,
+                         ids=lambda cls: cls.name)
+def test_mqtt_round_trip(cls):
+    data = bytes(MQTT() / cls())
+    assert data[0] >> 4 == cls.type
+    packet = MQTT(data)
+    assert packet.type == cls.type
+    if len(data) > 2:
+        assert type(packet.payload) is cls
+    assert bytes(packet) == data
+
+
+def test_mqttsn_unknown_type():
+    data = bytes([5, 0x03, 1, 2, 3])
+    packet = MQTTSN(data)
+    assert packet.type == 0x03
+    assert isinstance(packet.payload, Raw)
+    assert bytes(packet) == data
+
+
+def test_mqttsn_frame():
+    bind_mqttsn([1884])
+    try:
+        frame = Ether() / IP() / UDP(sport=1884, dport=1884) / MQTTSN() / \
+            MQTTSN_PUBLISH(qos=1, topicID=7, message=b'hello')
+        packet = Ether(bytes(frame))
+        assert packet[MQTTSN_PUBLISH].topicID == 7
+        assert packet[MQTTSN_PUBLISH].message == b'hello'
+    finally:
+        unbind_ports(mqttsn_ports=[1884])
+
+
+@pytest.mark.parametrize('size', [200, 255, 256, 1000])
+def test_mqttsn_long_length(size):
+    message = bytes(range(256)) * (size // 256) + b'x' * (size % 256)
+    data = bytes(MQTTSN() / MQTTSN_PUBLISH(topicID=7, message=message))
+    length = len(data)
+    if length <= 255:
+        assert data[0] == length
+    else:
+        assert data[:3] == b'\x01' + length.to_bytes(2, 'big')
+    packet = MQTTSN(data)
+    assert packet.len == length
+    assert packet[MQTTSN_PUBLISH].topicID == 7
+    assert packet[MQTTSN_PUBLISH].message == message
+    assert bytes(packet) == data
@@ -0,0 +1,191 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+import threading
+import time
+import types
+from concurrent.futures import CancelledError
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib.arbiter import ACCELERATOR
+from pynq_networking.lib.offload import PublishScheduler, _PathStats
+from pynq_networking.lib.offload import HARDWARE, SOFTWARE
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+class FakeAccelerator:
+    """Runs `publish_mmio()` once released by the tests."""
+    def __init__(self):
+        self.arbiter = types.SimpleNamespace(owner=None)
+        self.runs = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.sensor_reads = 0
+
+    def publish_mmio(self, size, count, *args, progress=None, cancel=None):
+        self.runs.append((size, count) + args)
+        self.started.set()
+        while not self.release.wait(0.01):
+            if cancel.is_set():
+                raise CancelledError()
+        return {'events_completed': count}
+
+    def read_sensor(self, sensor_iop):
+        self.sensor_reads += 1
+        return 25.0
+
+
+class FakeClient:
+    """The subset of `MQTT_Client_PL` used by the scheduler."""
+    local_mac_int = 0x000a35000102
+    local_ip_int = 0xc0a80163
+    server_ip_int = 0xc0a80363
+    server_port = 1884
+    verbose = 0
+
+    def __init__(self):
+        self.accel = FakeAccelerator()
+        self.published = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def publish_sw(self, topic_id, message, qos):
+        self.gate.wait()
+        if message == 'fail':
+            raise RuntimeError("send failed")
+        self.published.append((topic_id, message, qos))
+        return True
+
+
+def settled_stats(scheduler, path):
+    # the backlog of a request is updated after its future is done
+    for _ in range(200):
+        stats = scheduler.stats()[path]
+        if stats['backlog'] == 0:
+            return stats
+        time.sleep(0.01)
+    return stats
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def scheduler(client):
+    scheduler = PublishScheduler(client, 'net', 'sensor', hw_min_count=16,
+                                 hw_rate=1000.0, sw_rate=50.0)
+    yield scheduler
+    client.gate.set()
+    client.accel.release.set()
+    scheduler.shutdown()
+
+
+def test_route(scheduler, client):
+    assert scheduler.route(15) == SOFTWARE
+    assert scheduler.route(16) == HARDWARE
+    client.accel.arbiter.owner = ACCELERATOR
+    assert scheduler.route(100) == HARDWARE
+    client.accel.arbiter.owner = 'software'
+    assert scheduler.route(100) == SOFTWARE
+
+
+def test_route_follows_backlog(scheduler, client):
+    accel = client.accel
+    future = scheduler.publish_sensor(7, 1000, qos=1)
+    assert accel.started.wait(2.0)
+    assert accel.runs[0][:2] == (100, 1000)
+    assert accel.runs[0][-5:] == (7, 1, 0, 'net', 'sensor')
+    assert scheduler.stats()[HARDWARE]['backlog'] == 1000
+    # 1020 events queued at 1000/s finish later than 20 events at 50/s
+    assert scheduler.route(1000) == HARDWARE
+    assert scheduler.route(20) == SOFTWARE
+    accel.release.set()
+    assert future.result(2.0) == {'events_completed': 1000}
+    stats = settled_stats(scheduler, HARDWARE)
+    assert stats['backlog'] == 0
+    assert stats['requests'] == 1 and stats['events'] == 1000
+
+
+def test_software_paths(scheduler, client):
+    assert scheduler.publish(3, 'hello', qos=1).result(2.0) is True
+    assert scheduler.publish_sensor(4, 5).result(2.0) == 5
+    assert client.accel.runs == []
+    assert client.accel.sensor_reads == 5
+    assert client.published == [(3, 'hello', 1)] + [(4, '25.0', 0)] * 5
+    stats = settled_stats(scheduler, SOFTWARE)
+    assert stats['requests'] == 2 and stats['events'] == 6
+    assert stats['backlog'] == 0
+
+
+def test_software_backlog_and_cancel(scheduler, client):
+    client.gate.clear()
+    first = scheduler.publish(1, 'first')
+    second = scheduler.publish_sensor(1, 10)
+    assert scheduler.stats()[SOFTWARE]['backlog'] == 11
+    assert second.cancel()
+    client.gate.set()
+    first.result(2.0)
+    failed = scheduler.publish(1, 'fail')
+    with pytest.raises(RuntimeError):
+        failed.result(2.0)
+    stats = settled_stats(scheduler, SOFTWARE)
+    assert stats['backlog'] == 0
+    assert stats['requests'] == 1
+    assert stats['cancelled'] == 1 and stats['failed'] == 1
+
+
+def test_hardware_cancel(scheduler, client):
+    future = scheduler.publish_sensor(7, 100)
+    assert client.accel.started.wait(2.0)
+    assert scheduler.jobs.cancel(future)
+    with pytest.raises(CancelledError):
+        future.result(2.0)
+    stats = settled_stats(scheduler, HARDWARE)
+    assert stats['cancelled'] == 1 and stats['requests'] == 0
+    assert stats['backlog'] == 0
+
+
+def test_rate_moving_average():
+    stats = _PathStats(100.0, history=2)
+    stats.record(50, 0.2, 0.1, 0.2)
+    assert stats.rate == pytest.approx(100.0 + 0.2 * (500.0 - 100.0))
+    stats.record(0, 0.2, 0.1, 0.2)
+    stats.record(50, 0.2, 0.0, 0.2)
+    assert stats.rate == pytest.approx(180.0)
+    snapshot = stats.snapshot()
+    assert snapshot['requests'] == 3 and snapshot['events'] == 100
+    assert snapshot['events_per_second'] == pytest.approx(180.0)
+    assert snapshot['latency_p50'] == pytest.approx(0.2)
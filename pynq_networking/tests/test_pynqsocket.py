@@ -0,0 +1,95 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+pytest.importorskip('pynq')
+pytest.importorskip('kamene')
+from .fakes import deliver
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+@pytest.fixture
+def socket_class(slurper, monkeypatch):
+    from pynq_networking.lib.pynqsocket import L2PynqSocket
+    monkeypatch.setattr(L2PynqSocket, '_slurper', slurper)
+    monkeypatch.setattr(L2PynqSocket, '_draining', None)
+    return L2PynqSocket
+
+
+def test_pool_allocated_on_drain(socket_class):
+    sockets = [socket_class() for _ in range(10)]
+    assert all(socket.pool is None for socket in sockets)
+    socket = sockets[0]
+    socket.start_drain()
+    try:
+        assert socket.pool is not None
+        assert socket.pool.size == socket.slurper.rx_size
+    finally:
+        socket.close()
+
+
+def test_single_drain(socket_class):
+    first = socket_class()
+    second = socket_class()
+    first.start_drain()
+    try:
+        first.start_drain()
+        with pytest.raises(RuntimeError):
+            second.start_drain()
+    finally:
+        first.close()
+    second.start_drain()
+    second.close()
+
+
+def test_drain_receives(socket_class, slurper):
+    socket = socket_class()
+    socket.start_drain()
+    try:
+        deliver(slurper, b'\x05' * 64)
+        item = socket.recv_buffer(timeout=2.0)
+        assert item is not None
+        buffer, length = item
+        assert bytes(buffer[:length]) == b'\x05' * 64
+        socket.release(buffer)
+    finally:
+        socket.close()
+
+
+def test_recv_into_without_drain(socket_class, slurper):
+    socket = socket_class()
+    deliver(slurper, b'\x06' * 60)
+    buffer = bytearray(100)
+    assert socket.recv_into(buffer, timeout=1.0) == 60
+    assert socket.pool is None
+    assert buffer[:60] == b'\x06' * 60
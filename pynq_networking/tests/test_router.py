@@ -0,0 +1,144 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import types
+import pytest
+from pynq_networking.lib.router import TopicRouter, ShardedClient
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+TOPICS = ['sensor/{}'.format(i) for i in range(1000)]
+NODES = [(1883 + 2 * i, 1884 + 2 * i) for i in range(4)]
+
+
+def routes(router):
+    return {topic: router.route(topic) for topic in TOPICS}
+
+
+def test_spread():
+    owners = list(routes(TopicRouter(NODES)).values())
+    assert all(150 < owners.count(node) < 350 for node in NODES)
+
+
+def test_order_independent():
+    assert routes(TopicRouter(NODES)) == routes(TopicRouter(NODES[::-1]))
+
+
+def test_remove_moves_own_topics_only():
+    router = TopicRouter(NODES)
+    before = routes(router)
+    router.remove_node(NODES[1])
+    assert router.nodes == [NODES[0], NODES[2], NODES[3]]
+    after = routes(router)
+    assert NODES[1] not in after.values()
+    assert all(after[topic] == node for topic, node in before.items()
+               if node != NODES[1])
+
+
+def test_add_moves_to_new_node_only():
+    router = TopicRouter(NODES[:3])
+    before = routes(router)
+    router.add_node(NODES[3])
+    after = routes(router)
+    moved = [topic for topic in TOPICS if before[topic] != after[topic]]
+    assert all(after[topic] == NODES[3] for topic in moved)
+    assert 150 < len(moved) < 350
+
+
+def test_readd_keeps_topics():
+    router = TopicRouter(NODES)
+    before = routes(router)
+    router.remove_node(NODES[0])
+    router.remove_node(NODES[2])
+    router.add_node(NODES[2])
+    router.add_node(NODES[0])
+    assert routes(router) == before
+    assert len(router._keys) == len(NODES) * router.replicas
+
+
+def test_duplicate_and_empty():
+    router = TopicRouter(NODES[:1])
+    with pytest.raises(ValueError):
+        router.add_node(NODES[0])
+    router.remove_node(NODES[0])
+    with pytest.raises(ValueError):
+        router.route('sensor/0')
+
+
+class FakeClient:
+    def __init__(self, server_ip, server_port):
+        self.server_ip = server_ip
+        self.server_port = server_port
+        self.registered = []
+        self.published = []
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def register(self, topic):
+        self.registered.append(topic)
+        return len(self.registered)
+
+    def publish_sw(self, topic_id, message, qos=1):
+        self.published.append((topic_id, message, qos))
+        return True
+
+
+def test_sharded_client_routing():
+    clients = [FakeClient('192.168.3.99', 1884 + 2 * i) for i in range(3)]
+    sharded = ShardedClient(clients)
+    again = ShardedClient([FakeClient('192.168.3.99', 1884 + 2 * i)
+                           for i in reversed(range(3))])
+    for topic in TOPICS[:50]:
+        assert sharded.client(topic).server_port == \
+            again.client(topic).server_port
+    owner = sharded.client('sensor/7')
+    assert sharded.publish('sensor/7', b'a')
+    assert sharded.publish('sensor/7', b'b', qos=0)
+    assert owner.registered == ['sensor/7']
+    topic_id = owner.registered.index('sensor/7') + 1
+    assert owner.published == [(topic_id, b'a', 1), (topic_id, b'b', 0)]
+    assert sum(len(client.published) for client in clients) == 2
+
+
+def test_sharded_client_plain_publish():
+    published = []
+    client = types.SimpleNamespace(
+        serverIP='192.168.3.99', serverPort=1884,
+        register=lambda topic: 3,
+        publish=lambda *args: published.append(args) or True)
+    sharded = ShardedClient([client])
+    assert sharded.publish('sensor/1', b'x')
+    assert published == [(3, b'x', 1)]
@@ -0,0 +1,152 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import itertools
+import struct
+import time
+import numpy as np
+import pytest
+from pynq_networking.lib.sampling import BatchPublisher, SensorSampler
+from pynq_networking.lib.sampling import encode_block
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+class FakeClient:
+    def __init__(self, result=True):
+        self.result = result
+        self.published = []
+
+    def publish_sw(self, topic, message, qos=1):
+        self.published.append((topic, message, qos))
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def counter():
+    return itertools.count(1).__next__
+
+
+def test_encode_block():
+    block = np.array([[10.5, 1.0], [11.5, 2.0], [12.5, 3.0]])
+    message = encode_block(block)
+    assert len(message) == 8 + 3 * 4
+    assert struct.unpack('<d3f', message) == (10.5, 1.0, 2.0, 3.0)
+
+
+def test_publisher():
+    client = FakeClient()
+    publisher = BatchPublisher(client, qos=1, encode=lambda block: b'x')
+    publisher.start()
+    assert publisher.submit(5, np.zeros((2, 2)))
+    publisher.stop()
+    assert client.published == [(5, b'x', 1)]
+    assert publisher.stats == {'published': 1, 'failed': 0, 'dropped': 0}
+
+
+@pytest.mark.parametrize('result', [False, OSError("no route")])
+def test_publisher_failures(result):
+    publisher = BatchPublisher(FakeClient(result), encode=lambda block: b'x')
+    publisher.start()
+    publisher.submit(5, np.zeros((2, 2)))
+    publisher.submit(5, np.zeros((2, 2)))
+    publisher.flush()
+    assert publisher.stats['failed'] == 2
+    publisher.stop()
+
+
+def test_publisher_drops_when_full():
+    publisher = BatchPublisher(FakeClient(), max_pending=2)
+    assert [publisher.submit(5, np.zeros((2, 2))) for _ in range(3)] == \
+        [True, True, False]
+    assert publisher.stats['dropped'] == 1
+
+
+def test_ring_wraparound():
+    sampler = SensorSampler(block_size=2, capacity=5)
+    sampler.add_sensor('counter', counter(), rate=10)
+    for _ in range(3):
+        sampler.sample('counter')
+    assert sampler.samples('counter')[:, 1].tolist() == [1, 2, 3]
+    for _ in range(4):
+        sampler.sample('counter')
+    data = sampler.samples('counter')
+    assert data[:, 1].tolist() == [3, 4, 5, 6, 7]
+    assert (np.diff(data[:, 0]) >= 0).all()
+
+
+def test_blocks_across_wraparound():
+    publisher = BatchPublisher(FakeClient())
+    sampler = SensorSampler(publisher, block_size=3, capacity=5)
+    sampler.add_sensor('counter', counter(), rate=10, topic=7)
+    sampler.add_sensor('quiet', counter(), rate=10)
+    for _ in range(9):
+        sampler.sample('counter')
+        sampler.sample('quiet')
+    blocks = []
+    while not publisher._queue.empty():
+        topic, block = publisher._queue.get_nowait()
+        blocks.append((topic, block[:, 1].tolist()))
+    assert blocks == [(7, [1, 2, 3]), (7, [4, 5, 6]), (7, [7, 8, 9])]
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        SensorSampler(block_size=10, capacity=5)
+    sampler = SensorSampler()
+    with pytest.raises(ValueError):
+        sampler.add_sensor('counter', counter(), rate=0)
+
+
+def test_sensor_errors_keep_sampling():
+    calls = itertools.count()
+
+    def flaky():
+        if next(calls) % 2:
+            raise OSError("I2C timeout")
+        return 1.0
+
+    sampler = SensorSampler(block_size=1, capacity=64)
+    sampler.add_sensor('flaky', flaky, rate=500)
+    sampler.add_sensor('steady', counter(), rate=500)
+    sampler.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while sampler.errors('flaky') < 5:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert sampler._thread.is_alive()
+    finally:
+        sampler.stop()
+    assert len(sampler.samples('flaky')) >= 5
+    assert len(sampler.samples('steady')) >= 10
+    assert sampler.errors('steady') == 0
@@ -0,0 +1,131 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+from pynq_networking.lib import segmentation
+from pynq_networking.lib.segmentation import Reassembler, SegmentingPublisher
+from pynq_networking.lib.segmentation import segment_message, SEGMENT_HEADER
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+PAYLOAD = bytes(range(256)) * 20
+
+
+def test_segment_sizes():
+    segments = segment_message(PAYLOAD, 3, max_segment=1000)
+    assert len(segments) == 6
+    assert all(len(segment) <= 1000 for segment in segments)
+    assert [SEGMENT_HEADER.unpack_from(segment) for segment in segments] == \
+        [(3, index, 6) for index in range(6)]
+    assert segment_message(b'', 3)[0] == SEGMENT_HEADER.pack(3, 0, 1)
+    with pytest.raises(ValueError):
+        segment_message(PAYLOAD, 3, max_segment=SEGMENT_HEADER.size)
+
+
+def test_in_order():
+    reassembler = Reassembler()
+    segments = segment_message(PAYLOAD, 1, max_segment=1000)
+    results = [reassembler.feed(5, segment) for segment in segments]
+    assert results[:-1] == [None] * 5
+    assert results[-1] == PAYLOAD
+    assert reassembler.stats == {'completed': 1, 'segments': 6,
+                                 'expired': 0}
+
+
+def test_out_of_order():
+    reassembler = Reassembler()
+    segments = segment_message(PAYLOAD, 1, max_segment=1000)
+    order = [3, 0, 5, 1, 4]
+    assert [reassembler.feed(5, segments[i]) for i in order] == [None] * 5
+    assert reassembler.feed(5, segments[2]) == PAYLOAD
+
+
+def test_duplicates():
+    reassembler = Reassembler()
+    segments = segment_message(PAYLOAD, 1, max_segment=1000)
+    for segment in segments[:-1]:
+        assert reassembler.feed(5, segment) is None
+        assert reassembler.feed(5, segment) is None
+    assert reassembler.feed(5, segments[-1]) == PAYLOAD
+    assert reassembler.stats['completed'] == 1
+    assert reassembler.stats['segments'] == 11
+
+
+def test_interleaved_messages():
+    reassembler = Reassembler()
+    first = segment_message(PAYLOAD, 1, max_segment=1000)
+    second = segment_message(PAYLOAD[::-1], 2, max_segment=1000)
+    other_topic = segment_message(PAYLOAD[:1500], 1, max_segment=1000)
+    results = []
+    for a, b, c in zip(first, second, other_topic + [None] * 4):
+        results.append(reassembler.feed(5, a))
+        results.append(reassembler.feed(5, b))
+        if c is not None:
+            results.append(reassembler.feed(6, c))
+    assert [r for r in results if r is not None] == \
+        [PAYLOAD[:1500], PAYLOAD, PAYLOAD[::-1]]
+
+
+def test_expired(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(segmentation.time, 'monotonic', lambda: now[0])
+    reassembler = Reassembler(timeout=1.0, max_pending=2)
+    segments = segment_message(PAYLOAD, 1, max_segment=1000)
+    reassembler.feed(5, segments[0])
+    now[0] += 2.0
+    reassembler.feed(5, segment_message(PAYLOAD, 2, max_segment=1000)[0])
+    assert reassembler.stats['expired'] == 1
+    assert all(reassembler.feed(5, segment) is None
+               for segment in segments[1:])
+
+
+def test_invalid_segments():
+    reassembler = Reassembler()
+    with pytest.raises(ValueError):
+        reassembler.feed(5, b'\x00')
+    with pytest.raises(ValueError):
+        reassembler.feed(5, SEGMENT_HEADER.pack(1, 2, 2))
+    reassembler.feed(5, SEGMENT_HEADER.pack(1, 0, 3))
+    with pytest.raises(ValueError):
+        reassembler.feed(5, SEGMENT_HEADER.pack(1, 1, 2))
+
+
+def test_publisher_round_trip():
+    published = []
+    client = type('Client', (), {'publish': lambda self, topic, message,
+                                 qos=1: published.append(message) or True})()
+    publisher = SegmentingPublisher(client, max_segment=1000)
+    assert publisher.publish(5, PAYLOAD)
+    assert publisher.publish(5, b'short')
+    reassembler = Reassembler()
+    results = [reassembler.feed(5, message) for message in published]
+    assert [r for r in results if r is not None] == [PAYLOAD, b'short']
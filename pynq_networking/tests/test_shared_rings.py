@@ -0,0 +1,135 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import multiprocessing
+import os
+import time
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib.arbiter import ACCELERATOR, ProcessLock
+from pynq_networking.lib.shared_rings import FrameRing, IOOwner, RingSocket
+from pynq_networking.lib.shared_rings import lock_path, share_network_iop
+from pynq_networking.lib.slurper import TX_MTU
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+fork_only = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork',
+    reason="the fake network IOP is only shared with forked processes")
+
+
+@pytest.fixture
+def name():
+    name = 'pynq_test_{}'.format(os.getpid())
+    yield name
+    if os.path.exists(lock_path(name)):
+        os.remove(lock_path(name))
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_ring(name):
+    ring = FrameRing(name + '_ring', slots=4, slot_size=64, create=True)
+    try:
+        for lap in range(3):
+            for i in range(4):
+                assert ring.put([bytes([lap]), bytes([i]) * 10])
+            assert not ring.put(b'full')
+            assert len(ring) == 4
+            for i in range(4):
+                assert ring.get() == bytes([lap]) + bytes([i]) * 10
+            assert ring.get() is None
+        assert ring.dropped == 3
+        with pytest.raises(ValueError):
+            ring.put(b'\x00' * 61)
+    finally:
+        ring.close()
+
+
+def hold_lock(path, held, done):
+    lock = ProcessLock(path)
+    lock.acquire()
+    held.set()
+    done.wait(5.0)
+    lock.close()
+
+
+def test_process_lock_queues_frames(name, slurper, mac):
+    held = multiprocessing.Event()
+    done = multiprocessing.Event()
+    holder = multiprocessing.Process(target=hold_lock,
+                                     args=(lock_path(name), held, done))
+    holder.start()
+    try:
+        assert held.wait(5.0)
+        arbiter = share_network_iop(name)
+        assert not arbiter.send(b'\x01' * 60)
+        assert not arbiter.flush(0.05)
+        with pytest.raises(TimeoutError):
+            arbiter.acquire(ACCELERATOR, timeout=0.05)
+        assert arbiter.owner is None
+        assert mac.frames == []
+    finally:
+        done.set()
+        holder.join()
+    assert arbiter.flush(1.0)
+    assert wait_for(lambda: mac.frames == [b'\x01' * 60])
+    arbiter.process_lock.close()
+
+
+@fork_only
+def test_owner_follows_process_lock(name, slurper, mac):
+    with IOOwner(name, producers=1, consumers=0) as owner:
+        with RingSocket(name, producer=0) as socket:
+            assert socket.send(b'\x02' * 60, timeout=1.0)
+            assert wait_for(lambda: len(mac.frames) == 1)
+
+            arbiter = share_network_iop(name)
+            with arbiter.owned(ACCELERATOR):
+                assert socket.send(b'\x03' * 60, timeout=1.0)
+                time.sleep(0.1)
+                assert len(mac.frames) == 1
+            assert wait_for(lambda: len(mac.frames) == 2)
+            assert mac.frames[1] == b'\x03' * 60
+
+            with pytest.raises(ValueError):
+                socket.send(b'\x00' * (TX_MTU + 1))
+        assert owner.stats()[name + '_tx0']['dropped'] == 0
+    arbiter.process_lock.close()
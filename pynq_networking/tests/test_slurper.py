@@ -0,0 +1,84 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib.arbiter import ACCELERATOR, get_arbiter
+from pynq_networking.lib.slurper import TX_MTU
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def test_send(slurper, mac):
+    assert slurper.send([b'\x01' * 14, b'payload'])
+    assert slurper.wait_tx(1.0)
+    assert mac.frames == [b'\x01' * 14 + b'payload']
+
+
+def test_send_async_follows_arbiter(slurper, mac):
+    arbiter = get_arbiter()
+    slurper.start_writer()
+    with arbiter.owned(ACCELERATOR):
+        for i in range(3):
+            assert slurper.send_async(bytes([i]) * 60)
+        slurper._tx_queue.join()
+        assert mac.frames == []
+        assert len(arbiter.pending) == 3
+    slurper.stop_writer()
+    assert slurper.wait_tx(1.0)
+    assert mac.frames == [bytes([i]) * 60 for i in range(3)]
+    assert arbiter.stats['queued'] == 3
+
+
+def test_send_async_free_window(slurper, mac):
+    slurper.start_writer()
+    assert slurper.send_async(b'\xaa' * 60)
+    slurper.stop_writer()
+    assert slurper.wait_tx(1.0)
+    assert mac.frames == [b'\xaa' * 60]
+    assert get_arbiter().stats['sent'] == 1
+
+
+def test_mtu(slurper, mac):
+    assert slurper.send(b'\x00' * TX_MTU)
+    assert slurper.wait_tx(1.0)
+    with pytest.raises(ValueError):
+        slurper.send([b'\x00' * 14, b'\x00' * (TX_MTU - 13)])
+    assert [len(frame) for frame in mac.frames] == [TX_MTU]
+
+
+def test_mtu_checked_before_queueing(slurper, mac):
+    arbiter = get_arbiter()
+    with arbiter.owned(ACCELERATOR):
+        with pytest.raises(ValueError):
+            arbiter.send(b'\x00' * (TX_MTU + 1))
+        assert not arbiter.pending
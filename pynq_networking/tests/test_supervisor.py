@@ -0,0 +1,153 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pynq_networking.lib import supervisor
+from pynq_networking.lib.supervisor import BrokerProcess, udp_port_bound
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+def runs(log):
+    with open(log) as f:
+        return f.read().count('run')
+
+
+def test_restart_budget_spent(tmp_path):
+    log = str(tmp_path / 'broker.log')
+    broker = BrokerProcess(['sh', '-c', 'echo run; sleep 0.02'], log,
+                           max_restarts=2, backoff=0.01, stable_time=10.0)
+    broker.start()
+    time.sleep(0.5)
+    broker.stop()
+    assert runs(log) == 3
+    assert broker.restarts == 2
+
+
+def test_restart_budget_reset_after_stable_run(tmp_path):
+    log = str(tmp_path / 'broker.log')
+    broker = BrokerProcess(['sh', '-c', 'echo run; sleep 0.05'], log,
+                           max_restarts=1, backoff=0.01, stable_time=0.02)
+    broker.start()
+    time.sleep(0.5)
+    broker.stop()
+    assert runs(log) > 2
+    assert broker.restarts <= 1
+
+
+# binds the UDP port and exits on the first run, never binds it afterwards
+FLAKY_BROKER = """
+import os, socket, sys, time
+marker, port = sys.argv[1], int(sys.argv[2])
+print('run', flush=True)
+if not os.path.exists(marker):
+    open(marker, 'w').close()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', port))
+    time.sleep(0.2)
+    sys.exit(1)
+time.sleep(30)
+"""
+
+
+def free_udp_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_udp_port_bound_by_process():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        other = subprocess.Popen(['sleep', '10'])
+        try:
+            assert udp_port_bound(port)
+            assert udp_port_bound(port, os.getpid())
+            assert not udp_port_bound(port, other.pid)
+        finally:
+            other.kill()
+            other.wait()
+    assert not udp_port_bound(port)
+
+
+def test_udp_port_bound_without_proc(monkeypatch):
+    def no_table(*args, **kwargs):
+        raise OSError("no /proc")
+
+    monkeypatch.setattr(supervisor, 'open', no_table, raising=False)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('', 0))
+        port = sock.getsockname()[1]
+        assert udp_port_bound(port)
+    assert not udp_port_bound(port)
+
+
+def test_restart_checks_readiness(tmp_path):
+    log = str(tmp_path / 'broker.log')
+    command = [sys.executable, '-c', FLAKY_BROKER, str(tmp_path / 'marker'),
+               str(free_udp_port())]
+    broker = BrokerProcess(command, log, mqttsn_port=int(command[-1]),
+                           max_restarts=2, backoff=0.01, stable_time=10.0)
+    broker.start(timeout=2.0)
+    broker.timeout = 0.3
+    deadline = time.monotonic() + 5.0
+    while runs(log) < 3 or broker.running:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    broker.stop()
+    assert runs(log) == 3
+    assert broker.restarts == 2
+
+
+def test_pinned_after_spawn(tmp_path):
+    cpu = min(os.sched_getaffinity(0))
+    broker = BrokerProcess(['sleep', '10'], str(tmp_path / 'broker.log'),
+                           cpu=cpu)
+    broker.start()
+    try:
+        assert os.sched_getaffinity(broker.pid) == {cpu}
+    finally:
+        broker.stop()
+
+
+def test_stopped_at_exit(tmp_path):
+    broker = BrokerProcess(['sleep', '10'], str(tmp_path / 'broker.log'))
+    broker.start()
+    process = broker._process
+    supervisor._stop_all()
+    assert process.poll() is not None
+    assert not broker.running
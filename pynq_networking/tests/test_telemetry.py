@@ -0,0 +1,151 @@
+#   Copyright (c) 2026, Xilinx, Inc.
+#   All rights reserved.
+#
+#   Redistribution and use in source and binary forms, with or without
+#   modification, are permitted provided that the following conditions are met:
+#
+#   1.  Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#
+#   2.  Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+#   3.  Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#   THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#   PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#   CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#   EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#   PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+#   OR BUSINESS INTERRUPTION). HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+#   WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+#   OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+#   ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import itertools
+import time
+import pytest
+pytest.importorskip('pynq')
+from pynq_networking.lib import telemetry
+from pynq_networking.lib.accelerator_registers import COUNTER_REGISTERS
+from pynq_networking.lib.telemetry import AcceleratorTelemetry, COUNTERS
+
+
+__author__ = "Xilinx networking group"
+__copyright__ = "Copyright 2026, Xilinx"
+
+
+class CounterRegisters:
+    """Counter registers whose valid bits are cleared when read."""
+    def __init__(self):
+        self.values = {offset: 0 for offset in COUNTER_REGISTERS.values()}
+        self.valid = set()
+
+    def update(self, **counters):
+        for name, value in counters.items():
+            offset = COUNTER_REGISTERS[name]
+            self.values[offset] = value
+            self.valid.add(offset)
+
+    def read(self, offset):
+        if offset in self.values:
+            return self.values[offset]
+        valid = offset - 4 in self.valid
+        self.valid.discard(offset - 4)
+        return int(valid)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Make the telemetry clock return the value set by the test."""
+    now = [0.0]
+    monkeypatch.setattr(telemetry, 'time', type('Time', (), {
+        'monotonic': staticmethod(lambda: now[0])}))
+    return now
+
+
+def test_valid_bits():
+    registers = CounterRegisters()
+    sampler = AcceleratorTelemetry(registers)
+    registers.update(events_completed=5, publishes_sent=4)
+    assert sampler.read_counters() == {'events_completed': 5,
+                                       'publishes_sent': 4,
+                                       'packets_received': 0,
+                                       'packets_sent': 0}
+    assert not registers.valid
+    # an update in progress: the data changed, the valid bit is not set
+    registers.values[COUNTER_REGISTERS['events_completed']] = 123
+    assert sampler.read_counters()['events_completed'] == 5
+    registers.update(events_completed=6)
+    assert sampler.read_counters()['events_completed'] == 6
+
+
+def test_ring_wraparound(clock):
+    registers = CounterRegisters()
+    sampler = AcceleratorTelemetry(registers, capacity=3)
+    for i in range(5):
+        clock[0] = float(i)
+        registers.update(events_completed=i)
+        sampler.sample()
+    assert len(sampler) == 3
+    data = sampler.samples()
+    assert data[:, 0].tolist() == [2.0, 3.0, 4.0]
+    assert data[:, 1 + COUNTERS.index('events_completed')].tolist() == \
+        [2, 3, 4]
+
+
+def test_rates(clock):
+    registers = CounterRegisters()
+    sampler = AcceleratorTelemetry(registers, capacity=8)
+    assert sampler.rates() == {name: 0.0 for name in COUNTERS}
+    for i in range(5):
+        clock[0] = i * 0.5
+        registers.update(publishes_sent=100 * i, packets_sent=10 * i)
+        sampler.sample()
+    rates = sampler.rates()
+    assert rates['publishes_sent'] == pytest.approx(200.0)
+    assert rates['packets_sent'] == pytest.approx(20.0)
+    assert rates['events_completed'] == 0.0
+    assert sampler.rates(window=2)['publishes_sent'] == pytest.approx(200.0)
+
+
+def test_rates_across_reset_and_wraparound(clock):
+    registers = CounterRegisters()
+    sampler = AcceleratorTelemetry(registers, capacity=4)
+    values = [0, 100, 200, 300, 50, 150]
+    for i, value in enumerate(values):
+        clock[0] = float(i)
+        registers.update(publishes_sent=value)
+        sampler.sample()
+    # samples 200, 300, 50, 150: the counter restarted from 0 before 50
+    assert sampler.rates()['publishes_sent'] == pytest.approx(
+        (100 + 50 + 100) / 3.0)
+
+
+def test_background_sampling():
+    registers = CounterRegisters()
+    sampler = AcceleratorTelemetry(registers, rate=500.0)
+    sampler.start()
+    try:
+        for i in itertools.count():
+            registers.update(events_completed=i)
+            if len(sampler) >= 10:
+                break
+            time.sleep(0.002)
+    finally:
+        sampler.stop()
+    count = len(sampler)
+    time.sleep(0.02)
+    assert len(sampler) == count
+    timestamps = sampler.samples()[:, 0]
+    assert (timestamps[1:] > timestamps[:-1]).all()
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        AcceleratorTelemetry(CounterRegisters(), rate=0)
@@ -167,6 +167,11 @@ def package_files(directory):
 
 
 pynq_package_files.extend(package_files('pynq_networking'))
+# The API-mode CFFI module links against lib_mqttsn.so of the board overlay
+if board is None:
+    cffi_modules = []
+else:
+    cffi_modules = ['pynq_networking/lib/build_mqttsn_ffi.py:ffibuilder']
 setup(name='pynq_networking',
       version='2.4',
       description='PYNQ networking package',
@@ -174,16 +179,21 @@ setup(name='pynq_networking',
       author_email='stephenn@xilinx.com',
       url='https://github.com/Xilinx/PYNQ-Networking',
       packages=find_packages(),
+      python_requires='>=3.6',
       download_url='https://github.com/Xilinx/PYNQ-Networking',
       package_data={
           '': pynq_package_files,
       },
+      setup_requires=['cffi>=1.0.0'],
+      cffi_modules=cffi_modules,
       install_requires=[
+          'cffi>=1.0.0',
           'kamene',
           'wurlitzer',
           'pytest-runner',
           'paho-mqtt',
           'netifaces',
+          'numpy',
           'pynq>=2.4'
       ]
       )